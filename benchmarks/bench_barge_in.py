@@ -0,0 +1,152 @@
+"""Benchmark for `BargeInController` against the local mock server.
+
+Plays scripted responses through an `AudioPlayer` whose callback is pulled by a simulated
+device thread, at the pace of a real device with `--frames-per-buffer` frames per period.
+Each trial interrupts the response at a random point while it is still streaming, and
+reports:
+
+- the interruption latency, from `interrupt()` to the first silent device period
+- the truncation error, `audio_end_ms` minus the audio the device actually consumed
+- the round trip until the server confirms with `conversation.item.truncated`
+
+Interruptions are triggered right after a device period, which is the worst case: the
+latency is then close to one full period.
+
+Usage:
+    python benchmarks/bench_barge_in.py [--trials 20] [--rate 24000] [--frames-per-buffer 1024]
+"""
+
+import argparse
+import asyncio
+import base64
+import logging
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client import BargeInController, RealtimeClient
+from realtime_client.audio import AudioPlayer, PCMRingBuffer, Resampler
+from realtime_client.mock_server import (
+    SAMPLE_RATE,
+    MockRealtimeServer,
+    ResponseScript,
+)
+
+logging.getLogger("realtime_client").disabled = True
+
+
+class SimulatedDevice(threading.Thread):
+    """Pulls audio from a player's callback once per period, like PortAudio would."""
+
+    def __init__(self, player: AudioPlayer):
+        super().__init__(daemon=True)
+        self.player = player
+        self.period = player.frames_per_buffer / player.rate
+        self.silence = bytes(player.frames_per_buffer * player.frame_size)
+        self.stopped = threading.Event()
+        self.armed_at: float | None = None
+        self.silent_at: float | None = None
+
+    def run(self) -> None:
+        deadline = time.perf_counter()
+        while not self.stopped.is_set():
+            out, _ = self.player._callback(None, self.player.frames_per_buffer, None, 0)
+            if self.armed_at is not None and self.silent_at is None:
+                if out == self.silence:
+                    self.silent_at = time.perf_counter()
+            deadline += self.period
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+
+
+async def trial(client: RealtimeClient, args: argparse.Namespace) -> dict:
+    buffer = PCMRingBuffer(args.rate * 2 * 60)
+    player = AudioPlayer(
+        buffer, rate=args.rate, frames_per_buffer=args.frames_per_buffer
+    )
+    barge_in = BargeInController(client, player)
+    subscriptions = barge_in.attach()
+    resampler = Resampler(SAMPLE_RATE, args.rate)
+
+    def play(event: dict) -> None:
+        if barge_in.on_audio_delta(event):
+            buffer.write(resampler.process(base64.b64decode(event["delta"])))
+
+    subscriptions.append(client.on("response.audio.delta", play))
+    device = SimulatedDevice(player)
+    device.start()
+    try:
+        await client.response_create()
+        played_ms = random.uniform(200, 1500)
+        while player.frames_played * 1000 / args.rate < played_ms:
+            await asyncio.sleep(0.005)
+
+        truncated = asyncio.ensure_future(
+            client.wait_for("conversation.item.truncated", timeout=5)
+        )
+        done = asyncio.ensure_future(client.wait_for("response.done", timeout=5))
+        await asyncio.sleep(0)  # Register the waiters before anything is sent
+
+        device.armed_at = time.perf_counter()
+        audio_end_ms = await barge_in.interrupt()
+        consumed_ms = player.frames_played * 1000 / args.rate
+        truncated = await truncated
+        round_trip = time.perf_counter() - device.armed_at
+        while device.silent_at is None:
+            await asyncio.sleep(0.001)
+        await done
+    finally:
+        device.stopped.set()
+        device.join()
+        for subscription in subscriptions:
+            client.off(subscription.event_name, subscription)
+    return {
+        "latency_ms": (device.silent_at - device.armed_at) * 1000,
+        "error_ms": audio_end_ms - consumed_ms,
+        "round_trip_ms": round_trip * 1000,
+        "confirmed": truncated["audio_end_ms"] == audio_end_ms,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    # Streams faster than real time, so that every interruption cancels the response
+    script = ResponseScript(audio_ms=4000, audio_chunk_ms=40, deltas_per_second=50)
+    async with MockRealtimeServer(script=script) as server:
+        async with RealtimeClient(uri=server.uri, api_key="bench") as client:
+            results = [await trial(client, args) for _ in range(args.trials)]
+
+    period_ms = args.frames_per_buffer / args.rate * 1000
+    print(
+        f"{args.trials} interruptions, device period {period_ms:.1f} ms "
+        f"({args.frames_per_buffer} frames at {args.rate} Hz)"
+    )
+    for key, label in (
+        ("latency_ms", "interruption latency ms"),
+        ("error_ms", "truncation error ms"),
+        ("round_trip_ms", "truncation round trip ms"),
+    ):
+        values = [result[key] for result in results]
+        print(
+            f"{label:>25}: mean {statistics.mean(values):7.2f}  "
+            f"min {min(values):7.2f}  max {max(values):7.2f}"
+        )
+    confirmed = sum(result["confirmed"] for result in results)
+    print(f"{'confirmed by server':>25}: {confirmed}/{len(results)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--rate", type=int, default=24000)
+    parser.add_argument("--frames-per-buffer", type=int, default=1024)
+    args = parser.parse_args()
+    random.seed(0)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""End-to-end client benchmark against the local mock Realtime server.
+
+Starts `realtime_client.mock_server` in a separate process, so that the numbers only
+include client-side work, then requests a number of responses and reports:
+- time from `response.create` to `response.created` and to the first audio delta
+- delta throughput and decoded audio throughput of the client
+- client CPU time per delta
+
+Usage:
+    python benchmarks/bench_client.py [--responses 20] [--audio-ms 5000] [--rate 0]
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from websockets import connect
+
+from realtime_client import RealtimeClient
+
+
+async def wait_for_port(host: str, port: int, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with connect(f"ws://{host}:{port}"):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "realtime_client.mock_server",
+            "--port",
+            str(args.port),
+            "--audio-ms",
+            str(args.audio_ms),
+            "--audio-chunk-ms",
+            str(args.audio_chunk_ms),
+        ]
+        + (["--rate", str(args.rate)] if args.rate else []),
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        await wait_for_port("127.0.0.1", args.port)
+        async with RealtimeClient(
+            uri=f"ws://127.0.0.1:{args.port}", api_key="mock"
+        ) as client:
+            client.logger.logger.setLevel("WARNING")
+            deltas = 0
+            audio_bytes = 0
+            first_audio_at = None
+
+            def on_audio_delta(event: dict) -> None:
+                nonlocal deltas, audio_bytes, first_audio_at
+                if first_audio_at is None:
+                    first_audio_at = time.perf_counter()
+                deltas += 1
+                audio_bytes += len(base64.b64decode(event["delta"]))
+
+            def on_text_delta(event: dict) -> None:
+                nonlocal deltas
+                deltas += 1
+
+            client.on("response.audio.delta", on_audio_delta)
+            client.on("response.audio_transcript.delta", on_text_delta)
+
+            created_ms, first_audio_ms = [], []
+            start_wall, start_cpu = time.perf_counter(), time.process_time()
+            for _ in range(args.responses):
+                first_audio_at = None
+                done = asyncio.create_task(client.wait_for("response.done"))
+                sent_at = time.perf_counter()
+                await client.response_create()
+                await client.wait_for("response.created")
+                created_ms.append((time.perf_counter() - sent_at) * 1000)
+                await done
+                first_audio_ms.append((first_audio_at - sent_at) * 1000)
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"responses:              {args.responses}")
+    print(f"response.created:       median {statistics.median(created_ms):.2f} ms")
+    print(f"first audio delta:      median {statistics.median(first_audio_ms):.2f} ms")
+    print(f"deltas:                 {deltas} ({deltas / wall:.0f}/s)")
+    print(f"audio decoded:          {audio_bytes / wall / 1e6:.1f} MB/s")
+    print(f"client CPU per delta:   {cpu / deltas * 1e6:.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--responses", type=int, default=20)
+    parser.add_argument("--audio-ms", type=int, default=5000)
+    parser.add_argument("--audio-chunk-ms", type=int, default=40)
+    parser.add_argument(
+        "--rate", type=float, default=0, help="Deltas per second, 0 for unlimited"
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
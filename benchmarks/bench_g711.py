@@ -0,0 +1,84 @@
+"""Microbenchmark for the G.711 codecs in `realtime_client.audio.g711`.
+
+Encodes and decodes 8 kHz audio in chunks of `--chunk-ms`, as a telephony stream would,
+and reports the CPU time per chunk and the fraction of one core used by a single
+real-time stream. The first call of every codec, which builds its table, is excluded.
+The output is checked against the standard library `audioop` when it is available.
+
+Usage:
+    python benchmarks/bench_g711.py [--chunk-ms 20] [--seconds 60]
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client.audio import g711
+
+SAMPLE_RATE = 8000
+
+
+def reference_check(pcm: bytes) -> str:
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import audioop
+    except ImportError:
+        return "audioop not available, output not checked"
+    ulaw, alaw = audioop.lin2ulaw(pcm, 2), audioop.lin2alaw(pcm, 2)
+    matches = (
+        g711.ulaw_encode(pcm) == ulaw
+        and g711.alaw_encode(pcm) == alaw
+        and g711.ulaw_decode(ulaw) == audioop.ulaw2lin(ulaw, 2)
+        and g711.alaw_decode(alaw) == audioop.alaw2lin(alaw, 2)
+    )
+    return "output matches audioop" if matches else "OUTPUT DIFFERS FROM audioop"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-ms", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args()
+
+    every_sample = np.arange(65536, dtype=np.uint16).view(np.int16).astype("<i2")
+    print(reference_check(every_sample.tobytes()))
+
+    rng = np.random.default_rng(0)
+    samples = int(args.seconds * SAMPLE_RATE)
+    pcm = rng.normal(0, 4000, samples).clip(-32768, 32767).astype("<i2").tobytes()
+    chunk_bytes = SAMPLE_RATE * args.chunk_ms // 1000 * 2
+    chunks = [pcm[i : i + chunk_bytes] for i in range(0, len(pcm), chunk_bytes)]
+
+    print(
+        f"{args.seconds:.0f} s of audio in {len(chunks)} chunks of {args.chunk_ms} ms"
+    )
+    print(f"{'codec':>12} {'us/chunk':>9} {'core per stream':>16}")
+    for name, encode, decode in (
+        ("ulaw", g711.ulaw_encode, g711.ulaw_decode),
+        ("alaw", g711.alaw_encode, g711.alaw_decode),
+    ):
+        encoded = [encode(chunk) for chunk in chunks]
+        decode(encoded[0])
+        for label, function, inputs in (
+            (f"{name} encode", encode, chunks),
+            (f"{name} decode", decode, encoded),
+        ):
+            start = time.process_time()
+            for data in inputs:
+                function(data)
+            elapsed = time.process_time() - start
+            print(
+                f"{label:>12} {elapsed / len(inputs) * 1e6:>9.2f} "
+                f"{elapsed / args.seconds:>16.5%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark for the session journal against the local mock server.
+
+Records a session of `--responses` turns, each streaming one second of microphone audio
+and receiving a scripted audio response, then reports:
+
+- the journal size, compared with the same events stored as JSON lines
+- the recording cost per event on the event loop
+- the replay throughput as fast as possible, through a handler writing the audio to a
+  `PCMRingBuffer`
+- the timing accuracy of a replay at the original speed
+
+Usage:
+    python benchmarks/bench_journal.py [--responses 5] [--audio-ms 2000]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client import JournalRecorder, JournalReplayer, RealtimeClient
+from realtime_client.audio import PCMRingBuffer
+from realtime_client.mock_server import MockRealtimeServer, ResponseScript
+
+logging.getLogger("realtime_client").disabled = True
+
+CHUNK = base64.b64encode(bytes(4800)).decode()  # 100 ms of PCM16 at 24 kHz
+
+
+async def record(path: str, args: argparse.Namespace) -> None:
+    script = ResponseScript(audio_ms=args.audio_ms, deltas_per_second=50)
+    async with MockRealtimeServer(script=script) as server:
+        with JournalRecorder(path) as recorder:
+            async with RealtimeClient(
+                uri=server.uri, api_key="bench", recorder=recorder
+            ) as client:
+                for _ in range(args.responses):
+                    for _ in range(10):
+                        await client.input_audio_buffer_append(CHUNK)
+                        await asyncio.sleep(0.1)
+                    await client.input_audio_buffer_commit()
+                    done = asyncio.ensure_future(client.wait_for("response.done"))
+                    await asyncio.sleep(0)
+                    await client.response_create()
+                    await done
+
+
+def recording_cost(path: str) -> float:
+    """Seconds per event to record the journal's events again."""
+    with JournalReplayer(path) as replayer:
+        entries = [
+            (direction, json.dumps(event), event) for _, direction, event in replayer
+        ]
+    with tempfile.TemporaryDirectory() as directory:
+        with JournalRecorder(os.path.join(directory, "copy.rtj")) as recorder:
+            start = time.perf_counter()
+            for direction, message, event in entries:
+                if direction == "server":
+                    recorder.record_server(message, event)
+                else:
+                    recorder.record_client(event["type"], message)
+            elapsed = time.perf_counter() - start
+    return elapsed / len(entries)
+
+
+async def replay(path: str, speed: float | None) -> tuple[dict, int]:
+    client = RealtimeClient(api_key="offline")
+    buffer = PCMRingBuffer(24000 * 2 * 60)
+    client.on("response.audio.delta", lambda event: buffer.write_base64(event["delta"]))
+    with JournalReplayer(path) as replayer:
+        stats = await replayer.replay(client, speed=speed)
+    return stats, buffer.bytes_written
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "session.rtj")
+        await record(path, args)
+
+        with JournalReplayer(path) as replayer:
+            json_lines = sum(
+                len(json.dumps(event, separators=(",", ":"))) + 1
+                for _, _, event in replayer
+            )
+        size = os.path.getsize(path)
+        print(
+            f"journal: {size / 1024:.0f} KiB, JSON lines: {json_lines / 1024:.0f} KiB "
+            f"({size / json_lines:.0%})"
+        )
+        print(f"recording: {recording_cost(path) * 1e6:.1f} us/event")
+
+        stats, audio_bytes = await replay(path, None)
+        print(
+            f"replay as fast as possible: {stats['events']} events in "
+            f"{stats['duration'] * 1000:.0f} ms "
+            f"({stats['events'] / stats['duration']:.0f} events/s, "
+            f"{audio_bytes / 1024:.0f} KiB of audio)"
+        )
+        stats, _ = await replay(path, 1.0)
+        print(
+            f"replay at original speed: {stats['duration']:.2f} s, "
+            f"max lag {stats['max_lag'] * 1000:.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--responses", type=int, default=5)
+    parser.add_argument("--audio-ms", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Microbenchmark of `RealtimeClientLogger.log_event()` on the event loop thread.
+
+Measures the time spent by the caller per logged event, for an audio delta carrying 40 ms
+of base64 PCM16 and a small text delta, at every combination of verbosity and level.
+Output goes to /dev/null through the background writer thread, whose formatting and
+writing is not included.
+
+Usage:
+    python benchmarks/bench_logging.py [--events 20000]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client.utils.logger import get_logger
+
+EVENTS = {
+    "audio delta": {
+        "type": "response.audio.delta",
+        "event_id": "event_1",
+        "response_id": "resp_1",
+        "item_id": "item_1",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": base64.b64encode(bytes(1920)).decode(),
+    },
+    "text delta": {
+        "type": "response.text.delta",
+        "event_id": "event_2",
+        "response_id": "resp_1",
+        "item_id": "item_1",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": "Hello ",
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    for verbosity in (1, 2):
+        logger = get_logger(f"bench_logging_{verbosity}", verbosity)
+        for handler in logger.listener.handlers:
+            handler.setStream(devnull)
+        for level in ("WARNING", "DEBUG"):
+            logger.logger.setLevel(level)
+            for name, event in EVENTS.items():
+                seconds = timeit.timeit(
+                    lambda: logger.log_event(event, "server"), number=args.events
+                )
+                print(
+                    f"verbosity {verbosity}, level {level:>7}, {name:>11}: "
+                    f"{seconds / args.events * 1e6:6.2f} us/event"
+                )
+
+
+if __name__ == "__main__":
+    main()
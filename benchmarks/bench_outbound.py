@@ -0,0 +1,79 @@
+"""Microbenchmark for the outbound `input_audio_buffer.append` pipeline.
+
+Compares the serialization cost per frame of:
+- `legacy`: two `dump_json()` calls plus a `json.loads()`, as `send_event()` used to do
+- `model`: a single `dump_json()` of the pydantic event
+- `template`: splicing the payload into a frame template with `encode_audio_append()`
+
+Throughput is reported in payload bytes per second of CPU time, i.e. per core.
+
+Usage:
+    python benchmarks/bench_outbound.py [--chunk-ms 100] [--seconds 2]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client.events import InputAudioBufferAppend
+from realtime_client.outbound import encode_audio_append
+
+SAMPLE_RATE = 24000
+SAMPLE_WIDTH = 2
+
+
+def legacy(audio: str) -> str:
+    event = InputAudioBufferAppend(audio=audio)
+    json.loads(event.dump_json())
+    return event.dump_json()
+
+
+def model(audio: str) -> str:
+    return InputAudioBufferAppend(audio=audio).dump_json()
+
+
+def template(audio: str) -> str:
+    return encode_audio_append(audio)
+
+
+def run(encoder, audio: str, seconds: float) -> tuple[float, float]:
+    frames = 0
+    start = time.process_time()
+    while (elapsed := time.process_time() - start) < seconds:
+        for _ in range(16):
+            encoder(audio)
+        frames += 16
+    return frames / elapsed, frames * len(audio) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--chunk-ms", type=int, nargs="+", default=[20, 100, 1000, 10000]
+    )
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{'chunk':>8} {'pipeline':>9} {'frames/s':>12} {'MB/s/core':>10}")
+    for chunk_ms in args.chunk_ms:
+        pcm = os.urandom(SAMPLE_RATE * SAMPLE_WIDTH * chunk_ms // 1000)
+        audio = base64.b64encode(pcm).decode()
+        assert json.loads(template(audio)) == json.loads(model(audio))
+        for name, encoder in (
+            ("legacy", legacy),
+            ("model", model),
+            ("template", template),
+        ):
+            frames_per_sec, bytes_per_sec = run(encoder, audio, args.seconds)
+            print(
+                f"{chunk_ms:>6}ms {name:>9} {frames_per_sec:>12.0f} {bytes_per_sec / 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
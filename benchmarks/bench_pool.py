@@ -0,0 +1,117 @@
+"""How many concurrent voice sessions can one core sustain?
+
+Runs `--sessions` concurrent sessions from a `RealtimeClientPool` against the mock
+Realtime server, which runs in a separate process. Each session repeatedly streams one
+second of microphone audio in real time, commits it, and receives a real-time paced
+audio response into a `PCMRingBuffer`. The client process CPU usage is then used to
+estimate the number of sessions a single core can sustain.
+
+Usage:
+    python benchmarks/bench_pool.py [--sessions 50 100 200] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import base64
+import logging
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from websockets import connect
+
+from realtime_client import RealtimeClientPool
+from realtime_client.audio import PCMRingBuffer
+
+CHUNK = base64.b64encode(bytes(4800)).decode()  # 100 ms of PCM16 at 24 kHz
+
+
+async def wait_for_server(uri: str, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with connect(uri):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+def append_audio(event: dict, buffer: PCMRingBuffer) -> None:
+    buffer.write_base64(event["delta"])
+
+
+async def session(pool: RealtimeClientPool, stop_at: float, turns: list[int]) -> None:
+    async with pool.lease(reuse=True) as client:
+        buffer = PCMRingBuffer(24000 * 2 * 10)
+        client.on("response.audio.delta", append_audio, buffer)
+        while time.monotonic() < stop_at:
+            for _ in range(10):
+                await client.input_audio_buffer_append(CHUNK)
+                await asyncio.sleep(0.1)
+            await client.input_audio_buffer_commit()
+            done = asyncio.create_task(client.wait_for("response.done"))
+            await client.response_create()
+            await done
+            buffer.clear()
+            turns[0] += 1
+
+
+async def run(sessions: int, seconds: float, uri: str) -> None:
+    async with RealtimeClientPool(
+        max_sessions=sessions, uri=uri, api_key="mock"
+    ) as pool:
+        await pool.prewarm(sessions)
+        turns = [0]
+        start_wall, start_cpu = time.monotonic(), time.process_time()
+        await asyncio.gather(
+            *(session(pool, start_wall + seconds, turns) for _ in range(sessions))
+        )
+        wall = time.monotonic() - start_wall
+        cpu = time.process_time() - start_cpu
+        latency = pool.stats()["latency"]["time_to_first_audio"]
+
+    load = cpu / wall
+    print(
+        f"{sessions:>8} {turns[0]:>6} {load * 100:>7.1f}% "
+        f"{sessions / load if load else float('inf'):>14.0f} "
+        f"{latency['p50']:>9.1f} {latency['p99']:>9.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8798)
+    args = parser.parse_args()
+    # Per-event console logging would dominate the measurement
+    logging.getLogger("realtime_client").disabled = True
+
+    # 40 ms audio deltas paced in real time, with interleaved transcript deltas
+    server = subprocess.Popen(
+        [sys.executable, "-m", "realtime_client.mock_server"]
+        + ["--port", str(args.port), "--audio-ms", "2000", "--rate", "25"],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+    uri = f"ws://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_for_server(uri))
+        print(
+            f"{'sessions':>8} {'turns':>6} {'cpu':>8} {'sessions/core':>14} {'ttfa p50':>9} {'ttfa p99':>9}"
+        )
+        for sessions in args.sessions:
+            asyncio.run(run(sessions, args.seconds, uri))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
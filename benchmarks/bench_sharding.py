@@ -0,0 +1,136 @@
+"""Throughput of `ShardSupervisor` as the number of worker processes grows.
+
+Every session repeatedly requests a response from the mock Realtime server and waits for
+`response.done`, while the audio deltas are decoded into a `PCMRingBuffer` inside the
+worker. The mock server runs as `--servers` processes sharing one port, unpaced, so that the
+workers are the bottleneck. With enough cores for the workers and the servers, responses
+per second should grow almost linearly with the number of workers.
+
+Usage:
+    python benchmarks/bench_sharding.py [--workers 1 2 4] [--sessions-per-worker 20]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from websockets import connect
+
+from realtime_client import RealtimeClient
+from realtime_client.audio import PCMRingBuffer
+from realtime_client.sharding import ShardedSession, ShardSupervisor
+
+# Per-event console logging would dominate the measurement. This also runs in the workers,
+# which import this module to unpickle `setup_client`.
+logging.getLogger("realtime_client").disabled = True
+
+
+async def wait_for_server(uri: str, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with connect(uri):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+def setup_client(client: RealtimeClient) -> None:
+    """Runs in the worker: keep audio next to the websocket, off the IPC channel."""
+    buffer = PCMRingBuffer(24000 * 2 * 10)
+    client.on("response.audio.delta", lambda event: buffer.write_base64(event["delta"]))
+    client.on("response.done", lambda event: buffer.clear())
+
+
+async def session_loop(session: ShardedSession, stop_at: float, counts: list[int]):
+    while time.monotonic() < stop_at:
+        done = asyncio.create_task(session.wait_for("response.done"))
+        # Subscribe before the response starts, the first one could finish unseen
+        await asyncio.sleep(0)
+        await session.call("response_create")
+        await done
+        counts[0] += 1
+
+
+async def run(workers: int, args: argparse.Namespace, uri: str) -> float:
+    async with ShardSupervisor(
+        workers=workers,
+        max_sessions_per_worker=args.sessions_per_worker,
+        client_setup=setup_client,
+        uri=uri,
+        api_key="mock",
+    ) as supervisor:
+        sessions = await asyncio.gather(
+            *(
+                supervisor.open_session()
+                for _ in range(workers * args.sessions_per_worker)
+            )
+        )
+        counts = [0]
+        start = time.monotonic()
+        await asyncio.gather(
+            *(
+                session_loop(session, start + args.seconds, counts)
+                for session in sessions
+            )
+        )
+        elapsed = time.monotonic() - start
+    return counts[0] / elapsed
+
+
+def main() -> None:
+    cores = os.cpu_count()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, max(1, cores // 4), max(1, cores // 2)}),
+    )
+    parser.add_argument("--sessions-per-worker", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--servers", type=int, default=max(1, cores // 2))
+    parser.add_argument("--audio-ms", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    servers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "realtime_client.mock_server"]
+            + ["--port", str(args.port), "--audio-ms", str(args.audio_ms)]
+            + ["--reuse-port"],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+        )
+        for _ in range(args.servers)
+    ]
+    uri = f"ws://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_for_server(uri))
+        print(f"{cores} cores, {args.servers} mock server processes")
+        print(f"{'workers':>8} {'sessions':>9} {'responses/s':>12} {'scaling':>8}")
+        baseline = None
+        for workers in args.workers:
+            throughput = asyncio.run(run(workers, args, uri))
+            baseline = baseline or throughput / workers
+            print(
+                f"{workers:>8} {workers * args.sessions_per_worker:>9} "
+                f"{throughput:>12.1f} {throughput / baseline:>7.2f}x"
+            )
+    finally:
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark for the tool execution engine against the local mock server.
+
+Each turn, the mock server answers `response.create` with several function calls, whose
+arguments stream at `--deltas-per-second`: a short `delay` field, then a longer `reason`.
+The registered tools sleep for `delay` seconds, some in the event loop and some in the
+thread pool. The benchmark measures the turn, from `response.create` to the
+`response.created` of the follow-up response, in three modes:
+
+- sequential: `max_concurrency=1`, every call runs after the previous one
+- parallel: calls run concurrently, each starting once its arguments are done
+- speculative: the tools are idempotent and speculate on `delay`, so they start as soon
+  as it is parsed, while `reason` is still streaming
+
+Usage:
+    python benchmarks/bench_tools.py [--turns 10] [--delays 0.1 0.2 0.3]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client import RealtimeClient
+from realtime_client.mock_server import MockRealtimeServer, ResponseScript
+from realtime_client.models import ResponseConfig
+
+logging.getLogger("realtime_client").disabled = True
+
+PARAMETERS = {
+    "type": "object",
+    "properties": {"delay": {"type": "number"}, "reason": {"type": "string"}},
+    "required": ["delay", "reason"],
+}
+REASON = "The user asked for it, and this text streams like a model's explanation."
+
+
+def register_tools(client: RealtimeClient, count: int, speculative: bool) -> None:
+    for index in range(count):
+        if index % 2:
+
+            def sync_tool(delay: float, reason: str = "") -> dict:
+                time.sleep(delay)
+                return {"slept": delay}
+
+            function = sync_tool
+        else:
+
+            async def async_tool(delay: float, reason: str = "") -> dict:
+                await asyncio.sleep(delay)
+                return {"slept": delay}
+
+            function = async_tool
+        client.tools.register(
+            function,
+            name=f"tool_{index}",
+            parameters=PARAMETERS,
+            idempotent=speculative,
+            speculate_on=["delay"],
+        )
+
+
+async def turn(client: RealtimeClient) -> float:
+    calls_done = asyncio.ensure_future(client.wait_for("response.done", timeout=10))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await client.response_create(ResponseConfig(modalities=["text"]))
+    await calls_done
+    await client.wait_for("response.created", timeout=10)
+    elapsed = time.perf_counter() - start
+    await client.wait_for("response.done", timeout=10)
+    return elapsed
+
+
+async def run_mode(uri: str, args: argparse.Namespace, mode: str) -> list[float]:
+    async with RealtimeClient(uri=uri, api_key="bench") as client:
+        if mode == "sequential":
+            client.tools.semaphore = asyncio.Semaphore(1)
+        register_tools(client, len(args.delays), mode == "speculative")
+        durations = [await turn(client) for _ in range(args.turns)]
+        stats = client.tools.stats()
+        speculation = client.tools.speculation_stats()
+    errors = sum(tool["errors"] + tool["timeouts"] for tool in stats)
+    assert not errors, stats
+    if mode == "speculative":
+        print(
+            f"speculation: {speculation['started']} started, "
+            f"hit rate {speculation['hit_rate']:.0%}, "
+            f"waste rate {speculation['waste_rate']:.0%}, "
+            f"lead time p50 {speculation['lead_time']['p50']:.1f} ms"
+        )
+    return durations
+
+
+async def run(args: argparse.Namespace) -> None:
+    script = ResponseScript(
+        function_calls=[
+            (f"tool_{index}", {"delay": delay, "reason": REASON})
+            for index, delay in enumerate(args.delays)
+        ],
+        deltas_per_second=args.deltas_per_second,
+    )
+    results = {}
+    async with MockRealtimeServer(script=script) as server:
+        for mode in ("sequential", "parallel", "speculative"):
+            results[mode] = await run_mode(server.uri, args, mode)
+
+    print(
+        f"{args.turns} turns of {len(args.delays)} calls, "
+        f"slowest {max(args.delays) * 1000:.0f} ms, sum {sum(args.delays) * 1000:.0f} ms, "
+        f"{args.deltas_per_second:.0f} argument deltas per second"
+    )
+    for mode, durations in results.items():
+        durations = [duration * 1000 for duration in durations]
+        print(
+            f"{mode:>12}: mean {statistics.mean(durations):7.1f} ms  "
+            f"min {min(durations):7.1f} ms  max {max(durations):7.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--delays", type=float, nargs="+", default=[0.1, 0.2, 0.3])
+    parser.add_argument("--deltas-per-second", type=float, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
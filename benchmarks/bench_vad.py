@@ -0,0 +1,80 @@
+"""Microbenchmark for `VoiceActivityDetector` on the console capture path.
+
+Feeds synthetic 24 kHz PCM16 audio, alternating speech-like bursts and quiet background
+noise, in the 1024-frame chunks delivered by `RealtimeConsole.audio_callback`, and
+reports the CPU time per chunk, the real-time factor (CPU time / audio duration) and how
+much of the audio is trimmed.
+
+Usage:
+    python benchmarks/bench_vad.py [--seconds 60] [--frame-ms 10 20 30]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime_client.audio import VoiceActivityDetector
+
+SAMPLE_RATE = 24000
+CHUNK_FRAMES = 1024  # RealtimeConsole.chunk
+
+
+def synthetic_capture(seconds: float, seed: int = 0) -> bytes:
+    """Alternate 1-3 s of voiced harmonics at speech level with 1-3 s of room noise."""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLE_RATE)
+    audio = rng.normal(0, 30, total)  # Background noise around -60 dBFS
+    position = int(rng.uniform(1, 3) * SAMPLE_RATE)
+    while position < total:
+        length = min(int(rng.uniform(1, 3) * SAMPLE_RATE), total - position)
+        t = np.arange(length) / SAMPLE_RATE
+        pitch = rng.uniform(100, 220)
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 8))
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)  # Syllable rate
+        audio[position : position + length] += 3000 * voiced * envelope
+        position += length + int(rng.uniform(1, 3) * SAMPLE_RATE)
+    return np.clip(audio, -32768, 32767).astype("<i2").tobytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--frame-ms", type=int, nargs="+", default=[10, 20, 30])
+    args = parser.parse_args()
+
+    audio = synthetic_capture(args.seconds)
+    chunk_bytes = CHUNK_FRAMES * 2
+    chunks = [audio[i : i + chunk_bytes] for i in range(0, len(audio), chunk_bytes)]
+    audio_seconds = len(audio) / 2 / SAMPLE_RATE
+    chunk_ms = CHUNK_FRAMES / SAMPLE_RATE * 1000
+
+    print(
+        f"{audio_seconds:.0f} s of audio in {len(chunks)} chunks of {chunk_ms:.1f} ms"
+    )
+    print(
+        f"{'frame ms':>8} {'us/chunk':>9} {'real-time factor':>17} "
+        f"{'kept':>6} {'utterances':>10}"
+    )
+    for frame_ms in args.frame_ms:
+        vad = VoiceActivityDetector(SAMPLE_RATE, frame_ms=frame_ms)
+        utterances = 0
+        start = time.process_time()
+        for chunk in chunks:
+            _, events = vad.process(chunk)
+            utterances += events.count("speech_started")
+        vad.flush()
+        elapsed = time.process_time() - start
+        print(
+            f"{frame_ms:>8} {elapsed / len(chunks) * 1e6:>9.1f} "
+            f"{elapsed / audio_seconds:>17.5f} "
+            f"{vad.bytes_out / vad.bytes_in:>6.1%} {utterances:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
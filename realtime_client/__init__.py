@@ -1,3 +1,11 @@
 """A module for interacting with the OpenAI Realtime API."""
 
+from .barge_in import BargeInController
+from .conversation import ConversationStore
+from .correlation import RealtimeAPIError
+from .journal import JournalRecorder, JournalReplayer
+from .pool import RealtimeClientPool
 from .realtime_client import RealtimeClient
+from .sharding import ShardSupervisor
+from .streaming import ResponseChunk, ResponseStream
+from .tools import ToolRegistry
@@ -0,0 +1,6 @@
+"""Audio utilities for capturing and playing back realtime audio."""
+
+from .playback import AudioPlayer
+from .resample import Resampler
+from .ring_buffer import PCMRingBuffer
+from .vad import VADEvent, VoiceActivityDetector
@@ -0,0 +1,144 @@
+"""Table-driven G.711 µ-law and A-law codecs for the `g711_ulaw` and `g711_alaw` formats.
+
+Decoding looks every byte up in a 256-entry table of PCM16 samples, and encoding looks
+every sample up in a 65536-entry table of codes, indexed by the sample's 16 bits. Both are
+a single NumPy gather per chunk. The tables are built once, on first use, with the
+segment arithmetic of the ITU-T G.711 reference implementation.
+"""
+
+import numpy as np
+from typing_extensions import Literal
+
+AudioFormat = Literal["pcm16", "g711_ulaw", "g711_alaw"]
+
+SAMPLE_RATES: dict[AudioFormat, int] = {
+    "pcm16": 24000,
+    "g711_ulaw": 8000,
+    "g711_alaw": 8000,
+}
+"""Sample rate of the audio exchanged with the Realtime API in every format."""
+
+SAMPLE_WIDTHS: dict[AudioFormat, int] = {"pcm16": 2, "g711_ulaw": 1, "g711_alaw": 1}
+"""Bytes per sample of every format."""
+
+_ULAW_BIAS = 0x84
+
+_tables: dict[str, np.ndarray] = {}
+
+
+def _ulaw_encode_table() -> np.ndarray:
+    # Computed on 14-bit samples, like the reference implementation
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), 8159) + (_ULAW_BIAS >> 2)
+    segment = np.searchsorted(
+        np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF]), magnitude
+    )
+    code = (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+    code = np.where(segment >= 8, 0x7F, code)
+    return (code ^ mask).astype(np.uint8)
+
+
+def _ulaw_decode_table() -> np.ndarray:
+    code = ~np.arange(256, dtype=np.int32) & 0xFF
+    magnitude = (((code & 0x0F) << 3) + _ULAW_BIAS) << ((code & 0x70) >> 4)
+    return np.where(code & 0x80, _ULAW_BIAS - magnitude, magnitude - _ULAW_BIAS).astype(
+        "<i2"
+    )
+
+
+def _alaw_encode_table() -> np.ndarray:
+    pcm = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    magnitude = np.where(pcm >= 0, pcm, -pcm - 1)
+    segment = np.searchsorted(
+        np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]), magnitude
+    )
+    shift = np.where(segment < 2, 1, segment)
+    code = (np.minimum(segment, 7) << 4) | ((magnitude >> shift) & 0x0F)
+    code = np.where(segment >= 8, 0x7F, code)
+    return (code ^ mask).astype(np.uint8)
+
+
+def _alaw_decode_table() -> np.ndarray:
+    code = np.arange(256, dtype=np.int32) ^ 0x55
+    segment = (code & 0x70) >> 4
+    magnitude = ((code & 0x0F) << 4) + np.where(segment == 0, 8, 0x108)
+    magnitude = np.where(
+        segment > 1, magnitude << np.maximum(segment - 1, 0), magnitude
+    )
+    return np.where(code & 0x80, magnitude, -magnitude).astype("<i2")
+
+
+_BUILDERS = {
+    "ulaw_encode": _ulaw_encode_table,
+    "ulaw_decode": _ulaw_decode_table,
+    "alaw_encode": _alaw_encode_table,
+    "alaw_decode": _alaw_decode_table,
+}
+
+
+def _table(name: str) -> np.ndarray:
+    table = _tables.get(name)
+    if table is None:
+        table = _tables[name] = _BUILDERS[name]()
+    return table
+
+
+def _encode(pcm: bytes | bytearray | memoryview, table: str) -> bytes:
+    samples = np.frombuffer(pcm, dtype="<u2", count=len(pcm) // 2)
+    return _table(table)[samples].tobytes()
+
+
+def _decode(data: bytes | bytearray | memoryview, table: str) -> bytes:
+    return _table(table)[np.frombuffer(data, dtype=np.uint8)].tobytes()
+
+
+def ulaw_encode(pcm: bytes | bytearray | memoryview) -> bytes:
+    """Encode PCM16 little-endian audio to µ-law, one byte per sample."""
+    return _encode(pcm, "ulaw_encode")
+
+
+def ulaw_decode(data: bytes | bytearray | memoryview) -> bytes:
+    """Decode µ-law audio to PCM16 little-endian."""
+    return _decode(data, "ulaw_decode")
+
+
+def alaw_encode(pcm: bytes | bytearray | memoryview) -> bytes:
+    """Encode PCM16 little-endian audio to A-law, one byte per sample."""
+    return _encode(pcm, "alaw_encode")
+
+
+def alaw_decode(data: bytes | bytearray | memoryview) -> bytes:
+    """Decode A-law audio to PCM16 little-endian."""
+    return _decode(data, "alaw_decode")
+
+
+def encode(pcm: bytes | bytearray | memoryview, audio_format: AudioFormat) -> bytes:
+    """Encode PCM16 audio to a Realtime API audio format. `pcm16` is returned as is.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if audio_format == "pcm16":
+        return bytes(pcm)
+    if audio_format == "g711_ulaw":
+        return ulaw_encode(pcm)
+    if audio_format == "g711_alaw":
+        return alaw_encode(pcm)
+    raise ValueError(f"Unknown audio format: {audio_format}")
+
+
+def decode(data: bytes | bytearray | memoryview, audio_format: AudioFormat) -> bytes:
+    """Decode audio in a Realtime API audio format to PCM16. `pcm16` is returned as is.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if audio_format == "pcm16":
+        return bytes(data)
+    if audio_format == "g711_ulaw":
+        return ulaw_decode(data)
+    if audio_format == "g711_alaw":
+        return alaw_decode(data)
+    raise ValueError(f"Unknown audio format: {audio_format}")
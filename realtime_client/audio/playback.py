@@ -0,0 +1,171 @@
+from typing_extensions import Any
+
+from .ring_buffer import PCMRingBuffer
+
+
+class AudioPlayer:
+    """Plays PCM audio from a `PCMRingBuffer` using PyAudio in callback mode.
+
+    PortAudio pulls audio from the ring buffer on its own thread, so playback never blocks
+    the event loop. The ring buffer doubles as a jitter buffer: playback only starts once
+    `prefill_ms` of audio is buffered, and falls back to waiting for the prefill whenever
+    it runs dry in the middle of a stream. Until then the device is fed silence.
+
+    Every callback reads the audio into a reused buffer. PyAudio only accepts `bytes` from
+    a callback, so that buffer is then copied into a new `bytes` object of one period.
+
+    Args:
+        buffer: The buffer to play audio from
+        rate: Sample rate in Hz
+        channels: Number of interleaved channels
+        sample_width: Bytes per sample, 2 for PCM16
+        frames_per_buffer: Frames requested by the device per callback
+        prefill_ms: Audio to buffer before starting or resuming playback
+        pyaudio_instance: An existing `pyaudio.PyAudio` to open the stream on. If None, a
+            new instance is created and terminated with the player.
+    """
+
+    def __init__(
+        self,
+        buffer: PCMRingBuffer,
+        rate: int = 24000,
+        channels: int = 1,
+        sample_width: int = 2,
+        frames_per_buffer: int = 1024,
+        prefill_ms: int = 60,
+        pyaudio_instance: Any | None = None,
+    ):
+        self.buffer = buffer
+        self.rate = rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.frames_per_buffer = frames_per_buffer
+        self.frame_size = channels * sample_width
+        self.prefill_bytes = rate * prefill_ms // 1000 * self.frame_size
+        self.pyaudio_instance = pyaudio_instance
+        self._owns_pyaudio = pyaudio_instance is None
+        self._stream = None
+        self._out = bytearray(frames_per_buffer * self.frame_size)
+        self._out_view = memoryview(self._out)
+        self._silence = bytes(len(self._out))
+        self._playing = False
+        self._stream_ended = False
+        self._continue = 0
+
+        self.frames_played = 0
+        """Audio frames handed to the device since the player was created, silence excluded."""
+        self.underruns = 0
+        """Number of times the buffer ran dry in the middle of an audio stream."""
+
+    @property
+    def is_active(self) -> bool:
+        return self._stream is not None
+
+    @property
+    def is_playing(self) -> bool:
+        """True while audio is being played, False while waiting for the prefill."""
+        return self._playing
+
+    @property
+    def output_latency(self) -> float:
+        """Delay between handing audio to the device and hearing it, in seconds."""
+        if self._stream is None:
+            return 0.0
+        return self._stream.get_output_latency()
+
+    @property
+    def buffer_depth(self) -> int:
+        """Buffered audio, in bytes."""
+        return len(self.buffer)
+
+    @property
+    def buffer_depth_ms(self) -> float:
+        """Buffered audio, in milliseconds."""
+        return len(self.buffer) / self.frame_size / self.rate * 1000
+
+    def mark_stream_end(self) -> None:
+        """Signal that no more audio is coming for now, e.g. on `response.audio.done`.
+
+        The buffer running dry after this point is the regular end of playback and is not
+        counted as an underrun. Writing more audio does not require any call.
+        """
+        self._stream_ended = True
+
+    def flush(self) -> int:
+        """Discard the buffered audio, e.g. when the user interrupts the assistant.
+
+        The device is fed silence from its next callback on, i.e. within one period of
+        `frames_per_buffer`. Playback resumes after the prefill once audio is written again,
+        and the flush is not counted as an underrun.
+
+        Returns:
+            int: The number of bytes discarded
+        """
+        self._playing = False
+        self._stream_ended = False
+        return self.buffer.clear()
+
+    def start(self) -> None:
+        """Open the output stream and start pulling audio from the buffer.
+
+        Raises:
+            ValueError: If the player is already started
+        """
+        import pyaudio
+
+        if self._stream is not None:
+            raise ValueError("Audio player already started")
+        if self.pyaudio_instance is None:
+            self.pyaudio_instance = pyaudio.PyAudio()
+        self._continue = pyaudio.paContinue
+        self._stream = self.pyaudio_instance.open(
+            format=self.pyaudio_instance.get_format_from_width(self.sample_width),
+            channels=self.channels,
+            rate=self.rate,
+            output=True,
+            frames_per_buffer=self.frames_per_buffer,
+            stream_callback=self._callback,
+        )
+        self._stream.start_stream()
+
+    def stop(self) -> None:
+        """Stop playback and close the output stream. Buffered audio is kept."""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        self._playing = False
+        if self._owns_pyaudio and self.pyaudio_instance is not None:
+            self.pyaudio_instance.terminate()
+            self.pyaudio_instance = None
+
+    def _callback(self, in_data, frame_count, time_info, status) -> tuple[bytes, int]:
+        size = frame_count * self.frame_size
+        if size > len(self._out):
+            self._out = bytearray(size)
+            self._out_view = memoryview(self._out)
+            self._silence = bytes(size)
+
+        if not self._playing:
+            buffered = len(self.buffer)
+            if buffered and (
+                buffered >= min(self.prefill_bytes, self.buffer.capacity)
+                or self._stream_ended
+            ):
+                self._playing = True
+            elif size == len(self._silence):
+                return self._silence, self._continue
+            else:
+                return self._silence[:size], self._continue
+
+        out = self._out_view[:size]
+        played = self.buffer.read_into(out, fill=True)
+        self.frames_played += played // self.frame_size
+        if played < size:
+            self._playing = False
+            if self._stream_ended:
+                self._stream_ended = False
+            else:
+                self.underruns += 1
+        # PyAudio rejects mutable buffers, so one copy per period is unavoidable
+        return bytes(out), self._continue
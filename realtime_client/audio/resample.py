@@ -0,0 +1,113 @@
+from math import ceil, gcd
+
+import numpy as np
+
+
+class Resampler:
+    """A streaming polyphase resampler for mono PCM16 audio.
+
+    The rate ratio is reduced to `up / down`. A Kaiser-windowed sinc low-pass filter is
+    designed once at `up` times the input rate and split into `up` phases of
+    `taps_per_phase` taps, so that every output sample costs a single dot product with the
+    input, whatever the ratio. Each chunk is resampled with one vectorized gather and
+    multiply-accumulate.
+
+    The filter history and the fractional position are kept between calls, so chunks of
+    any size can be fed in and the output is the same as resampling the whole stream at
+    once. The output is delayed by half the filter length, i.e. `taps_per_phase / 2` input
+    samples.
+
+    When downsampling, the filter is lengthened by the rate ratio, so that its transition
+    band stays as narrow relative to the output rate.
+
+    Args:
+        input_rate: Sample rate of the input in Hz
+        output_rate: Sample rate of the output in Hz
+        taps_per_phase: Filter taps per output sample when upsampling. More taps give a
+            sharper cutoff.
+        rolloff: Cutoff of the filter, as a fraction of the lower Nyquist frequency
+        beta: Kaiser window parameter, trading stopband attenuation for transition width
+    """
+
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        taps_per_phase: int = 32,
+        rolloff: float = 0.9,
+        beta: float = 8.0,
+    ):
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError("Sample rates must be positive")
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        divisor = gcd(input_rate, output_rate)
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+        self.taps_per_phase = ceil(taps_per_phase * max(1.0, input_rate / output_rate))
+
+        taps_per_phase = self.taps_per_phase
+        length = self.up * taps_per_phase
+        cutoff = rolloff * min(input_rate, output_rate) / 2 / (input_rate * self.up)
+        n = np.arange(length) - (length - 1) / 2
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, beta)
+        # Zero-stuffing divides the level by `up`, so the filter's DC gain restores it
+        prototype *= self.up / prototype.sum()
+        # phases[p, k] is the tap applied to input sample `base - k` at phase `p`
+        self.phases = prototype.reshape(taps_per_phase, self.up).T.astype(np.float32)
+
+        self._history = np.zeros(taps_per_phase - 1, dtype=np.float32)
+        self._position = 0  # Position of the next output, in input samples times `up`
+
+    @property
+    def passthrough(self) -> bool:
+        return self.up == self.down == 1
+
+    def reset(self) -> None:
+        """Forget the filter history, e.g. at the start of a new recording."""
+        self._history[:] = 0
+        self._position = 0
+
+    def process_array(self, samples: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of float samples.
+
+        Args:
+            samples: Input samples, as a one-dimensional array
+
+        Returns:
+            np.ndarray: The output samples available so far, as float32
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        if self.passthrough:
+            return samples
+        buffer = np.concatenate((self._history, samples))
+        # Upsampled positions of every output whose newest input sample is available
+        end = len(samples) * self.up
+        positions = np.arange(self._position, end, self.down)
+        if len(positions):
+            bases = positions // self.up + self.taps_per_phase - 1
+            windows = bases[:, None] - np.arange(self.taps_per_phase)[None, :]
+            output = np.einsum(
+                "ij,ij->i", buffer[windows], self.phases[positions % self.up]
+            )
+            self._position = int(positions[-1]) + self.down - end
+        else:
+            output = np.zeros(0, dtype=np.float32)
+            self._position -= end
+        self._history = buffer[len(buffer) - (self.taps_per_phase - 1) :].copy()
+        return output
+
+    def process(self, pcm: bytes | bytearray | memoryview) -> bytes:
+        """Resample the next chunk of PCM16 little-endian audio.
+
+        Args:
+            pcm: Input audio, a whole number of samples
+
+        Returns:
+            bytes: The output audio available so far
+        """
+        if self.passthrough:
+            return bytes(pcm)
+        samples = np.frombuffer(pcm, dtype="<i2", count=len(pcm) // 2)
+        output = self.process_array(samples)
+        return np.clip(np.rint(output), -32768, 32767).astype("<i2").tobytes()
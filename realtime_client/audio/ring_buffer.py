@@ -0,0 +1,230 @@
+import binascii
+import threading
+
+
+class PCMRingBuffer:
+    """A fixed-size ring buffer for PCM audio, shared by a producer and a consumer thread.
+
+    The storage is allocated once, writes copy into it and reads either copy into a
+    caller-owned buffer (`read_into()`) or expose the buffered bytes as `memoryview`
+    slices (`peek()` + `advance()`). When a write does not fit, the oldest audio is
+    overwritten so the buffer never grows, and the overrun is counted. Only
+    `write_base64()` allocates, see there.
+
+    The buffer only holds whole samples. A write ending in the middle of a sample keeps
+    the partial sample back until the next write completes it.
+
+    Args:
+        capacity: Size of the buffer in bytes, rounded down to a whole number of samples.
+        sample_width: Bytes per sample (2 for PCM16). Reads and writes are kept aligned to it.
+        high_watermark: Depth in bytes above which `above_high_watermark` is true.
+            Defaults to three quarters of the capacity.
+        low_watermark: Depth in bytes below which `below_low_watermark` is true.
+            Defaults to a quarter of the capacity.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        sample_width: int = 2,
+        high_watermark: int | None = None,
+        low_watermark: int | None = None,
+    ):
+        capacity -= capacity % sample_width
+        if capacity <= 0:
+            raise ValueError("capacity must hold at least one sample")
+        self.capacity = capacity
+        self.sample_width = sample_width
+        self.high_watermark = (
+            high_watermark if high_watermark is not None else capacity * 3 // 4
+        )
+        self.low_watermark = (
+            low_watermark if low_watermark is not None else capacity // 4
+        )
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._read_pos = 0
+        self._size = 0
+        self._silence = b""
+        self._partial = bytearray()  # The start of a sample cut by the last write
+        self._lock = threading.Lock()
+
+        self.bytes_written = 0
+        """Total bytes stored since creation. Bytes cut from writes longer than the
+        capacity, and partial samples not completed yet, are not counted."""
+        self.bytes_read = 0
+        """Total bytes consumed since creation."""
+        self.overruns = 0
+        """Number of writes that overwrote unread audio."""
+        self.overrun_bytes = 0
+        """Total unread bytes lost to overruns."""
+        self.underruns = 0
+        """Number of `read_into()` calls that could not be filled completely."""
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def free(self) -> int:
+        """Bytes that can be written without overwriting unread audio."""
+        return self.capacity - self._size
+
+    @property
+    def write_position(self) -> int:
+        """Stream position of the next write, in bytes, comparable with `bytes_read`.
+
+        The audio written next is consumed once `bytes_read` reaches this position, unless
+        it is discarded by `clear()` or an overrun first.
+        """
+        with self._lock:
+            return self.bytes_read + self._size
+
+    @property
+    def above_high_watermark(self) -> bool:
+        return self._size >= self.high_watermark
+
+    @property
+    def below_low_watermark(self) -> bool:
+        return self._size < self.low_watermark
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """Copy audio into the buffer, overwriting the oldest audio if it does not fit.
+
+        Args:
+            data: Raw PCM bytes
+
+        Returns:
+            int: The number of bytes accepted, i.e. `len(data)`
+        """
+        data = memoryview(data).cast("B")
+        length = len(data)
+        with self._lock:
+            partial = self._partial
+            if partial:
+                missing = self.sample_width - len(partial)
+                partial += data[:missing]
+                data = data[missing:]
+                if len(partial) == self.sample_width:
+                    self._store(memoryview(partial))
+                    partial.clear()
+            cut = len(data) % self.sample_width
+            if cut:
+                partial += data[len(data) - cut :]
+                data = data[: len(data) - cut]
+            if len(data) > self.capacity:
+                # Only the most recent audio can survive
+                data = data[len(data) - self.capacity :]
+            self._store(data)
+        return length
+
+    def write_base64(self, data: str | bytes) -> int:
+        """Decode Base64 encoded audio and copy it into the buffer.
+
+        The standard library cannot decode Base64 into an existing buffer, so the audio is
+        decoded into one temporary `bytes` object, which is then copied in.
+
+        Args:
+            data: Base64 encoded PCM bytes, e.g. the `delta` of a `response.audio.delta` event
+
+        Returns:
+            int: The number of decoded bytes written
+        """
+        return self.write(binascii.a2b_base64(data))
+
+    def _store(self, data: memoryview) -> None:
+        length = len(data)
+        overflow = length - self.free
+        if overflow > 0:
+            self._consume(overflow)
+            self.overruns += 1
+            self.overrun_bytes += overflow
+        start = (self._read_pos + self._size) % self.capacity
+        first = min(length, self.capacity - start)
+        self._view[start : start + first] = data[:first]
+        if first < length:
+            self._view[: length - first] = data[first:]
+        self._size += length
+        self.bytes_written += length
+
+    def peek(self, max_bytes: int | None = None) -> tuple[memoryview, memoryview]:
+        """Get zero-copy views of the oldest buffered audio without consuming it.
+
+        The audio may wrap around the end of the storage, so it is returned as two views,
+        the second of which is usually empty. Call `advance()` once the views have been
+        used. The views are only valid until the next write that overruns the buffer.
+
+        Args:
+            max_bytes: Maximum number of bytes to return. Defaults to everything buffered.
+
+        Returns:
+            tuple[memoryview, memoryview]: The views, in playback order
+        """
+        with self._lock:
+            size = self._size if max_bytes is None else min(self._size, max_bytes)
+            size -= size % self.sample_width
+            start = self._read_pos
+            first = min(size, self.capacity - start)
+            return self._view[start : start + first], self._view[: size - first]
+
+    def advance(self, size: int) -> int:
+        """Consume audio returned by `peek()`.
+
+        Args:
+            size: The number of bytes to consume
+
+        Returns:
+            int: The number of bytes actually consumed
+        """
+        with self._lock:
+            size = min(size, self._size)
+            self._consume(size)
+            self.bytes_read += size
+            return size
+
+    def read_into(self, out: bytearray | memoryview, fill: bool = False) -> int:
+        """Copy the oldest buffered audio into `out` and consume it.
+
+        Args:
+            out: A writable buffer, usually preallocated and reused by the consumer
+            fill: Pad `out` with silence if not enough audio is buffered
+
+        Returns:
+            int: The number of audio bytes copied, excluding any padding
+        """
+        out = memoryview(out).cast("B")
+        with self._lock:
+            size = min(self._size, len(out))
+            size -= size % self.sample_width
+            if size < len(out) and (fill or size == 0):
+                self.underruns += 1
+            start = self._read_pos
+            first = min(size, self.capacity - start)
+            out[:first] = self._view[start : start + first]
+            if first < size:
+                out[first:size] = self._view[: size - first]
+            self._consume(size)
+            self.bytes_read += size
+        if fill and size < len(out):
+            padding = len(out) - size
+            if len(self._silence) < padding:
+                self._silence = bytes(padding)
+            out[size:] = self._silence[:padding]
+        return size
+
+    def _consume(self, size: int) -> None:
+        self._read_pos = (self._read_pos + size) % self.capacity
+        self._size -= size
+        if self._size == 0:
+            self._read_pos = 0
+
+    def clear(self) -> int:
+        """Discard all buffered audio, including a partial sample.
+
+        Returns:
+            int: The number of bytes discarded
+        """
+        with self._lock:
+            size = self._size
+            self._consume(size)
+            self._partial.clear()
+            return size
@@ -0,0 +1,169 @@
+from collections import deque
+
+import numpy as np
+from typing_extensions import Literal
+
+VADEvent = Literal["speech_started", "speech_stopped"]
+
+
+class VoiceActivityDetector:
+    """A streaming voice activity detector that gates mono PCM16 audio.
+
+    Audio is split into frames of `frame_ms`. A frame is speech when its energy is above
+    `energy_threshold_db` and its zero-crossing rate is below `max_zero_crossing_rate`,
+    which rejects hiss and other broadband noise. Every chunk of frames is classified
+    with a few vectorized NumPy operations.
+
+    Speech starts after `start_ms` of consecutive speech frames and stops after
+    `hangover_ms` without one. Only the audio in between is passed through, preceded by
+    `prefix_padding_ms` of audio before the start, so that leading and trailing silence is
+    trimmed without clipping soft onsets.
+
+    Args:
+        sample_rate: Sample rate of the audio in Hz
+        frame_ms: Duration of the classified frames
+        energy_threshold_db: Minimum frame energy of speech, in dB relative to full scale
+        max_zero_crossing_rate: Maximum fraction of sign changes between samples of speech
+        start_ms: Duration of speech needed to start passing audio through
+        hangover_ms: Duration of silence needed to stop passing audio through
+        prefix_padding_ms: Duration of audio kept before the start of speech
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        frame_ms: int = 20,
+        energy_threshold_db: float = -45.0,
+        max_zero_crossing_rate: float = 0.35,
+        start_ms: int = 60,
+        hangover_ms: int = 500,
+        prefix_padding_ms: int = 300,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.start_ms = start_ms
+        self.hangover_ms = hangover_ms
+        self.prefix_padding_ms = prefix_padding_ms
+        self.frame_samples = sample_rate * frame_ms // 1000
+        if self.frame_samples < 2:
+            raise ValueError("frame_ms must span at least two samples")
+        self.frame_bytes = self.frame_samples * 2
+        self.energy_threshold_db = energy_threshold_db
+        self.max_zero_crossing_rate = max_zero_crossing_rate
+        self.start_frames = max(1, -(-start_ms // frame_ms))
+        self.hangover_frames = max(1, -(-hangover_ms // frame_ms))
+        prefix_frames = -(-prefix_padding_ms // frame_ms)
+        # Also holds the frames that triggered the start
+        self._prefix: deque[bytes] = deque(maxlen=prefix_frames + self.start_frames)
+        self._pending = bytearray()
+        self._speech_run = 0
+        self._silence_run = 0
+
+        self.is_speech = False
+        """Whether audio is currently passed through."""
+        self.frames = 0
+        """Total frames classified."""
+        self.speech_frames = 0
+        """Total frames classified as speech."""
+        self.bytes_in = 0
+        """Total bytes given to `process()`."""
+        self.bytes_out = 0
+        """Total bytes passed through."""
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        """Classify frames as speech or not.
+
+        Args:
+            frames: PCM16 samples with one frame per row, of shape `(n, frame_samples)`
+
+        Returns:
+            np.ndarray: A boolean array of shape `(n,)`, true for speech frames
+        """
+        samples = frames.astype(np.float32)
+        energy = np.einsum("ij,ij->i", samples, samples) / (
+            self.frame_samples * 32768.0**2
+        )
+        energy_db = 10 * np.log10(energy + 1e-12)
+        signs = np.signbit(frames)
+        crossings = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1)
+        zero_crossing_rate = crossings / (self.frame_samples - 1)
+        return (energy_db >= self.energy_threshold_db) & (
+            zero_crossing_rate <= self.max_zero_crossing_rate
+        )
+
+    def process(
+        self, pcm: bytes | bytearray | memoryview
+    ) -> tuple[bytes, list[VADEvent]]:
+        """Feed captured audio through the detector.
+
+        Audio that does not fill a whole frame is kept until the next call.
+
+        Args:
+            pcm: Mono PCM16 little-endian audio of any length
+
+        Returns:
+            tuple[bytes, list[VADEvent]]: The audio to pass through, and the speech
+                transitions detected in this chunk, in order
+        """
+        self.bytes_in += len(pcm)
+        self._pending += pcm
+        count = len(self._pending) // self.frame_bytes
+        if not count:
+            return b"", []
+        data = bytes(self._pending[: count * self.frame_bytes])
+        del self._pending[: count * self.frame_bytes]
+        frames = np.frombuffer(data, dtype="<i2").reshape(count, self.frame_samples)
+        speech = self.classify(frames)
+        self.frames += count
+        self.speech_frames += int(np.count_nonzero(speech))
+
+        output = bytearray()
+        events: list[VADEvent] = []
+        view = memoryview(data)
+        for index, frame_is_speech in enumerate(speech.tolist()):
+            frame = view[index * self.frame_bytes : (index + 1) * self.frame_bytes]
+            if self.is_speech:
+                output += frame
+                if frame_is_speech:
+                    self._silence_run = 0
+                else:
+                    self._silence_run += 1
+                    if self._silence_run >= self.hangover_frames:
+                        self.is_speech = False
+                        self._speech_run = 0
+                        events.append("speech_stopped")
+            else:
+                self._prefix.append(bytes(frame))
+                if not frame_is_speech:
+                    self._speech_run = 0
+                    continue
+                self._speech_run += 1
+                if self._speech_run >= self.start_frames:
+                    self.is_speech = True
+                    self._silence_run = 0
+                    events.append("speech_started")
+                    output += b"".join(self._prefix)
+                    self._prefix.clear()
+        self.bytes_out += len(output)
+        return bytes(output), events
+
+    def flush(self) -> tuple[bytes, list[VADEvent]]:
+        """End the stream, e.g. when recording stops.
+
+        Returns:
+            tuple[bytes, list[VADEvent]]: The buffered partial frame if speech was in
+                progress, and `speech_stopped` if it was
+        """
+        output = bytes(self._pending) if self.is_speech else b""
+        events: list[VADEvent] = ["speech_stopped"] if self.is_speech else []
+        self.bytes_out += len(output)
+        self.reset()
+        return output, events
+
+    def reset(self) -> None:
+        """Forget the buffered audio and the speech state, keeping the counters."""
+        self._pending.clear()
+        self._prefix.clear()
+        self._speech_run = 0
+        self._silence_run = 0
+        self.is_speech = False
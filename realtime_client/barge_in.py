@@ -0,0 +1,138 @@
+from .audio import AudioPlayer
+from .realtime_client import RealtimeClient
+from .router import Subscription
+
+
+class BargeInController:
+    """Stops the assistant's audio as soon as the user starts to speak.
+
+    `interrupt()` first flushes the player, so the device goes silent within one period.
+    It then cancels the response if it is still being generated, and truncates the
+    interrupted item to the audio the user actually heard, so that the server forgets
+    the unheard part of the answer.
+
+    The heard audio is counted in samples. When the first delta of an item is written to
+    the player's buffer, the stream position where its audio starts is recorded. It is
+    then compared with the audio the device has consumed, minus the device's output
+    latency.
+
+    Once attached, interruptions are triggered by `input_audio_buffer.speech_started` from
+    server VAD. Call `interrupt()` directly for local triggers, e.g. a record key or a
+    client-side VAD.
+
+    Args:
+        client: The client to send the cancellation and truncation with
+        player: The player of the assistant's audio
+        compensate_latency: Subtract the device output latency from the played audio
+
+    Example:
+        ```python
+        >>> barge_in = BargeInController(client, player)
+        >>> barge_in.attach()
+        >>>
+        >>> def play(event):
+        >>>     if barge_in.on_audio_delta(event):
+        >>>         player.buffer.write_base64(event["delta"])
+        >>>
+        >>> client.on("response.audio.delta", play)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: RealtimeClient,
+        player: AudioPlayer,
+        compensate_latency: bool = True,
+    ):
+        self.client = client
+        self.player = player
+        self.compensate_latency = compensate_latency
+        self._item_id: str | None = None
+        self._content_index = 0
+        self._item_start = 0  # Stream position of the item's first byte
+        self._active_response: str | None = None
+        self._cancelled: set[str] = set()
+
+        self.interruptions = 0
+        """Number of items truncated by `interrupt()`."""
+
+    def attach(self) -> list[Subscription]:
+        """Follow the client's responses and interrupt them on `speech_started`.
+
+        Returns:
+            list[Subscription]: The registered handlers, which can be passed to `client.off()`
+        """
+        return [
+            self.client.on("response.created", self._on_response_created),
+            self.client.on("response.done", self._on_response_done),
+            self.client.on(
+                "input_audio_buffer.speech_started", self._on_speech_started
+            ),
+        ]
+
+    def on_audio_delta(self, event: dict) -> bool:
+        """Track a `response.audio.delta` event. Call it before writing the delta's audio.
+
+        Returns:
+            bool: False if the delta belongs to an interrupted response and must be dropped
+        """
+        if event.get("response_id") in self._cancelled:
+            return False
+        if event["item_id"] != self._item_id:
+            self._item_id = event["item_id"]
+            self._content_index = event.get("content_index", 0)
+            self._item_start = self.player.buffer.write_position
+        return True
+
+    def heard_position(self) -> int:
+        """Stream position of the audio being heard right now, in bytes."""
+        position = self.player.buffer.bytes_read
+        if self.compensate_latency:
+            latency = round(self.player.output_latency * self.player.rate)
+            position -= latency * self.player.frame_size
+        return position
+
+    async def interrupt(self) -> int | None:
+        """Stop the assistant's audio, cancel its response and truncate its item.
+
+        Returns:
+            int | None: The `audio_end_ms` the interrupted item was truncated to, or None if
+                nothing was interrupted
+
+        Raises:
+            ConnectionError: If not connected to websocket
+        """
+        played = self.player.buffer.bytes_read
+        heard = self.heard_position()
+        end = self.player.buffer.write_position
+        self.player.flush()
+
+        response_id, self._active_response = self._active_response, None
+        if response_id is not None:
+            self._cancelled.add(response_id)
+            await self.client.response_cancel()
+        item_id, self._item_id = self._item_id, None
+        if item_id is None or (played >= end and response_id is None):
+            # Everything was played already. Compared before latency compensation, which
+            # would otherwise keep the end of a finished item out of reach.
+            return None
+
+        frames = max(0, heard - self._item_start) // self.player.frame_size
+        audio_end_ms = frames * 1000 // self.player.rate
+        await self.client.conversation_item_truncate(
+            item_id, self._content_index, audio_end_ms
+        )
+        self.interruptions += 1
+        return audio_end_ms
+
+    def _on_response_created(self, event: dict) -> None:
+        self._active_response = event["response"]["id"]
+
+    def _on_response_done(self, event: dict) -> None:
+        response_id = event["response"]["id"]
+        if self._active_response == response_id:
+            self._active_response = None
+        self._cancelled.discard(response_id)
+
+    async def _on_speech_started(self, event: dict) -> None:
+        await self.interrupt()
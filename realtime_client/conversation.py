@@ -0,0 +1,393 @@
+import base64
+
+from typing_extensions import TYPE_CHECKING, Iterator
+
+from .models import Item, Part, Response
+from .router import Subscription
+
+if TYPE_CHECKING:
+    from .realtime_client import RealtimeClient
+
+
+class _PartState:
+    """Content of one part, accumulated from deltas.
+
+    Text is kept as a list of chunks and only joined when read, and audio is decoded into a
+    `bytearray`, so that every delta is an amortized O(1) append.
+    """
+
+    __slots__ = ("part_type", "text", "transcript", "audio")
+
+    def __init__(self, part: dict):
+        self.part_type: str | None = part.get("type")
+        self.text: list[str] = [part["text"]] if part.get("text") else []
+        self.transcript: list[str] = (
+            [part["transcript"]] if part.get("transcript") else []
+        )
+        self.audio = bytearray()
+        if part.get("audio"):
+            self.audio += base64.b64decode(part["audio"])
+
+    @staticmethod
+    def _join(chunks: list[str]) -> str:
+        if len(chunks) > 1:
+            # Collapse the chunks, so that reading again is free
+            chunks[:] = ["".join(chunks)]
+        return chunks[0] if chunks else ""
+
+    def to_model(self) -> Part:
+        part = Part(type=self.part_type)
+        if self.part_type in ("text", "input_text"):
+            part.text = self._join(self.text)
+        elif self.part_type in ("audio", "input_audio"):
+            part.transcript = self._join(self.transcript) if self.transcript else None
+            if self.audio:
+                part.audio = bytes(self.audio)
+        return part
+
+
+class _ItemState:
+    """An item of the conversation, linked to its neighbours."""
+
+    __slots__ = (
+        "item",
+        "parts",
+        "arguments",
+        "previous_id",
+        "next_id",
+        "response_id",
+    )
+
+    def __init__(self, item: dict):
+        self.item = {key: value for key, value in item.items() if key != "content"}
+        self.parts = [_PartState(part) for part in item.get("content") or ()]
+        self.arguments: list[str] = [item["arguments"]] if item.get("arguments") else []
+        self.previous_id: str | None = None
+        self.next_id: str | None = None
+        self.response_id: str | None = None
+
+    def part(self, content_index: int) -> _PartState:
+        while len(self.parts) <= content_index:
+            self.parts.append(_PartState({}))
+        return self.parts[content_index]
+
+    def to_model(self) -> Item:
+        item = Item(**self.item)
+        if self.parts or self.item.get("type") == "message":
+            item.content = [part.to_model() for part in self.parts]
+        if self.arguments:
+            item.arguments = _PartState._join(self.arguments)
+        return item
+
+
+class ConversationStore:
+    """Builds the state of a conversation incrementally from the server event stream.
+
+    Items are kept in conversation order, as given by `previous_item_id`, and can be looked
+    up by `item_id` in O(1). Responses are indexed by `response_id`. Text, transcript,
+    audio and function call argument deltas are appended in amortized O(1) and only
+    joined when an item is read.
+
+    Args:
+        keep_audio: Accumulate the audio of `response.audio.delta` events. Disable this to
+            skip decoding audio that is already played elsewhere.
+        sample_rate: Sample rate of the session audio, used to apply truncation
+        sample_width: Bytes per audio sample, used to apply truncation
+
+    Example:
+        ```python
+        >>> store = ConversationStore()
+        >>> store.attach(client)
+        >>> await client.response_create()
+        >>> await client.wait_for("response.done")
+        >>> for item in store:
+        >>>     print(item.role, store.text(item.id))
+        ```
+    """
+
+    EVENTS: tuple[str, ...] = (
+        "conversation.item.created",
+        "conversation.item.deleted",
+        "conversation.item.truncated",
+        "conversation.item.input_audio_transcription.completed",
+        "response.created",
+        "response.done",
+        "response.output_item.added",
+        "response.output_item.done",
+        "response.content_part.added",
+        "response.content_part.done",
+        "response.text.delta",
+        "response.text.done",
+        "response.audio_transcript.delta",
+        "response.audio_transcript.done",
+        "response.audio.delta",
+        "response.function_call_arguments.delta",
+        "response.function_call_arguments.done",
+    )
+    """The server events applied by the store."""
+
+    def __init__(
+        self, keep_audio: bool = True, sample_rate: int = 24000, sample_width: int = 2
+    ):
+        self.keep_audio = keep_audio
+        self.sample_width = sample_width
+        self.bytes_per_ms = sample_rate * sample_width / 1000
+        self.items: dict[str, _ItemState] = {}
+        self.responses: dict[str, dict] = {}
+        self.first_id: str | None = None
+        self.last_id: str | None = None
+        self._handlers = {
+            "conversation.item.created": self._on_item_created,
+            "conversation.item.deleted": self._on_item_deleted,
+            "conversation.item.truncated": self._on_item_truncated,
+            "conversation.item.input_audio_transcription.completed": self._on_input_transcript,
+            "response.created": self._on_response_created,
+            "response.done": self._on_response_done,
+            "response.output_item.added": self._on_output_item_added,
+            "response.output_item.done": self._on_output_item_done,
+            "response.content_part.added": self._on_content_part_added,
+            "response.content_part.done": self._on_content_part_done,
+            "response.text.delta": self._on_text_delta,
+            "response.text.done": self._on_text_done,
+            "response.audio_transcript.delta": self._on_transcript_delta,
+            "response.audio_transcript.done": self._on_transcript_done,
+            "response.audio.delta": self._on_audio_delta,
+            "response.function_call_arguments.delta": self._on_arguments_delta,
+            "response.function_call_arguments.done": self._on_arguments_done,
+        }
+
+    def attach(self, client: "RealtimeClient") -> list[Subscription]:
+        """Apply the client's server events to the store.
+
+        Returns:
+            list[Subscription]: The registered handlers, which can be passed to `client.off()`
+        """
+        return [client.on(event_name, self.apply) for event_name in self.EVENTS]
+
+    def apply(self, event: dict) -> None:
+        """Update the conversation from a server event. Other events are ignored."""
+        handler = self._handlers.get(event["type"])
+        if handler is not None:
+            handler(event)
+
+    # Linked list of items ======================================================
+
+    def _insert(self, state: _ItemState, previous_id: str | None) -> None:
+        """Link an item after `previous_id`, at the start if it is None."""
+        if previous_id is not None and previous_id not in self.items:
+            # Unknown predecessor, e.g. deleted or from before the store was attached
+            previous_id = self.last_id
+        item_id = state.item["id"]
+        next_id = self.items[previous_id].next_id if previous_id else self.first_id
+        state.previous_id, state.next_id = previous_id, next_id
+        if previous_id is None:
+            self.first_id = item_id
+        else:
+            self.items[previous_id].next_id = item_id
+        if next_id is None:
+            self.last_id = item_id
+        else:
+            self.items[next_id].previous_id = item_id
+        self.items[item_id] = state
+
+    def _unlink(self, state: _ItemState) -> None:
+        if state.previous_id is None:
+            self.first_id = state.next_id
+        else:
+            self.items[state.previous_id].next_id = state.next_id
+        if state.next_id is None:
+            self.last_id = state.previous_id
+        else:
+            self.items[state.next_id].previous_id = state.previous_id
+        del self.items[state.item["id"]]
+
+    def _add(self, item: dict, previous_id: str | None) -> _ItemState:
+        state = self.items.get(item["id"])
+        if state is None:
+            state = _ItemState(item)
+            self._insert(state, previous_id)
+        else:
+            self._update(state, item)
+        return state
+
+    def _update(self, state: _ItemState, item: dict) -> None:
+        """Merge a newer snapshot of an item, keeping content accumulated from deltas."""
+        for key, value in item.items():
+            if key == "content":
+                for index, part in enumerate(value or ()):
+                    if index >= len(state.parts):
+                        state.parts.append(_PartState(part))
+                    else:
+                        self._finish_part(state.parts[index], part)
+            elif key == "arguments":
+                if value:
+                    state.arguments[:] = [value]
+            elif value is not None or key not in state.item:
+                state.item[key] = value
+
+    @staticmethod
+    def _finish_part(part: _PartState, final: dict) -> None:
+        part.part_type = final.get("type") or part.part_type
+        if final.get("text") is not None:
+            part.text[:] = [final["text"]]
+        if final.get("transcript") is not None:
+            part.transcript[:] = [final["transcript"]]
+
+    # Event handlers ============================================================
+
+    def _on_item_created(self, event: dict) -> None:
+        self._add(event["item"], event.get("previous_item_id"))
+
+    def _on_item_deleted(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            self._unlink(state)
+
+    def _on_item_truncated(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is None:
+            return
+        part = state.part(event["content_index"])
+        # The server drops the transcript, since it may contain text that was not heard
+        part.transcript.clear()
+        end = int(event["audio_end_ms"] * self.bytes_per_ms)
+        del part.audio[end - end % self.sample_width :]
+
+    def _on_input_transcript(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.part(event["content_index"]).transcript[:] = [event["transcript"]]
+
+    def _on_response_created(self, event: dict) -> None:
+        response = dict(event["response"])
+        response["output"] = [item["id"] for item in response.get("output") or ()]
+        self.responses[response["id"]] = response
+
+    def _on_response_done(self, event: dict) -> None:
+        response = dict(event["response"])
+        for item in response.get("output") or ():
+            state = self.items.get(item.get("id"))
+            if state is not None:
+                self._update(state, item)
+        response["output"] = [item["id"] for item in response.get("output") or ()]
+        self.responses[response["id"]] = response
+
+    def _on_output_item_added(self, event: dict) -> None:
+        state = self._add(event["item"], self.last_id)
+        state.response_id = event["response_id"]
+        response = self.responses.get(event["response_id"])
+        if response is not None and state.item["id"] not in response["output"]:
+            response["output"].append(state.item["id"])
+
+    def _on_output_item_done(self, event: dict) -> None:
+        state = self.items.get(event["item"]["id"])
+        if state is not None:
+            self._update(state, event["item"])
+
+    def _on_content_part_added(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            part = state.part(event["content_index"])
+            part.part_type = event["part"].get("type") or part.part_type
+
+    def _on_content_part_done(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            self._finish_part(state.part(event["content_index"]), event["part"])
+
+    def _on_text_delta(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.part(event["content_index"]).text.append(event["delta"])
+
+    def _on_text_done(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.part(event["content_index"]).text[:] = [event["text"]]
+
+    def _on_transcript_delta(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.part(event["content_index"]).transcript.append(event["delta"])
+
+    def _on_transcript_done(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.part(event["content_index"]).transcript[:] = [event["transcript"]]
+
+    def _on_audio_delta(self, event: dict) -> None:
+        if not self.keep_audio:
+            return
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.part(event["content_index"]).audio += base64.b64decode(event["delta"])
+
+    def _on_arguments_delta(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.arguments.append(event["delta"])
+
+    def _on_arguments_done(self, event: dict) -> None:
+        state = self.items.get(event["item_id"])
+        if state is not None:
+            state.arguments[:] = [event["arguments"]]
+
+    # Queries ===================================================================
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.items
+
+    def item_ids(self) -> Iterator[str]:
+        """Yield the item IDs in conversation order."""
+        item_id = self.first_id
+        while item_id is not None:
+            next_id = self.items[item_id].next_id
+            yield item_id
+            item_id = next_id
+
+    def __iter__(self) -> Iterator[Item]:
+        """Yield the items in conversation order."""
+        for item_id in self.item_ids():
+            yield self.items[item_id].to_model()
+
+    def item(self, item_id: str) -> Item | None:
+        """Get an item by ID, with its content as accumulated so far."""
+        state = self.items.get(item_id)
+        return state.to_model() if state is not None else None
+
+    def response(self, response_id: str) -> Response | None:
+        """Get a response by ID, with the current state of its output items."""
+        response = self.responses.get(response_id)
+        if response is None:
+            return None
+        output = [
+            self.items[item_id].to_model()
+            for item_id in response["output"]
+            if item_id in self.items
+        ]
+        return Response(**{**response, "output": output})
+
+    def text(self, item_id: str) -> str:
+        """Get the text of an item, using transcripts for audio content."""
+        state = self.items.get(item_id)
+        if state is None:
+            return ""
+        return "".join(
+            _PartState._join(part.text) or _PartState._join(part.transcript)
+            for part in state.parts
+        )
+
+    def audio(self, item_id: str, content_index: int = 0) -> bytes:
+        """Get the raw audio of an item's content part."""
+        state = self.items.get(item_id)
+        if state is None or content_index >= len(state.parts):
+            return b""
+        return bytes(state.parts[content_index].audio)
+
+    def clear(self) -> None:
+        self.items.clear()
+        self.responses.clear()
+        self.first_id = self.last_id = None
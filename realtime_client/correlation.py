@@ -0,0 +1,297 @@
+import asyncio
+import itertools
+import os
+import time
+
+from .events import RealtimeClientEvent
+
+ACK_EVENTS: dict[str, str] = {
+    "session.update": "session.updated",
+    "input_audio_buffer.commit": "input_audio_buffer.committed",
+    "input_audio_buffer.clear": "input_audio_buffer.cleared",
+    "conversation.item.create": "conversation.item.created",
+    "conversation.item.delete": "conversation.item.deleted",
+    "conversation.item.truncate": "conversation.item.truncated",
+    "response.create": "response.created",
+}
+"""The server event acknowledging each client event. Other client events have none."""
+
+_ITEM_ACKS = frozenset(
+    (
+        "conversation.item.created",
+        "conversation.item.deleted",
+        "conversation.item.truncated",
+    )
+)
+"""Acknowledgements matched by item ID. The others are matched by order."""
+
+
+class RealtimeAPIError(Exception):
+    """An `error` event returned by the server for a client event.
+
+    Args:
+        error: The `error` object of the event
+        event_type: The type of the client event that failed, if known
+    """
+
+    def __init__(self, error: dict, event_type: str | None = None):
+        self.error = error
+        self.event_type = event_type
+        self.error_type: str | None = error.get("type")
+        self.code: str | None = error.get("code")
+        self.param: str | None = error.get("param")
+        self.event_id: str | None = error.get("event_id")
+        message = error.get("message") or "Unknown error"
+        super().__init__(f"{event_type} failed: {message}" if event_type else message)
+
+    def __reduce__(self):
+        return type(self), (self.error, self.event_type)
+
+
+def _ack_key(event: dict) -> str | None:
+    """The item an acknowledgement refers to, if any."""
+    if "item_id" in event:
+        return event["item_id"]
+    item = event.get("item")
+    return item.get("id") if item else None
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    # Errors are also dispatched as `error` events, handles are not required to be awaited
+    if not future.cancelled():
+        future.exception()
+
+
+class _Entry:
+    __slots__ = ("event_id", "event_type", "ack_type", "key", "future", "deadline")
+
+    def __init__(
+        self,
+        event_id: str,
+        event_type: str,
+        ack_type: str | None,
+        key: str | None,
+        future: asyncio.Future | None,
+        deadline: float,
+    ):
+        self.event_id = event_id
+        self.event_type = event_type
+        self.ack_type = ack_type
+        self.key = key
+        self.future = future
+        self.deadline = deadline
+
+
+class CorrelationTable:
+    """Correlates client events with the server events acknowledging or rejecting them.
+
+    Every sent event gets a cheap, unique `event_id`: a random per-table prefix and a
+    counter. Events are tracked until they are acknowledged, rejected by an `error` event
+    carrying their `event_id`, or evicted after `timeout` seconds.
+
+    Events with an acknowledgement in `ACK_EVENTS` get a future, resolved with the
+    acknowledging event. Acknowledgements carry no `event_id`, so item events are matched
+    by item ID, and the others to the oldest pending event of that type. Events without an
+    acknowledgement resolve their future with None once evicted without an error.
+
+    With turn detection on, the server also commits the input audio buffer and creates
+    responses on its own, which must not acknowledge the client's events. The table
+    follows the session's `turn_detection`: a commit announced by
+    `input_audio_buffer.speech_stopped` is the server's, and unless `create_response` is
+    false, so is the next `response.created`. A `response.create` sent while a server
+    response starts is rejected by the server, and fails with `RealtimeAPIError`.
+
+    Entries are kept in insertion order, so eviction only looks at the oldest entries,
+    driven by a single timer.
+
+    Args:
+        timeout: Seconds after which an unanswered event is evicted
+    """
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._prefix = f"evt_{os.urandom(4).hex()}_"
+        self._counter = itertools.count()
+        self._entries: dict[str, _Entry] = {}
+        self._pending_acks: dict[str, dict[str, _Entry]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._server_commits: set[str] = set()
+        self._server_responses = 0
+
+        self.turn_detection: dict | None = None
+        """The session's turn detection, as last reported by the server."""
+
+        self.acknowledged = 0
+        """Number of events resolved by their acknowledgement."""
+        self.failed = 0
+        """Number of events rejected by an `error` event."""
+        self.timed_out = 0
+        """Number of events with an acknowledgement that were evicted without one."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def next_id(self) -> str:
+        """Generate a new `event_id`."""
+        return f"{self._prefix}{next(self._counter)}"
+
+    def track(self, event: RealtimeClientEvent) -> asyncio.Future:
+        """Track a client event about to be sent, assigning it an `event_id` if it has none.
+
+        A `conversation.item.create` without an item ID is given one, so that it is only
+        acknowledged by the creation of its own item.
+
+        Returns:
+            asyncio.Future: Resolved with the acknowledging server event, or with None for
+                events without one. Fails with `RealtimeAPIError` if the server rejects the
+                event, and with `asyncio.TimeoutError` if no acknowledgement arrives in time.
+        """
+        if event.event_id is None:
+            event.event_id = self.next_id()
+        ack_type = ACK_EVENTS.get(event.event_type)
+        key = None
+        if ack_type == "conversation.item.created":
+            if event.item.id is None:
+                event.item = event.item.model_copy(
+                    update={"id": f"item_{self.next_id()}"}
+                )
+            key = event.item.id
+        elif ack_type in ("conversation.item.deleted", "conversation.item.truncated"):
+            key = event.item_id
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        entry = _Entry(
+            event.event_id, event.event_type, ack_type, key, future, self._deadline()
+        )
+        self._add(entry)
+        return future
+
+    def track_id(self, event_id: str, event_type: str) -> None:
+        """Track an event without a future, e.g. an audio append, to attribute its errors."""
+        self._add(_Entry(event_id, event_type, None, None, None, self._deadline()))
+
+    def discard(self, event_id: str) -> None:
+        """Stop tracking an event, e.g. because it could not be sent."""
+        entry = self._entries.pop(event_id, None)
+        if entry is not None:
+            self._remove_ack(entry)
+            if entry.future is not None and not entry.future.done():
+                entry.future.cancel()
+
+    def on_event(self, event_name: str, event: dict) -> str | None:
+        """Resolve the event acknowledged or rejected by a server event.
+
+        Returns:
+            str | None: The `event_id` of the client event acknowledged or rejected by the
+                server event, if it is tracked
+        """
+        if event_name == "error":
+            error = event.get("error") or {}
+            entry = self._entries.pop(error.get("event_id"), None)
+            if entry is not None:
+                self._remove_ack(entry)
+                self.failed += 1
+                if entry.future is not None and not entry.future.done():
+                    entry.future.set_exception(
+                        RealtimeAPIError(error, entry.event_type)
+                    )
+                return entry.event_id
+            return None
+        if event_name in ("session.created", "session.updated"):
+            self.turn_detection = event["session"].get("turn_detection")
+        elif not self._is_client_ack(event_name, event):
+            return None
+
+        pending = self._pending_acks.get(event_name)
+        if pending:
+            key = _ack_key(event) if event_name in _ITEM_ACKS else None
+            for event_id, entry in pending.items():
+                if entry.key == key:
+                    del pending[event_id]
+                    del self._entries[event_id]
+                    self.acknowledged += 1
+                    if not entry.future.done():
+                        entry.future.set_result(event)
+                    return event_id
+        return None
+
+    def _is_client_ack(self, event_name: str, event: dict) -> bool:
+        """Tell the server's own commits and responses apart from acknowledgements."""
+        if event_name == "input_audio_buffer.speech_stopped":
+            self._server_commits.add(event["item_id"])
+            return False
+        if event_name == "input_audio_buffer.committed":
+            if event["item_id"] not in self._server_commits:
+                return True
+            self._server_commits.discard(event["item_id"])
+            if self.turn_detection is not None and self.turn_detection.get(
+                "create_response", True
+            ):
+                self._server_responses += 1
+            return False
+        if event_name == "response.created" and self._server_responses:
+            self._server_responses -= 1
+            return False
+        return True
+
+    def clear(self, exc: BaseException | None = None) -> None:
+        """Stop tracking every event, failing pending futures with `exc`, or cancelling them."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for entry in self._entries.values():
+            if entry.future is None or entry.future.done():
+                continue
+            if exc is None:
+                entry.future.cancel()
+            else:
+                entry.future.set_exception(exc)
+        self._entries.clear()
+        self._pending_acks.clear()
+        self.reset_server_turns()
+
+    def reset_server_turns(self) -> None:
+        """Forget the server's commits and responses in progress, e.g. when the
+        connection is lost."""
+        self._server_commits.clear()
+        self._server_responses = 0
+
+    def _deadline(self) -> float:
+        return time.monotonic() + self.timeout
+
+    def _add(self, entry: _Entry) -> None:
+        self._entries[entry.event_id] = entry
+        if entry.ack_type is not None:
+            self._pending_acks.setdefault(entry.ack_type, {})[entry.event_id] = entry
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.timeout, self._evict
+            )
+
+    def _remove_ack(self, entry: _Entry) -> None:
+        if entry.ack_type is not None:
+            self._pending_acks[entry.ack_type].pop(entry.event_id, None)
+
+    def _evict(self) -> None:
+        self._timer = None
+        now = time.monotonic()
+        while self._entries:
+            entry = next(iter(self._entries.values()))
+            if entry.deadline > now:
+                self._timer = asyncio.get_running_loop().call_later(
+                    entry.deadline - now, self._evict
+                )
+                return
+            del self._entries[entry.event_id]
+            self._remove_ack(entry)
+            if entry.future is None or entry.future.done():
+                continue
+            if entry.ack_type is None:
+                entry.future.set_result(None)
+            else:
+                self.timed_out += 1
+                entry.future.set_exception(
+                    asyncio.TimeoutError(
+                        f"No {entry.ack_type} for {entry.event_type} {entry.event_id}"
+                    )
+                )
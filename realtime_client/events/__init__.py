@@ -1,6 +1,7 @@
 from typing_extensions import Literal, Union
 
 from .client_events import *
+from .registry import SERVER_EVENT_MODELS, TRUSTED_SERVER_EVENTS, decode_server_event
 from .server_events import *
 
 Event = Union[
@@ -128,3 +129,6 @@ ServerEventName = Literal[
     "response.function_call_arguments.done",
     "rate_limits.updated",
 ]
+
+LifecycleEventName = Literal["reconnecting", "resumed"]
+"""Events emitted by the client itself, rather than received from the server."""
@@ -1,6 +1,7 @@
+import base64
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, field_validator
 
 from .base import ClientEvent
 
@@ -20,7 +21,15 @@ class InputAudioBufferAppend(ClientEvent):
     """The event type, must be 'input_audio_buffer.append'."""
 
     audio: str
-    """Base64-encoded audio bytes. This must be in the format specified by the `input_audio_format` field in the session configuration."""
+    """Base64-encoded audio bytes. This must be in the format specified by the `input_audio_format` field in the session configuration.
+    Raw bytes-like objects are encoded on validation."""
+
+    @field_validator("audio", mode="before")
+    @classmethod
+    def _encode_audio(cls, audio: str | bytes | bytearray | memoryview):
+        if isinstance(audio, (bytes, bytearray, memoryview)):
+            return base64.b64encode(audio).decode()
+        return audio
 
     def dump_json(self, **kwargs):
         """Dump the event to a JSON string, used for sending to the OpenAI Realtime API"""
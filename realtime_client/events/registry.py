@@ -0,0 +1,71 @@
+from .server_events import *
+from .server_events.base import ServerEvent
+
+SERVER_EVENT_MODELS: dict[str, type[ServerEvent]] = {
+    "error": Error,
+    "session.created": SessionCreated,
+    "session.updated": SessionUpdated,
+    "conversation.created": ConversationCreated,
+    "input_audio_buffer.committed": InputAudioBufferCommitted,
+    "input_audio_buffer.cleared": InputAudioBufferCleared,
+    "input_audio_buffer.speech_started": InputAudioBufferSpeechStarted,
+    "input_audio_buffer.speech_stopped": InputAudioBufferSpeechStopped,
+    "conversation.item.created": ConversationItemCreated,
+    "conversation.item.input_audio_transcription.completed": ConversationItemInputAudioTranscriptionCompleted,
+    "conversation.item.input_audio_transcription.failed": ConversationItemInputAudioTranscriptionFailed,
+    "conversation.item.truncated": ConversationItemTruncated,
+    "conversation.item.deleted": ConversationItemDeleted,
+    "response.created": ResponseCreated,
+    "response.done": ResponseDone,
+    "response.output_item.added": ResponseOutputItemAdded,
+    "response.output_item.done": ResponseOutputItemDone,
+    "response.content_part.added": ResponseContentPartAdded,
+    "response.content_part.done": ResponseContentPartDone,
+    "response.text.delta": ResponseTextDelta,
+    "response.text.done": ResponseTextDone,
+    "response.audio_transcript.delta": ResponseAudioTranscriptDelta,
+    "response.audio_transcript.done": ResponseAudioTranscriptDone,
+    "response.audio.delta": ResponseAudioDelta,
+    "response.audio.done": ResponseAudioDone,
+    "response.function_call_arguments.delta": ResponseFunctionCallArgumentsDelta,
+    "response.function_call_arguments.done": ResponseFunctionCallArgumentsDone,
+    "rate_limits.updated": RateLimitsUpdated,
+}
+"""Maps the `type` of every server event to the model used to decode it."""
+
+TRUSTED_SERVER_EVENTS: set[str] = {
+    "response.text.delta",
+    "response.audio_transcript.delta",
+    "response.audio.delta",
+    "response.function_call_arguments.delta",
+}
+"""High-frequency events that are built with `model_construct()`, skipping validation.
+
+These events only carry flat scalar fields, so constructing them from the server payload
+without validation yields the same model at a fraction of the cost.
+"""
+
+
+def decode_server_event(event: dict) -> ServerEvent:
+    """Decode a server event payload into its typed model.
+
+    Events listed in `TRUSTED_SERVER_EVENTS` are constructed without validation, every
+    other event is fully validated.
+
+    Args:
+        event: The event payload dictionary, as parsed from the websocket message
+
+    Returns:
+        ServerEvent: The typed event
+
+    Raises:
+        ValueError: If the event type is not a known server event
+        pydantic.ValidationError: If the payload does not match the event model
+    """
+    event_type = event.get("type")
+    model = SERVER_EVENT_MODELS.get(event_type)
+    if model is None:
+        raise ValueError(f"Unknown server event type: {event_type}")
+    if event_type in TRUSTED_SERVER_EVENTS:
+        return model.model_construct(**event)
+    return model.model_validate(event)
@@ -19,8 +19,8 @@ class ConversationItemCreated(ServerEvent):
     )
     """The event type, must be 'conversation.item.created'."""
 
-    previous_item_id: str
-    """The ID of the preceding item in the Conversation context, allows the client to understand the order of the conversation."""
+    previous_item_id: str | None = None
+    """The ID of the preceding item in the Conversation context, allows the client to understand the order of the conversation. None for the first item."""
 
     item: Item
     """The item that was created."""
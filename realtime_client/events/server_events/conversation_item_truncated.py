@@ -19,7 +19,7 @@ class ConversationItemTruncated(ServerEvent):
     item_id: str
     """The ID of the assistant message item that was truncated."""
 
-    context_index: int
+    content_index: int
     """The index of the content part that was truncated."""
 
     audio_end_ms: int
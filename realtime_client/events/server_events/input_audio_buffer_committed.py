@@ -15,8 +15,8 @@ class InputAudioBufferCommitted(ServerEvent):
     )
     """The event type, must be 'input_audio_buffer.committed'."""
 
-    previous_item_id: str
-    """The ID of the preceding item after which the new item will be inserted."""
+    previous_item_id: str | None = None
+    """The ID of the preceding item after which the new item will be inserted. None if the conversation is empty."""
 
     item_id: str
     """The ID of the user message item that will be created."""
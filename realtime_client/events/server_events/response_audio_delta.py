@@ -1,3 +1,5 @@
+import base64
+from functools import cached_property
 from typing import Literal
 
 from pydantic import Field
@@ -27,3 +29,8 @@ class ResponseAudioDelta(ServerEvent):
 
     delta: str
     """Base64-encoded audio data delta."""
+
+    @cached_property
+    def audio(self) -> bytes:
+        """The raw audio bytes of `delta`, decoded on first access."""
+        return base64.b64decode(self.delta)
@@ -0,0 +1,269 @@
+"""A compact binary journal of a session's events, to replay it offline.
+
+A journal starts with a `MAGIC` header and the wall-clock time the recording started,
+followed by one frame per event:
+
+- a `FRAME_HEADER`: payload length, seconds since the recording started (monotonic),
+  direction (0 for server events, 1 for client events) and encoding
+- the payload. Encoded as `JSON`, it is the event as received or sent. Encoded as
+  `JSON_PCM`, the audio field of the event is emptied, and the payload is the length of
+  the JSON, the JSON, and the raw PCM bytes of the audio.
+
+Example:
+    ```python
+    >>> with JournalRecorder("session.rtj") as recorder:
+    >>>     async with RealtimeClient(recorder=recorder) as client:
+    >>>         ...
+    >>>
+    >>> with JournalReplayer("session.rtj") as replayer:
+    >>>     client = RealtimeClient(api_key="offline")
+    >>>     client.on("response.audio.delta", play)
+    >>>     await replayer.replay(client, speed=None)
+    ```
+"""
+
+import asyncio
+import binascii
+import json
+import mmap
+import os
+import struct
+import time
+
+from typing_extensions import TYPE_CHECKING, Literal, NamedTuple, TypedDict
+
+if TYPE_CHECKING:
+    from .realtime_client import RealtimeClient
+
+MAGIC = b"RTJ1"
+FILE_HEADER = struct.Struct("<4sd")
+FRAME_HEADER = struct.Struct("<IdBB")
+_JSON_LENGTH = struct.Struct("<I")
+
+JSON = 0
+JSON_PCM = 1
+
+Direction = Literal["server", "client"]
+_DIRECTIONS: tuple[Direction, Direction] = ("server", "client")
+
+_AUDIO_FIELDS = {
+    "response.audio.delta": "delta",
+    "input_audio_buffer.append": "audio",
+}
+"""The base64 audio field of each event type, stored as raw PCM."""
+
+
+class JournalRecorder:
+    """Writes the events of a client to a journal file.
+
+    Pass it to `RealtimeClient(recorder=...)`, which records every server event as it is
+    received and every client event as it is written to the websocket. Frames go through
+    a large write buffer, so recording costs one `struct.pack()` and a buffered write per
+    event, plus a base64 decode for audio events.
+
+    Args:
+        path: The journal file to create
+        buffer_size: Size of the write buffer, in bytes
+    """
+
+    def __init__(self, path: str | os.PathLike, buffer_size: int = 1 << 20):
+        self.path = path
+        self.file = open(path, "wb", buffering=buffer_size)
+        self.started_at = time.monotonic()
+        self.file.write(FILE_HEADER.pack(MAGIC, time.time()))
+
+        self.events = 0
+        """Number of events recorded."""
+        self.pcm_bytes = 0
+        """Bytes of audio stored as raw PCM instead of base64."""
+
+    def __enter__(self) -> "JournalRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def record_server(self, message: str | bytes, event: dict) -> None:
+        """Record a server event, given as the received message and its decoded dict."""
+        self._record(0, event["type"], message, event)
+
+    def record_client(self, event_type: str, frame: str) -> None:
+        """Record a client event, given as the serialized frame sent to the server."""
+        self._record(1, event_type, frame, None)
+
+    def _record(
+        self, direction: int, event_type: str, message: str | bytes, event: dict | None
+    ) -> None:
+        if self.file.closed:
+            return
+        timestamp = time.monotonic() - self.started_at
+        field = _AUDIO_FIELDS.get(event_type)
+        if field is None:
+            payload = message.encode() if isinstance(message, str) else message
+            encoding = JSON
+        else:
+            metadata, audio = _split_audio(message, event, field)
+            payload = b"".join((_JSON_LENGTH.pack(len(metadata)), metadata, audio))
+            encoding = JSON_PCM
+            self.pcm_bytes += len(audio)
+        self.file.write(FRAME_HEADER.pack(len(payload), timestamp, direction, encoding))
+        self.file.write(payload)
+        self.events += 1
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+
+def _split_audio(
+    message: str | bytes, event: dict | None, field: str
+) -> tuple[bytes, bytes]:
+    """Split an audio event into its JSON, with the audio field emptied, and its PCM.
+
+    The base64 string is cut out of the message text, which is much cheaper than
+    encoding the event again. Base64 has no quotes, so the string ends at the next one.
+    """
+    if isinstance(message, str):
+        key = f'"{field}":"'
+        start = message.find(key)
+        if start >= 0:
+            start += len(key)
+            end = message.find('"', start)
+            metadata = message[:start] + message[end:]
+            return metadata.encode(), binascii.a2b_base64(message[start:end])
+    if event is None:
+        event = json.loads(message)
+    metadata = json.dumps({**event, field: ""}, separators=(",", ":"))
+    return metadata.encode(), binascii.a2b_base64(event[field])
+
+
+class JournalEntry(NamedTuple):
+    timestamp: float
+    """Seconds since the recording started."""
+    direction: Direction
+    event: dict
+
+
+class ReplayStats(TypedDict):
+    events: int
+    duration: float
+    """Wall-clock duration of the replay, in seconds."""
+    max_lag: float
+    """Largest delay of an event behind its original timing, in seconds. 0 when replaying
+    as fast as possible."""
+
+
+class JournalReplayer:
+    """Reads a journal through `mmap` and replays its server events into a client.
+
+    Frames are decoded one at a time from the mapped file, so a journal of any size is
+    replayed without loading it in memory. A frame cut short by an interrupted recording
+    ends the journal.
+
+    Args:
+        path: The journal file to read
+
+    Raises:
+        ValueError: If the file is not a journal
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.map) < FILE_HEADER.size:
+            self.map.close()
+            raise ValueError(f"{path} is not a journal")
+        magic, self.started_at = FILE_HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not a journal")
+
+    def __enter__(self) -> "JournalReplayer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __iter__(self):
+        return self.entries()
+
+    def entries(self, direction: Direction | None = None):
+        """Iterate over the decoded events of the journal.
+
+        Args:
+            direction: Only yield the events of this direction. None for both.
+
+        Yields:
+            JournalEntry: The events, in the order they were recorded
+        """
+        data = self.map
+        offset = FILE_HEADER.size
+        end = len(data)
+        while offset + FRAME_HEADER.size <= end:
+            length, timestamp, direction_index, encoding = FRAME_HEADER.unpack_from(
+                data, offset
+            )
+            start = offset + FRAME_HEADER.size
+            offset = start + length
+            if offset > end:
+                return
+            entry_direction = _DIRECTIONS[direction_index]
+            if direction is not None and entry_direction != direction:
+                continue
+            yield JournalEntry(
+                timestamp, entry_direction, _decode(data, start, offset, encoding)
+            )
+
+    async def replay(
+        self, client: "RealtimeClient", speed: float | None = 1.0
+    ) -> ReplayStats:
+        """Feed the server events of the journal to `client.emit()`.
+
+        The client does not need to be connected, but handlers that send events will fail.
+
+        Args:
+            client: The client whose handlers and trackers receive the events
+            speed: Playback speed relative to the original timing, e.g. 2.0 for twice as
+                fast. None replays as fast as possible, only yielding to the event loop
+                between events.
+
+        Returns:
+            ReplayStats: The number of events, duration and timing accuracy of the replay
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        first: float | None = None
+        events = 0
+        max_lag = 0.0
+        for timestamp, _, event in self.entries("server"):
+            if speed is not None:
+                if first is None:
+                    first = timestamp
+                due = start + (timestamp - first) / speed
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                max_lag = max(max_lag, loop.time() - due)
+            else:
+                await asyncio.sleep(0)
+            await client.emit(event["type"], event)
+            events += 1
+        return {"events": events, "duration": loop.time() - start, "max_lag": max_lag}
+
+    def close(self) -> None:
+        self.map.close()
+
+
+def _decode(data: mmap.mmap, start: int, end: int, encoding: int) -> dict:
+    if encoding == JSON:
+        return json.loads(data[start:end])
+    (length,) = _JSON_LENGTH.unpack_from(data, start)
+    metadata_end = start + _JSON_LENGTH.size + length
+    event = json.loads(data[start + _JSON_LENGTH.size : metadata_end])
+    audio = binascii.b2a_base64(data[metadata_end:end], newline=False).decode()
+    event[_AUDIO_FIELDS[event["type"]]] = audio
+    return event
@@ -0,0 +1,347 @@
+import asyncio
+import time
+from collections import deque
+
+from typing_extensions import Literal, TypedDict
+
+from .utils.logger import RealtimeClientLogger
+
+_SUB_BUCKETS = 128
+_HALF_SUB_BUCKETS = _SUB_BUCKETS // 2
+
+
+class HistogramSummary(TypedDict):
+    count: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """A log-linear histogram of durations, in the style of HdrHistogram.
+
+    Durations are recorded in microseconds into buckets whose width grows with the value,
+    which keeps the relative error of every percentile under 1.6% with a small number of
+    counters and O(1) recording.
+    """
+
+    def __init__(self):
+        self.counts: list[int] = []
+        self.count = 0
+        self.max = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < _SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - 7
+        return _SUB_BUCKETS + (shift - 1) * _HALF_SUB_BUCKETS + (value >> shift) - 64
+
+    @staticmethod
+    def _value(index: int) -> int:
+        """The highest value counted by the bucket at `index`."""
+        if index < _SUB_BUCKETS:
+            return index
+        shift, sub = divmod(index - _SUB_BUCKETS, _HALF_SUB_BUCKETS)
+        shift += 1
+        return ((sub + 64 + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record a duration, in seconds."""
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram to this one."""
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.count = 0
+        self.max = 0
+
+    def percentile(self, percentile: float) -> float:
+        """Get a percentile of the recorded durations, in milliseconds."""
+        if not self.count:
+            return 0.0
+        target = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._value(index), self.max) / 1000
+        return self.max / 1000
+
+    def summary(self) -> HistogramSummary:
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max / 1000,
+        }
+
+
+class RollingHistogram:
+    """A `LatencyHistogram` covering only the last `window` seconds.
+
+    The window is split into `slices` histograms. Recording goes to the newest slice, and
+    the oldest slice is dropped whenever a new one starts.
+
+    Args:
+        window: Duration covered by the histogram, in seconds
+        slices: Number of slices the window is split into
+    """
+
+    def __init__(self, window: float = 300, slices: int = 10):
+        self.slice_duration = window / slices
+        self.slices: deque[LatencyHistogram] = deque(
+            [LatencyHistogram()], maxlen=slices
+        )
+        self.slice_started = time.monotonic()
+
+    def _rotate(self) -> None:
+        now = time.monotonic()
+        elapsed = int((now - self.slice_started) // self.slice_duration)
+        if elapsed:
+            for _ in range(min(elapsed, self.slices.maxlen)):
+                self.slices.append(LatencyHistogram())
+            self.slice_started += elapsed * self.slice_duration
+
+    def record(self, seconds: float) -> None:
+        self._rotate()
+        self.slices[-1].record(seconds)
+
+    def snapshot(self) -> LatencyHistogram:
+        """Get a histogram of the durations recorded in the window."""
+        self._rotate()
+        histogram = LatencyHistogram()
+        for histogram_slice in self.slices:
+            histogram.merge(histogram_slice)
+        return histogram
+
+
+TurnMetric = Literal[
+    "commit_to_committed",
+    "commit_to_response_created",
+    "time_to_first_audio",
+    "time_to_first_text",
+    "response_duration",
+]
+
+
+class TurnTimeline(TypedDict):
+    """Monotonic timestamps, in seconds, of the milestones of a single turn."""
+
+    response_id: str | None
+    item_id: str | None
+    commit_sent: float | None
+    committed: float | None
+    response_requested: float | None
+    response_created: float | None
+    first_audio: float | None
+    first_text: float | None
+    done: float | None
+    status: str | None
+    """The status of the response once done, e.g. "completed" or "cancelled"."""
+
+
+def _new_timeline() -> TurnTimeline:
+    return {
+        "response_id": None,
+        "item_id": None,
+        "commit_sent": None,
+        "committed": None,
+        "response_requested": None,
+        "response_created": None,
+        "first_audio": None,
+        "first_text": None,
+        "done": None,
+        "status": None,
+    }
+
+
+class LatencyTracker:
+    """Records the timeline of every turn and aggregates it into rolling histograms.
+
+    A turn starts when the input audio buffer is committed (or a response is requested
+    without a commit), and is matched to the next `response.created`. Its timelines are
+    keyed by `item_id` until then, and by `response_id` afterwards. Time to first audio and
+    first text are measured from the commit, or from `response.create` if there was none.
+    The response duration is only recorded for responses that were not cancelled or
+    failed.
+
+    At most `history` turns are tracked in progress. Older ones are evicted, and
+    `reset_pending()` drops them all when the connection is lost.
+
+    Args:
+        window: Duration covered by the histograms, in seconds
+        history: Number of completed timelines to keep
+    """
+
+    def __init__(self, window: float = 300, history: int = 100):
+        self.histograms: dict[TurnMetric, RollingHistogram] = {
+            metric: RollingHistogram(window) for metric in TurnMetric.__args__
+        }
+        self.completed: deque[TurnTimeline] = deque(maxlen=history)
+        self.by_item_id: dict[str, TurnTimeline] = {}
+        self.by_response_id: dict[str, TurnTimeline] = {}
+        self._pending: TurnTimeline | None = None
+        self._handlers = {
+            "input_audio_buffer.committed": self._on_committed,
+            "response.created": self._on_response_created,
+            "response.audio.delta": self._on_audio_delta,
+            "response.text.delta": self._on_text_delta,
+            "response.audio_transcript.delta": self._on_text_delta,
+            "response.done": self._on_response_done,
+        }
+        self.report_task: asyncio.Task | None = None
+
+    def mark_commit_sent(self) -> None:
+        """Record that `input_audio_buffer.commit` was sent."""
+        self._pending = _new_timeline()
+        self._pending["commit_sent"] = time.monotonic()
+
+    def mark_response_requested(self) -> None:
+        """Record that `response.create` was sent."""
+        if self._pending is None:
+            self._pending = _new_timeline()
+        self._pending["response_requested"] = time.monotonic()
+
+    def on_event(self, event_name: str, event: dict) -> None:
+        """Update the timelines from a server event."""
+        handler = self._handlers.get(event_name)
+        if handler is not None:
+            handler(event)
+
+    def _on_committed(self, event: dict) -> None:
+        timeline = self._pending
+        if timeline is None or timeline["committed"] is not None:
+            # Committed by server VAD, there is no client-side commit time
+            timeline = self._pending = _new_timeline()
+        timeline["committed"] = time.monotonic()
+        timeline["item_id"] = event["item_id"]
+        self.by_item_id[event["item_id"]] = timeline
+        if len(self.by_item_id) > self.completed.maxlen:
+            # Drop the oldest commit that never got a response
+            del self.by_item_id[next(iter(self.by_item_id))]
+        if timeline["commit_sent"] is not None:
+            self.histograms["commit_to_committed"].record(
+                timeline["committed"] - timeline["commit_sent"]
+            )
+
+    def _on_response_created(self, event: dict) -> None:
+        timeline = self._pending or _new_timeline()
+        self._pending = None
+        timeline["response_created"] = time.monotonic()
+        timeline["response_id"] = event["response"]["id"]
+        self.by_response_id[timeline["response_id"]] = timeline
+        if len(self.by_response_id) > self.completed.maxlen:
+            # Drop the oldest response that never got a response.done
+            del self.by_response_id[next(iter(self.by_response_id))]
+        if timeline["commit_sent"] is not None:
+            self.histograms["commit_to_response_created"].record(
+                timeline["response_created"] - timeline["commit_sent"]
+            )
+
+    def _start(self, timeline: TurnTimeline) -> float | None:
+        return timeline["commit_sent"] or timeline["response_requested"]
+
+    def _on_audio_delta(self, event: dict) -> None:
+        timeline = self.by_response_id.get(event["response_id"])
+        if timeline is not None and timeline["first_audio"] is None:
+            timeline["first_audio"] = time.monotonic()
+            if (start := self._start(timeline)) is not None:
+                self.histograms["time_to_first_audio"].record(
+                    timeline["first_audio"] - start
+                )
+
+    def _on_text_delta(self, event: dict) -> None:
+        timeline = self.by_response_id.get(event["response_id"])
+        if timeline is not None and timeline["first_text"] is None:
+            timeline["first_text"] = time.monotonic()
+            if (start := self._start(timeline)) is not None:
+                self.histograms["time_to_first_text"].record(
+                    timeline["first_text"] - start
+                )
+
+    def _on_response_done(self, event: dict) -> None:
+        response = event["response"]
+        timeline = self.by_response_id.pop(response["id"], None)
+        if timeline is None:
+            return
+        timeline["done"] = time.monotonic()
+        timeline["status"] = response.get("status")
+        if timeline["item_id"] is not None:
+            self.by_item_id.pop(timeline["item_id"], None)
+        if timeline["status"] not in ("cancelled", "failed"):
+            self.histograms["response_duration"].record(
+                timeline["done"] - timeline["response_created"]
+            )
+        self.completed.append(timeline)
+
+    def reset_pending(self) -> None:
+        """Drop the turns in progress, e.g. when the connection is lost, since their
+        responses will never be done."""
+        self.by_item_id.clear()
+        self.by_response_id.clear()
+        self._pending = None
+
+    def timeline(self, response_id: str) -> TurnTimeline | None:
+        """Get the timeline of an in-progress or recently completed response."""
+        timeline = self.by_response_id.get(response_id)
+        if timeline is not None:
+            return timeline
+        for timeline in self.completed:
+            if timeline["response_id"] == response_id:
+                return timeline
+        return None
+
+    def summary(self) -> dict[TurnMetric, HistogramSummary]:
+        """Get the percentiles of every metric over the rolling window, in milliseconds."""
+        return {
+            metric: histogram.snapshot().summary()
+            for metric, histogram in self.histograms.items()
+        }
+
+    def format_summary(self) -> str:
+        lines = []
+        for metric, summary in self.summary().items():
+            if summary["count"]:
+                lines.append(
+                    f"{metric}: n={summary['count']} p50={summary['p50']:.1f}ms "
+                    f"p90={summary['p90']:.1f}ms p99={summary['p99']:.1f}ms "
+                    f"max={summary['max']:.1f}ms"
+                )
+        return "\n".join(lines)
+
+    def start_reporting(
+        self, logger: RealtimeClientLogger, interval: float = 60
+    ) -> None:
+        """Log the summary every `interval` seconds until `stop_reporting()` is called."""
+        self.stop_reporting()
+        self.report_task = asyncio.create_task(self._report(logger, interval))
+
+    def stop_reporting(self) -> None:
+        if self.report_task is not None:
+            self.report_task.cancel()
+            self.report_task = None
+
+    async def _report(self, logger: RealtimeClientLogger, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            summary = self.format_summary()
+            if summary:
+                logger.info(f"Turn latency over the last window:\n{summary}")
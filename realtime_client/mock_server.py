@@ -0,0 +1,536 @@
+"""A local stand-in for the OpenAI Realtime API, for offline tests and benchmarks.
+
+Example:
+    ```python
+    >>> async with MockRealtimeServer(script=ResponseScript(audio_ms=2000)) as server:
+    >>>     async with RealtimeClient(uri=server.uri, api_key="mock") as client:
+    >>>         await client.response_create()
+    >>>         await client.wait_for("response.done")
+    ```
+
+Run `python -m realtime_client.mock_server` to serve it standalone.
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import math
+import struct
+
+from websockets import ConnectionClosed
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+SAMPLE_RATE = 24000
+
+
+class ResponseScript:
+    """Describes the response the mock server streams for every `response.create`.
+
+    Args:
+        text: Text of the response, streamed as text or transcript deltas
+        audio_ms: Duration of the response audio, in milliseconds. 0 for no audio.
+        audio_chunk_ms: Duration of the audio carried by each `response.audio.delta`
+        text_chunk_chars: Characters carried by each text or transcript delta
+        deltas_per_second: Rate at which deltas are sent. If None, as fast as possible.
+        first_delta_delay_ms: Delay between `response.created` and the first delta
+        function_calls: Calls made by the response, as `(name, arguments)` pairs, instead
+            of a message. Once their outputs are sent, the next response is a message.
+    """
+
+    def __init__(
+        self,
+        text: str = "Hello! This is a scripted response from the mock Realtime server.",
+        audio_ms: int = 1000,
+        audio_chunk_ms: int = 40,
+        text_chunk_chars: int = 8,
+        deltas_per_second: float | None = None,
+        first_delta_delay_ms: float = 0,
+        function_calls: list[tuple[str, dict]] | None = None,
+    ):
+        self.text = text
+        self.audio_ms = audio_ms
+        self.audio_chunk_ms = audio_chunk_ms
+        self.text_chunk_chars = text_chunk_chars
+        self.deltas_per_second = deltas_per_second
+        self.first_delta_delay_ms = first_delta_delay_ms
+        self.function_calls = function_calls or []
+
+        # A 440 Hz tone, encoded once and reused for every audio delta
+        samples = SAMPLE_RATE * audio_chunk_ms // 1000
+        pcm = struct.pack(
+            f"<{samples}h",
+            *(
+                int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE))
+                for i in range(samples)
+            ),
+        )
+        self.audio_chunk = base64.b64encode(pcm).decode()
+        self.audio_chunks = math.ceil(audio_ms / audio_chunk_ms) if audio_ms else 0
+
+    def text_chunks(self) -> list[str]:
+        size = self.text_chunk_chars
+        return [self.text[i : i + size] for i in range(0, len(self.text), size)]
+
+
+class _MockSession:
+    """Protocol state of a single client connection."""
+
+    def __init__(self, server: "MockRealtimeServer", ws: ServerConnection):
+        self.server = server
+        self.ws = ws
+        self.ids = itertools.count(1)
+        self.session = {
+            "id": f"sess_{id(self):x}",
+            "object": "realtime.session",
+            "model": "mock-realtime",
+            "modalities": ["text", "audio"],
+            "instructions": "",
+            "voice": "alloy",
+            "input_audio_format": "pcm16",
+            "output_audio_format": "pcm16",
+            "input_audio_transcription": None,
+            "turn_detection": None,
+            "tools": [],
+            "tool_choice": "auto",
+            "temperature": 0.8,
+            "max_response_output_tokens": "inf",
+        }
+        self.items: list[str] = []
+        self.last_item_type: str | None = None
+        self.input_audio_bytes = 0
+        self.response_task: asyncio.Task | None = None
+        self.response_created = asyncio.Event()
+
+    def next_id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self.ids)}"
+
+    async def send(self, event_type: str, **fields) -> None:
+        event = {"type": event_type, "event_id": self.next_id("event"), **fields}
+        await self.ws.send(json.dumps(event))
+
+    async def run(self) -> None:
+        await self.send("session.created", session=self.session)
+        await self.send(
+            "conversation.created",
+            conversation={
+                "id": self.next_id("conv"),
+                "object": "realtime.conversation",
+            },
+        )
+        try:
+            async for message in self.ws:
+                event = json.loads(message)
+                self.server.events_received += 1
+                await self.handle(event)
+        except ConnectionClosed:
+            pass
+        finally:
+            if self.response_task is not None:
+                self.response_task.cancel()
+
+    async def error(self, event: dict, message: str, code: str | None = None) -> None:
+        await self.send(
+            "error",
+            error={
+                "type": "invalid_request_error",
+                "code": code,
+                "message": message,
+                "param": None,
+                "event_id": event.get("event_id"),
+            },
+        )
+
+    def previous_item_id(self) -> str | None:
+        return self.items[-1] if self.items else None
+
+    async def create_item(self, item: dict) -> dict:
+        item = {"object": "realtime.item", "status": "completed", **item}
+        item.setdefault("id", self.next_id("item"))
+        previous_item_id = self.previous_item_id()
+        self.items.append(item["id"])
+        self.last_item_type = item.get("type")
+        await self.send(
+            "conversation.item.created", previous_item_id=previous_item_id, item=item
+        )
+        return item
+
+    async def handle(self, event: dict) -> None:
+        event_type = event.get("type")
+        if event_type == "session.update":
+            self.session.update(event.get("session", {}))
+            await self.send("session.updated", session=self.session)
+        elif event_type == "input_audio_buffer.append":
+            self.input_audio_bytes += len(event.get("audio", "")) * 3 // 4
+            self.server.audio_bytes_received += len(event.get("audio", "")) * 3 // 4
+            if self.session["turn_detection"] is not None:
+                await self.detect_turn()
+        elif event_type == "input_audio_buffer.commit":
+            if not self.input_audio_bytes:
+                await self.error(event, "Input audio buffer is empty", "buffer_empty")
+                return
+            item_id = self.next_id("item")
+            await self.send(
+                "input_audio_buffer.committed",
+                previous_item_id=self.previous_item_id(),
+                item_id=item_id,
+            )
+            self.input_audio_bytes = 0
+            await self.create_item(
+                {
+                    "id": item_id,
+                    "type": "message",
+                    "role": "user",
+                    "content": [{"type": "input_audio", "transcript": None}],
+                }
+            )
+        elif event_type == "input_audio_buffer.clear":
+            self.input_audio_bytes = 0
+            await self.send("input_audio_buffer.cleared")
+        elif event_type == "conversation.item.create":
+            await self.create_item(event["item"])
+        elif event_type == "conversation.item.delete":
+            if event["item_id"] not in self.items:
+                await self.error(event, f"Item {event['item_id']} does not exist")
+                return
+            self.items.remove(event["item_id"])
+            await self.send("conversation.item.deleted", item_id=event["item_id"])
+        elif event_type == "conversation.item.truncate":
+            await self.send(
+                "conversation.item.truncated",
+                item_id=event["item_id"],
+                content_index=event["content_index"],
+                audio_end_ms=event["audio_end_ms"],
+            )
+        elif event_type == "response.create":
+            if self.response_task is not None and not self.response_task.done():
+                await self.error(event, "A response is already in progress")
+                return
+            config = {**self.session, **(event.get("response") or {})}
+            self.response_task = asyncio.create_task(self.respond(config))
+        elif event_type == "response.cancel":
+            if self.response_task is not None:
+                self.response_task.cancel()
+        else:
+            await self.error(event, f"Unknown event type: {event_type}")
+
+    async def detect_turn(self) -> None:
+        """Commit the buffered audio as server VAD would at the end of speech.
+
+        The mock has no voice detection: with turn detection on, every append is a whole
+        turn. A response is then created unless `create_response` is false, or a response
+        is already in progress.
+        """
+        item_id = self.next_id("item")
+        await self.send(
+            "input_audio_buffer.speech_started", audio_start_ms=0, item_id=item_id
+        )
+        audio_end_ms = self.input_audio_bytes * 1000 // (SAMPLE_RATE * 2)
+        await self.send(
+            "input_audio_buffer.speech_stopped",
+            audio_end_ms=audio_end_ms,
+            item_id=item_id,
+        )
+        await self.send(
+            "input_audio_buffer.committed",
+            previous_item_id=self.previous_item_id(),
+            item_id=item_id,
+        )
+        self.input_audio_bytes = 0
+        await self.create_item(
+            {
+                "id": item_id,
+                "type": "message",
+                "role": "user",
+                "content": [{"type": "input_audio", "transcript": None}],
+            }
+        )
+        if not self.session["turn_detection"].get("create_response", True):
+            return
+        if self.response_task is None or self.response_task.done():
+            self.response_created.clear()
+            self.response_task = asyncio.create_task(self.respond(self.session))
+            # Like the real server, create the response before handling the next event
+            created = asyncio.create_task(self.response_created.wait())
+            await asyncio.wait(
+                (self.response_task, created), return_when=asyncio.FIRST_COMPLETED
+            )
+            created.cancel()
+
+    async def respond(self, config: dict) -> None:
+        try:
+            await self._respond(config)
+        except ConnectionClosed:
+            pass
+
+    async def _respond(self, config: dict) -> None:
+        script = self.server.script
+        if script.function_calls and self.last_item_type != "function_call_output":
+            await self._respond_function_calls()
+            return
+        audio = "audio" in config["modalities"] and script.audio_chunks > 0
+        response_id = self.next_id("resp")
+        item_id = self.next_id("item")
+        response = {
+            "id": response_id,
+            "object": "realtime.response",
+            "status": "in_progress",
+            "status_details": None,
+            "output": [],
+            "usage": None,
+        }
+        await self.send("response.created", response=response)
+        self.response_created.set()
+        item = {
+            "id": item_id,
+            "object": "realtime.item",
+            "type": "message",
+            "status": "in_progress",
+            "role": "assistant",
+            "content": [],
+        }
+        await self.send(
+            "response.output_item.added",
+            response_id=response_id,
+            output_index=0,
+            item=item,
+        )
+        previous_item_id = self.previous_item_id()
+        self.items.append(item_id)
+        self.last_item_type = "message"
+        await self.send(
+            "conversation.item.created", previous_item_id=previous_item_id, item=item
+        )
+        part = {"type": "audio", "transcript": ""} if audio else {"type": "text"}
+        location = {
+            "response_id": response_id,
+            "item_id": item_id,
+            "output_index": 0,
+            "content_index": 0,
+        }
+        await self.send("response.content_part.added", **location, part=part)
+
+        status = "completed"
+        try:
+            if script.first_delta_delay_ms:
+                await asyncio.sleep(script.first_delta_delay_ms / 1000)
+            await self.stream_deltas(location, audio)
+        except asyncio.CancelledError:
+            status = "cancelled"
+
+        text_event = "response.audio_transcript.done" if audio else "response.text.done"
+        text_field = "transcript" if audio else "text"
+        await self.send(text_event, **location, **{text_field: script.text})
+        if audio:
+            await self.send("response.audio.done", **location)
+        part = {**part, text_field: script.text}
+        await self.send("response.content_part.done", **location, part=part)
+        item = {**item, "status": "completed", "content": [part]}
+        await self.send(
+            "response.output_item.done",
+            response_id=response_id,
+            output_index=0,
+            item=item,
+        )
+        response = {**response, "status": status, "output": [item]}
+        await self.send("response.done", response=response)
+
+    async def _respond_function_calls(self) -> None:
+        script = self.server.script
+        response_id = self.next_id("resp")
+        response = {
+            "id": response_id,
+            "object": "realtime.response",
+            "status": "in_progress",
+            "status_details": None,
+            "output": [],
+            "usage": None,
+        }
+        await self.send("response.created", response=response)
+        self.response_created.set()
+        output = []
+        status = "completed"
+        try:
+            for output_index, (name, arguments) in enumerate(script.function_calls):
+                item = {
+                    "id": self.next_id("item"),
+                    "object": "realtime.item",
+                    "type": "function_call",
+                    "status": "in_progress",
+                    "name": name,
+                    "call_id": self.next_id("call"),
+                    "arguments": "",
+                }
+                location = {
+                    "response_id": response_id,
+                    "item_id": item["id"],
+                    "output_index": output_index,
+                    "call_id": item["call_id"],
+                }
+                await self.send(
+                    "response.output_item.added",
+                    response_id=response_id,
+                    output_index=output_index,
+                    item=item,
+                )
+                previous_item_id = self.previous_item_id()
+                self.items.append(item["id"])
+                self.last_item_type = "function_call"
+                await self.send(
+                    "conversation.item.created",
+                    previous_item_id=previous_item_id,
+                    item=item,
+                )
+                encoded = json.dumps(arguments)
+                size = script.text_chunk_chars
+                for i in range(0, len(encoded), size):
+                    await self.send(
+                        "response.function_call_arguments.delta",
+                        **location,
+                        delta=encoded[i : i + size],
+                    )
+                    self.server.deltas_sent += 1
+                    await asyncio.sleep(
+                        1 / script.deltas_per_second if script.deltas_per_second else 0
+                    )
+                await self.send(
+                    "response.function_call_arguments.done",
+                    **location,
+                    arguments=encoded,
+                )
+                item = {**item, "status": "completed", "arguments": encoded}
+                await self.send(
+                    "response.output_item.done",
+                    response_id=response_id,
+                    output_index=output_index,
+                    item=item,
+                )
+                output.append(item)
+        except asyncio.CancelledError:
+            status = "cancelled"
+        response = {**response, "status": status, "output": output}
+        await self.send("response.done", response=response)
+
+    async def stream_deltas(self, location: dict, audio: bool) -> None:
+        script = self.server.script
+        text_event = (
+            "response.audio_transcript.delta" if audio else "response.text.delta"
+        )
+        text_chunks = script.text_chunks()
+        audio_chunks = script.audio_chunks if audio else 0
+        interval = 1 / script.deltas_per_second if script.deltas_per_second else 0
+        loop = asyncio.get_running_loop()
+        next_send = loop.time()
+        for index in range(max(len(text_chunks), audio_chunks)):
+            if index < audio_chunks:
+                await self.send(
+                    "response.audio.delta", **location, delta=script.audio_chunk
+                )
+                self.server.deltas_sent += 1
+            if index < len(text_chunks):
+                await self.send(text_event, **location, delta=text_chunks[index])
+                self.server.deltas_sent += 1
+            if interval:
+                next_send += interval
+                await asyncio.sleep(max(0, next_send - loop.time()))
+            else:
+                # Let the connection flush and other sessions run
+                await asyncio.sleep(0)
+
+
+class MockRealtimeServer:
+    """A websocket server speaking the subset of the Realtime protocol used by the client.
+
+    It answers `session.update`, accepts audio appends and commits, manages conversation
+    items, and streams the scripted response for every `response.create`, which can be
+    cancelled with `response.cancel`. Unknown events are answered with an `error` event.
+
+    Args:
+        host: Interface to bind to
+        port: Port to bind to. 0 picks a free port, see `uri`.
+        script: The response streamed for every `response.create`
+        reuse_port: Let several server processes listen on the same port, so that the
+            kernel spreads connections across them
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        script: ResponseScript | None = None,
+        reuse_port: bool = False,
+    ):
+        self.host = host
+        self.port = port
+        self.script = script or ResponseScript()
+        self.reuse_port = reuse_port
+        self.server: Server | None = None
+        self.sessions: set[_MockSession] = set()
+
+        self.events_received = 0
+        self.audio_bytes_received = 0
+        self.deltas_sent = 0
+
+    @property
+    def uri(self) -> str:
+        """The URI to pass to `RealtimeClient`."""
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self.server = await serve(
+            self._handle,
+            self.host,
+            self.port,
+            max_size=None,
+            reuse_port=self.reuse_port or None,
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def __aenter__(self) -> "MockRealtimeServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
+
+    async def _handle(self, ws: ServerConnection) -> None:
+        session = _MockSession(self, ws)
+        self.sessions.add(session)
+        try:
+            await session.run()
+        finally:
+            self.sessions.discard(session)
+
+
+async def _serve_forever(args: argparse.Namespace) -> None:
+    script = ResponseScript(
+        audio_ms=args.audio_ms,
+        audio_chunk_ms=args.audio_chunk_ms,
+        deltas_per_second=args.rate,
+    )
+    async with MockRealtimeServer(
+        args.host, args.port, script, args.reuse_port
+    ) as server:
+        print(f"Mock Realtime server listening on {server.uri}")
+        await asyncio.Future()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a mock OpenAI Realtime server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--audio-ms", type=int, default=1000)
+    parser.add_argument("--audio-chunk-ms", type=int, default=40)
+    parser.add_argument("--rate", type=float, default=None, help="Deltas per second")
+    parser.add_argument("--reuse-port", action="store_true")
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, ConfigDict, Field
+import base64
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from typing_extensions import Literal
 
 
@@ -15,11 +17,28 @@ class Part(BaseModel):
     text: str | None = None
     """The `text` content, used for `input_text` and `text` content types."""
 
-    audio: str | None = None
-    """Base64-encoded audio bytes, used for `input_audio` and `audio` content type."""
+    audio: bytes | None = None
+    """Raw audio bytes, used for `input_audio` and `audio` content type.
+
+    Accepts Base64 strings, as sent by the server, or bytes-like objects. Audio is only
+    encoded to Base64 again when the part is serialized.
+    """
 
     transcript: str | None = None
     """The transcript of the audio, used for `input_audio` and `audio` content type."""
 
+    @field_validator("audio", mode="before")
+    @classmethod
+    def _decode_audio(cls, audio: str | bytes | bytearray | memoryview | None):
+        if isinstance(audio, str):
+            return base64.b64decode(audio)
+        if isinstance(audio, (bytearray, memoryview)):
+            return bytes(audio)
+        return audio
+
+    @field_serializer("audio", when_used="unless-none")
+    def _encode_audio(self, audio: bytes) -> str:
+        return base64.b64encode(audio).decode()
+
     def model_dump_json(self, **kwargs):
         return super().model_dump_json(exclude_unset=True, by_alias=True, **kwargs)
@@ -0,0 +1,339 @@
+import asyncio
+import json
+import time
+from collections import deque
+
+from typing_extensions import Awaitable, Callable, Literal, TypedDict
+
+from .events import RealtimeClientEvent
+
+_AUDIO_APPEND_HEAD = '{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_HEAD_WITH_ID = '{"type":"input_audio_buffer.append","event_id":'
+_AUDIO_APPEND_TAIL = '"}'
+
+
+def encode_event(event: RealtimeClientEvent) -> str:
+    """Serialize a client event into the JSON frame sent over the websocket.
+
+    Args:
+        event: The event to serialize
+
+    Returns:
+        str: The JSON frame
+    """
+    return event.dump_json()
+
+
+def encode_audio_append(audio: str, event_id: str | None = None) -> str:
+    """Build an `input_audio_buffer.append` frame without going through the pydantic model.
+
+    Base64 only uses JSON-safe characters, so the audio payload is spliced into a fixed
+    frame template as is. The output matches `InputAudioBufferAppend(...).dump_json()`
+    semantically.
+
+    Args:
+        audio: The Base64 encoded audio bytes
+        event_id: Optional client-generated ID for the event
+
+    Returns:
+        str: The JSON frame
+    """
+    if event_id is None:
+        return _AUDIO_APPEND_HEAD + audio + _AUDIO_APPEND_TAIL
+    return (
+        _AUDIO_APPEND_HEAD_WITH_ID
+        + json.dumps(event_id)
+        + ',"audio":"'
+        + audio
+        + _AUDIO_APPEND_TAIL
+    )
+
+
+BackpressurePolicy = Literal["block", "drop_audio", "raise"]
+"""What `SendQueue` does with a new frame when it is full.
+
+- `block`: wait until the writer has made room.
+- `drop_audio`: drop new audio appends and count them, wait for room for other events.
+- `raise`: raise `asyncio.QueueFull`.
+"""
+
+
+class SendQueueStats(TypedDict):
+    queued_frames: int
+    queued_bytes: int
+    sent_frames: int
+    sent_bytes: int
+    coalesced_frames: int
+    dropped_frames: int
+    avg_latency_ms: float
+    max_latency_ms: float
+
+
+class _QueuedFrame:
+    __slots__ = ("event_type", "payload", "raw_audio", "size", "enqueued_at")
+
+    def __init__(
+        self, event_type: str, payload: str, raw_audio: bool, enqueued_at: float
+    ):
+        self.event_type = event_type
+        self.payload = payload
+        self.raw_audio = raw_audio
+        """Whether the payload is Base64 audio rather than a JSON frame."""
+        self.size = len(payload)
+        self.enqueued_at = enqueued_at
+
+
+class SendQueue:
+    """A bounded outbound queue drained by a single writer task.
+
+    Adjacent audio chunks queued with `put_audio()` are merged into one
+    `input_audio_buffer.append` frame, up to `coalesce_bytes` of Base64 audio, and a lone
+    chunk waits up to `coalesce_ms` for more audio to merge with. Chunks are only merged
+    when every payload but the last is unpadded Base64, which always holds for chunks that
+    are a multiple of 3 bytes. Frames queued with `put()`, including serialized appends,
+    are sent as is, in order.
+
+    The writer task is started with `start()`. If it stops, e.g. because the connection
+    was lost, pending and later `put()` and `flush()` calls fail with `ConnectionError`
+    until a new writer is started, and the frames still queued are sent by that one.
+    After `pause()`, e.g. while reconnecting, they wait for the next writer instead, until
+    `fail()` is called.
+
+    Args:
+        max_bytes: Maximum size of the queued frames, in bytes
+        coalesce_bytes: Maximum Base64 audio payload of a merged append
+        coalesce_ms: Maximum time an append is held back waiting for more audio
+        policy: What to do when the queue is full, see `BackpressurePolicy`
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 4 * 1024 * 1024,
+        coalesce_bytes: int = 64 * 1024,
+        coalesce_ms: float = 20,
+        policy: BackpressurePolicy = "block",
+    ):
+        self.max_bytes = max_bytes
+        self.coalesce_bytes = coalesce_bytes
+        self.coalesce_ms = coalesce_ms
+        self.policy: BackpressurePolicy = policy
+        self._frames: deque[_QueuedFrame] = deque()
+        self._queued_bytes = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        self.sent_frames = 0
+        self.sent_bytes = 0
+        self.coalesced_frames = 0
+        self.dropped_frames = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+        self.error: BaseException | None = None
+        """Why the last writer task stopped, until a new one is started."""
+        self.paused = False
+        """Whether frames are kept for the next writer task, see `pause()`."""
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def queued_bytes(self) -> int:
+        return self._queued_bytes
+
+    async def put(self, event_type: str, frame: str) -> None:
+        """Queue a serialized frame for sending as is.
+
+        Args:
+            event_type: The type of the event
+            frame: The JSON frame
+
+        Raises:
+            asyncio.QueueFull: If the queue is full and the policy is `raise`
+            ConnectionError: If the writer task has stopped
+        """
+        await self._put(event_type, frame, False)
+
+    async def put_audio(self, audio: str) -> None:
+        """Queue audio for an `input_audio_buffer.append`, merged with adjacent chunks.
+
+        Args:
+            audio: The Base64 encoded audio
+
+        Raises:
+            asyncio.QueueFull: If the queue is full and the policy is `raise`
+            ConnectionError: If the writer task has stopped
+        """
+        await self._put("input_audio_buffer.append", audio, True)
+
+    async def _put(self, event_type: str, payload: str, raw_audio: bool) -> None:
+        self._check_writer()
+        while self._queued_bytes and self._queued_bytes + len(payload) > self.max_bytes:
+            if self.policy == "raise":
+                raise asyncio.QueueFull
+            if (
+                self.policy == "drop_audio"
+                and event_type == "input_audio_buffer.append"
+            ):
+                self.dropped_frames += 1
+                return
+            self._not_full.clear()
+            await self._not_full.wait()
+            self._check_writer()
+        self._frames.append(
+            _QueuedFrame(event_type, payload, raw_audio, time.monotonic())
+        )
+        self._queued_bytes += len(payload)
+        self._not_empty.set()
+        self._idle.clear()
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """Wait until every queued frame has been sent.
+
+        Args:
+            timeout: Seconds to wait. None waits until the queue is empty.
+
+        Raises:
+            asyncio.TimeoutError: If frames are still queued after `timeout`
+            ConnectionError: If the writer task stopped before sending them
+        """
+        await asyncio.wait_for(self._idle.wait(), timeout)
+        self._check_writer()
+
+    def _check_writer(self) -> None:
+        if self.error is not None:
+            raise ConnectionError("The send queue writer stopped") from self.error
+
+    def start(
+        self,
+        write: Callable[[str, str], Awaitable[None]],
+        new_event_id: Callable[[], str] | None = None,
+    ) -> asyncio.Task:
+        """Start a writer task running `run()`, see its arguments.
+
+        Returns:
+            asyncio.Task: The writer task
+        """
+        self.error = None
+        self.paused = False
+        if self._frames:
+            self._idle.clear()
+        task = asyncio.create_task(self.run(write, new_event_id))
+        task.add_done_callback(self._on_writer_done)
+        return task
+
+    def pause(self) -> None:
+        """Keep the queue usable until the next writer task is started.
+
+        Call it before stopping the writer on purpose. `put()` and `flush()` then wait for
+        the next writer instead of failing, even if the writer already stopped with an
+        error.
+        """
+        self.paused = True
+        self.error = None
+        if self._frames:
+            self._idle.clear()
+
+    def fail(self, exc: BaseException) -> None:
+        """Fail pending and later `put()` and `flush()` calls with `ConnectionError` until
+        a new writer task is started, e.g. once a paused queue will not be resumed."""
+        self.paused = False
+        self.error = exc
+        self._idle.set()
+        self._not_full.set()
+
+    def _on_writer_done(self, task: asyncio.Task) -> None:
+        if self.paused:
+            return
+        if task.cancelled():
+            self.error = asyncio.CancelledError()
+        else:
+            self.error = task.exception()
+        # Wake up the blocked put() and flush() calls, so they see the error
+        self._idle.set()
+        self._not_full.set()
+
+    def _pop(self) -> _QueuedFrame:
+        frame = self._frames.popleft()
+        self._queued_bytes -= frame.size
+        if not self._frames:
+            self._not_empty.clear()
+        self._not_full.set()
+        return frame
+
+    async def run(
+        self,
+        write: Callable[[str, str], Awaitable[None]],
+        new_event_id: Callable[[], str] | None = None,
+    ) -> None:
+        """Drain the queue until cancelled.
+
+        Args:
+            write: Coroutine sending a serialized frame, called with the event type and frame
+            new_event_id: Generates the `event_id` of every append built from
+                `put_audio()` chunks, merged or not. If None, they are sent without one.
+        """
+        while True:
+            if not self._frames:
+                self._idle.set()
+            await self._not_empty.wait()
+            frame = self._pop()
+            if not frame.raw_audio:
+                await write(frame.event_type, frame.payload)
+                self._record(frame.enqueued_at, 1, len(frame.payload))
+                continue
+
+            chunks = [frame.payload]
+            size = frame.size
+            deadline = frame.enqueued_at + self.coalesce_ms / 1000
+            while size < self.coalesce_bytes and not chunks[-1].endswith("="):
+                if not self._frames:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._not_empty.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                following = self._frames[0]
+                if (
+                    not following.raw_audio
+                    or size + following.size > self.coalesce_bytes
+                ):
+                    break
+                chunks.append(self._pop().payload)
+                size += following.size
+            self.coalesced_frames += len(chunks) - 1
+            audio = chunks[0] if len(chunks) == 1 else "".join(chunks)
+            event_id = new_event_id() if new_event_id is not None else None
+            await write(
+                "input_audio_buffer.append", encode_audio_append(audio, event_id)
+            )
+            self._record(frame.enqueued_at, len(chunks), size)
+
+    def _record(self, enqueued_at: float, frames: int, size: int) -> None:
+        latency = time.monotonic() - enqueued_at
+        self.sent_frames += frames
+        self.sent_bytes += size
+        self._latency_total += latency * frames
+        self._latency_max = max(self._latency_max, latency)
+
+    def stats(self) -> SendQueueStats:
+        """Get the queue depth and send counters."""
+        return {
+            "queued_frames": len(self._frames),
+            "queued_bytes": self._queued_bytes,
+            "sent_frames": self.sent_frames,
+            "sent_bytes": self.sent_bytes,
+            "coalesced_frames": self.coalesced_frames,
+            "dropped_frames": self.dropped_frames,
+            "avg_latency_ms": (
+                self._latency_total / self.sent_frames * 1000
+                if self.sent_frames
+                else 0.0
+            ),
+            "max_latency_ms": self._latency_max * 1000,
+        }
@@ -0,0 +1,212 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from typing_extensions import AsyncIterator, Callable, TypedDict
+
+from .metrics import HistogramSummary, LatencyHistogram, TurnMetric
+from .outbound import SendQueue
+from .realtime_client import RealtimeClient
+
+
+class PoolStats(TypedDict):
+    sessions: int
+    leased: int
+    idle: int
+    waiting: int
+    max_sessions: int
+    handler_dispatched: int
+    handler_dropped: int
+    handler_errors: int
+    send_queued_bytes: int
+    send_dropped_frames: int
+    latency: dict[TurnMetric, HistogramSummary]
+
+
+class RealtimeClientPool:
+    """Creates, leases and recycles many `RealtimeClient` sessions on a single event loop.
+
+    Every session keeps its own event handlers, so handlers registered on a leased client
+    only ever see that session's events, and are removed when the client is returned.
+    Websocket writes of all sessions share a FIFO semaphore, so that a session streaming a
+    lot of audio cannot starve the others.
+
+    Args:
+        max_sessions: Maximum number of open sessions. `acquire()` waits when it is reached.
+        max_concurrent_sends: Maximum number of websocket writes in flight across all sessions
+        send_queue_factory: Called to create the `SendQueue` of every new session. If None,
+            sessions write to their websocket directly.
+        **client_kwargs: Arguments passed to every `RealtimeClient`
+
+    Example:
+        ```python
+        >>> async with RealtimeClientPool(max_sessions=200) as pool:
+        >>>     async with pool.lease() as client:
+        >>>         client.on("response.audio.delta", handle_audio)
+        >>>         await client.response_create()
+        >>>         await client.wait_for("response.done")
+        ```
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        max_concurrent_sends: int = 32,
+        send_queue_factory: Callable[[], SendQueue] | None = None,
+        **client_kwargs,
+    ):
+        self.max_sessions = max_sessions
+        self.send_queue_factory = send_queue_factory
+        self.client_kwargs = client_kwargs
+        self.send_limiter = asyncio.Semaphore(max_concurrent_sends)
+        self._slots = asyncio.Semaphore(max_sessions)
+        self._idle: list[RealtimeClient] = []
+        self._leased: set[RealtimeClient] = set()
+        self._waiting = 0
+
+    async def __aenter__(self) -> "RealtimeClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def _new_client(self) -> RealtimeClient:
+        return RealtimeClient(
+            send_queue=self.send_queue_factory() if self.send_queue_factory else None,
+            send_limiter=self.send_limiter,
+            **self.client_kwargs,
+        )
+
+    async def _open(self) -> RealtimeClient:
+        client = self._new_client()
+        await client.__aenter__()
+        return client
+
+    async def prewarm(self, sessions: int) -> None:
+        """Open idle sessions ahead of time, so that leasing them skips the handshake.
+
+        Args:
+            sessions: Number of idle sessions to open, capped by the free capacity
+        """
+        sessions = min(
+            sessions, self.max_sessions - len(self._leased) - len(self._idle)
+        )
+        for _ in range(sessions):
+            await self._slots.acquire()
+        try:
+            clients = await asyncio.gather(
+                *(self._open() for _ in range(sessions)), return_exceptions=True
+            )
+        except BaseException:
+            for _ in range(sessions):
+                self._slots.release()
+            raise
+        for client in clients:
+            if isinstance(client, RealtimeClient):
+                self._idle.append(client)
+            else:
+                self._slots.release()
+        errors = [client for client in clients if isinstance(client, BaseException)]
+        if errors:
+            raise errors[0]
+
+    async def acquire(self) -> RealtimeClient:
+        """Lease a connected session, waiting if `max_sessions` sessions are open.
+
+        Returns:
+            RealtimeClient: A connected client, reused from the idle sessions if possible
+        """
+        while self._idle:
+            client = self._idle.pop()
+            if client.is_connected():
+                self._leased.add(client)
+                return client
+            await self._close(client)
+
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            client = await self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._leased.add(client)
+        return client
+
+    async def release(self, client: RealtimeClient, reuse: bool = False) -> None:
+        """Return a leased session to the pool.
+
+        The client's handlers, tools and pending waits are always removed. Sessions are closed by
+        default, since their server-side conversation would leak into the next lease.
+
+        Args:
+            client: A client returned by `acquire()`
+            reuse: Keep the session open for the next lease instead of closing it
+        """
+        self._leased.discard(client)
+        if reuse and client.is_connected():
+            client.router.clear()
+            client.tools.clear()
+            client.fail_pending(ConnectionError("Session released"))
+            self._idle.append(client)
+        else:
+            await self._close(client)
+
+    async def _close(self, client: RealtimeClient) -> None:
+        try:
+            if client.listener_task is not None:
+                await client.__aexit__(None, None, None)
+        except ValueError:
+            # The connection was already closed
+            pass
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def lease(self, reuse: bool = False) -> AsyncIterator[RealtimeClient]:
+        """Lease a session for the duration of an `async with` block.
+
+        Args:
+            reuse: Keep the session open for the next lease instead of closing it
+        """
+        client = await self.acquire()
+        try:
+            yield client
+        finally:
+            await self.release(client, reuse)
+
+    async def close(self) -> None:
+        """Close every idle and leased session."""
+        clients = self._idle + list(self._leased)
+        self._idle.clear()
+        self._leased.clear()
+        await asyncio.gather(*(self._close(client) for client in clients))
+
+    def stats(self) -> PoolStats:
+        """Get counters aggregated over every open session."""
+        clients = self._idle + list(self._leased)
+        handler_stats = [stats for client in clients for stats in client.router.stats()]
+        send_queues = [
+            client.send_queue for client in clients if client.send_queue is not None
+        ]
+        latency = {}
+        for metric in TurnMetric.__args__:
+            histogram = LatencyHistogram()
+            for client in clients:
+                histogram.merge(client.latency.histograms[metric].snapshot())
+            latency[metric] = histogram.summary()
+        return {
+            "sessions": len(clients),
+            "leased": len(self._leased),
+            "idle": len(self._idle),
+            "waiting": self._waiting,
+            "max_sessions": self.max_sessions,
+            "handler_dispatched": sum(stats["dispatched"] for stats in handler_stats),
+            "handler_dropped": sum(stats["dropped"] for stats in handler_stats),
+            "handler_errors": sum(stats["errors"] for stats in handler_stats),
+            "send_queued_bytes": sum(queue.queued_bytes for queue in send_queues),
+            "send_dropped_frames": sum(queue.dropped_frames for queue in send_queues),
+            "latency": latency,
+        }
@@ -1,40 +1,47 @@
 import asyncio
-import inspect
+import base64
 import json
 import os
 from types import TracebackType
 
-from typing_extensions import Any, Awaitable, Callable, Self, TypedDict
+from typing_extensions import Self
 from websockets import ConnectionClosed, ConnectionClosedError, connect
 from websockets.client import ClientConnection
+from websockets.exceptions import WebSocketException
 from websockets.protocol import State
 
+from .correlation import CorrelationTable
 from .events import (
     ConversationItemCreate,
     ConversationItemDelete,
     ConversationItemTruncate,
-    InputAudioBufferAppend,
     InputAudioBufferClear,
     InputAudioBufferCommit,
+    LifecycleEventName,
     RealtimeClientEvent,
     ResponseCancel,
     ResponseCreate,
     ServerEventName,
     SessionUpdate,
+    decode_server_event,
 )
+from .journal import JournalRecorder
+from .metrics import LatencyTracker
 from .models import Item, ResponseConfig, SessionConfig
+from .outbound import SendQueue, encode_audio_append, encode_event
+from .reconnect import ReconnectPolicy, SessionReplay
+from .router import (
+    EventHandlerCallable,
+    EventRouter,
+    HandlerMode,
+    OverflowPolicy,
+    Subscription,
+)
+from .streaming import ResponseStream, ResponseStreams
+from .tools import ToolRegistry
 from .utils import background_task, get_logger
 from .utils.logger import RealtimeClientLogger
-
-EventHandlerCallable = (
-    Callable[[dict, tuple, dict], Any] | Callable[[dict, tuple, dict], Awaitable[Any]]
-)
-
-
-class EventHandlerType(TypedDict):
-    handler: EventHandlerCallable
-    args: tuple
-    kwargs: dict
+from .waiters import EventPredicate, WaiterRegistry
 
 
 class RealtimeClient:
@@ -47,6 +54,21 @@ class RealtimeClient:
         uri (str): WebSocket endpoint URI. Defaults to `'wss://api.openai.com/v1/realtime'`.
         model_name (str): OpenAI model identifier. Defaults to `'gpt-4o-realtime-preview-2024-10-01'`.
         api_key (str | None): OpenAI API key. If `None`, reads from OPENAI_API_KEY environment variable.
+        handler_workers (int | None): Size of the thread pool used by `thread` mode handlers.
+        send_queue (SendQueue | None): If set, events are sent by a writer task draining this
+            queue, which coalesces audio appends and applies backpressure. If `None`, every
+            event is written to the websocket by the caller.
+        reconnect (ReconnectPolicy | None): If set, a dropped connection is re-established
+            with this backoff policy, and the session configuration and conversation are
+            restored. If `None`, the listener stops when the connection is closed.
+        send_limiter (asyncio.Semaphore | None): If set, every websocket write holds this
+            semaphore, which lets many clients share a fair, bounded number of concurrent sends.
+        ack_timeout (float): Seconds to wait for the server to acknowledge or reject a sent
+            event before its handle fails with `asyncio.TimeoutError`. See `send_event()`.
+        tool_workers (int | None): Size of the thread pool used by sync tools, see `tools`.
+        recorder (JournalRecorder | None): If set, every server and client event is
+            recorded to this journal, which can be replayed with `JournalReplayer`. The
+            recorder is not closed with the client.
 
     Example:
         ```python
@@ -56,6 +78,7 @@ class RealtimeClient:
         >>> async with RealtimeClient() as client:
         >>>    # Add event handlers
         >>>    client.on("response.text.delta", handle_text_delta)
+        >>>    client.on("response.done", log_response, mode="task")
         >>>
         >>>    # Configure session
         >>>    await client.session_update(
@@ -79,6 +102,13 @@ class RealtimeClient:
         uri: str = "wss://api.openai.com/v1/realtime",
         model_name: str = "gpt-4o-realtime-preview-2024-10-01",
         api_key: str | None = None,
+        handler_workers: int | None = None,
+        send_queue: SendQueue | None = None,
+        reconnect: ReconnectPolicy | None = None,
+        send_limiter: asyncio.Semaphore | None = None,
+        ack_timeout: float = 10.0,
+        tool_workers: int | None = None,
+        recorder: JournalRecorder | None = None,
     ):
         self.uri: str = uri
         self.model_name: str = model_name or "gpt-4o-realtime-preview-2024-10-01"
@@ -88,24 +118,57 @@ class RealtimeClient:
                 "API key must be provided or set in OPENAI_API_KEY environment variable"
             )
         self.ws: ClientConnection | None = None
-        self.event_handlers: dict[ServerEventName, EventHandlerType] = {}
-        self.pending_events: dict[ServerEventName, asyncio.Event] = {}
+        self.waiters: WaiterRegistry = WaiterRegistry()
         self.logger: RealtimeClientLogger = get_logger()
+        self.router: EventRouter = EventRouter(
+            self.logger, handler_workers, decode_server_event
+        )
         self.listener_task: asyncio.Task | None = None
+        self.send_queue: SendQueue | None = send_queue
+        self.writer_task: asyncio.Task | None = None
+        self.reconnect_policy: ReconnectPolicy | None = reconnect
+        self.latency: LatencyTracker = LatencyTracker()
+        self.send_limiter: asyncio.Semaphore | None = send_limiter
+        self.replay: SessionReplay | None = SessionReplay() if reconnect else None
+        self.correlation: CorrelationTable = CorrelationTable(ack_timeout)
+        self.streams: ResponseStreams = ResponseStreams()
+        self.tools: ToolRegistry = ToolRegistry(self, tool_workers)
+        self.recorder: JournalRecorder | None = recorder
 
     async def __aenter__(self) -> Self:
         await self.connect()
         self.listener_task = asyncio.create_task(self.listener())
+        self._start_writer()
         return self
 
+    def _start_writer(self) -> None:
+        if self.send_queue is not None and (
+            self.writer_task is None or self.writer_task.done()
+        ):
+            self.writer_task = self.send_queue.start(
+                self.write_frame, self._next_append_id
+            )
+
     async def __aexit__(
         self,
         exc_type: type | None,
         exc_value: Exception | None,
         traceback: TracebackType | None,
     ) -> None:
-        self.event_handlers.clear()
-        self.pending_events.clear()
+        if self.writer_task is not None:
+            if self.is_connected() and not self.writer_task.done():
+                try:
+                    await self.send_queue.flush(self.correlation.timeout)
+                except (asyncio.TimeoutError, ConnectionError) as e:
+                    self.logger.warning(
+                        f"Closing with {len(self.send_queue)} unsent frames: {e!r}"
+                    )
+            self.writer_task.cancel()
+            self.writer_task = None
+        self.latency.stop_reporting()
+        self.router.clear()
+        self.tools.clear()
+        self.fail_pending(ConnectionError("Client closed"))
         self.listener_task.cancel()
         self.listener_task = None
         await self.disconnect()
@@ -116,53 +179,182 @@ class RealtimeClient:
 
         Continuously receives messages from the websocket connection, parses them as JSON events,
         and emits them to any registered handlers. Will cancel itself if the connection is closed
-        or an error occurs.
+        or an error occurs. With a reconnect policy, a closed connection is re-established
+        instead, and the listener only cancels itself once the policy gives up.
         """
-        try:
-            async for message in self.ws:
-                event = json.loads(message)
-                await self.emit(event["type"], event)
-        except (ConnectionClosedError, ConnectionClosed):
-            self.logger.error("Websocket connection closed")
-            self.listener_task.cancel()
-        except Exception as e:
-            self.logger.error(f"Event handler error for {event['type']}: {e}")
-            self.listener_task.cancel()
+        while True:
+            try:
+                async for message in self.ws:
+                    event = json.loads(message)
+                    if self.recorder is not None:
+                        self.recorder.record_server(message, event)
+                    await self.emit(event["type"], event)
+            except (ConnectionClosedError, ConnectionClosed):
+                if self.reconnect_policy is None:
+                    self.logger.error("Websocket connection closed")
+                    self.fail_pending(ConnectionError("Websocket connection closed"))
+                    self.listener_task.cancel()
+                    return
+            except Exception as e:
+                self.logger.error(f"Event handler error for {event['type']}: {e}")
+                self.listener_task.cancel()
+                return
+            if self.reconnect_policy is None:
+                self.fail_pending(ConnectionError("Websocket connection closed"))
+                return
+            if not await self._reconnect():
+                self.logger.error("Websocket connection closed, giving up reconnecting")
+                self.fail_pending(ConnectionError("Websocket connection closed"))
+                self.listener_task.cancel()
+                return
+
+    def fail_pending(self, exc: Exception) -> None:
+        """Fail every pending `wait_for()`, event handle, response stream and send queue
+        call, cancel running tool calls, and drop the turns in progress of the latency
+        tracker."""
+        if self.send_queue is not None:
+            self.send_queue.fail(exc)
+        self.waiters.clear(exc)
+        self.correlation.clear(exc)
+        self.streams.clear(exc)
+        self.tools.cancel()
+        self.latency.reset_pending()
+
+    async def _reconnect(self) -> bool:
+        """Reconnect with the reconnect policy's backoff and restore the session.
+
+        Emits `reconnecting` before every attempt and `resumed` once the session is restored.
+
+        Returns:
+            bool: True if reconnected, False if the policy ran out of attempts
+        """
+        if self.writer_task is not None:
+            # Nothing queued may be written before the session is restored. Events sent
+            # meanwhile are queued for the next writer.
+            self.send_queue.pause()
+            self.writer_task.cancel()
+            await asyncio.wait([self.writer_task])
+        # Responses in progress on the old connection will never be done
+        self.latency.reset_pending()
+        self.correlation.reset_server_turns()
+        attempt = 0
+        for delay in self.reconnect_policy.delays():
+            attempt += 1
+            self.logger.warning(
+                f"Websocket connection closed, reconnecting in {delay:.2f}s (attempt {attempt})"
+            )
+            await self.router.dispatch(
+                "reconnecting",
+                {"type": "reconnecting", "attempt": attempt, "delay": delay},
+            )
+            await asyncio.sleep(delay)
+            try:
+                await self.connect()
+                replayed_items = await self._restore_session()
+            except (OSError, asyncio.TimeoutError, WebSocketException) as e:
+                self.logger.error(f"Reconnect attempt {attempt} failed: {e}")
+                continue
+            self._start_writer()
+            await self.router.dispatch(
+                "resumed",
+                {
+                    "type": "resumed",
+                    "attempts": attempt,
+                    "replayed_items": replayed_items,
+                },
+            )
+            return True
+        return False
+
+    async def _restore_session(self) -> int:
+        """Re-send the session configuration and conversation items on a new connection.
+
+        Frames are written back to back, without waiting for the server to acknowledge each
+        one. The writer task is stopped until the session is restored, so they go out ahead
+        of anything in the send queue.
+
+        Returns:
+            int: The number of replayed conversation items
+        """
+        session_config = self.replay.session_config()
+        if session_config is not None:
+            await self.write_frame(
+                "session.update", encode_event(SessionUpdate(session=session_config))
+            )
+        items = self.replay.replay_items()
+        for item in items:
+            await self.write_frame(
+                "conversation.item.create",
+                encode_event(ConversationItemCreate(item=item)),
+            )
+        return len(items)
 
     def on(
         self,
-        event_name: ServerEventName,
+        event_name: ServerEventName | LifecycleEventName,
         handler: EventHandlerCallable,
         *args,
+        mode: HandlerMode = "inline",
+        queue_size: int = 256,
+        overflow: OverflowPolicy = "drop_oldest",
+        typed: bool = False,
         **kwargs,
-    ) -> None:
+    ) -> Subscription:
         """Register an event handler for a server event.
 
-        The handler can be either a normal function or an async function. When the event occurs,
-        the handler will be called with:
+        Any number of handlers can be registered for the same event. The handler can be either
+        a normal function or an async function. When the event occurs, the handler will be
+        called with:
         - The event payload as the first argument
         - Any additional *args and **kwargs passed during registration
 
+        By default handlers run inline in the websocket listener, so a slow handler delays
+        every event after it. Use `mode="task"` or `mode="thread"` to give the handler its own
+        bounded queue instead, so it can never stall the listener or other handlers.
+
+        With `typed=True` the handler receives the typed server event model (e.g.
+        `ResponseAudioDelta`) instead of the raw dictionary. The model is decoded once per
+        event, on first use, and shared by all typed handlers of that event.
+
+        Clients with a reconnect policy also emit `reconnecting` before every reconnect attempt
+        and `resumed` once the session has been restored. These are never typed.
+
         Args:
             event_name: The server event name to listen for
             handler: The function or coroutine to call when the event occurs
             *args: Additional positional arguments to pass to the handler
+            mode: `inline`, `task` or `thread`. See `HandlerMode`.
+            queue_size: Maximum number of pending events for `task` and `thread` handlers
+            overflow: `drop_oldest` or `drop_newest`, applied when the handler's queue is full
+            typed: Pass the typed server event model to the handler instead of the raw dictionary
             **kwargs: Additional keyword arguments to pass to the handler
+
+        Returns:
+            Subscription: The registered handler, which can be passed to `off()`
         """
-        self.event_handlers[event_name] = {
-            "handler": handler,
-            "args": args,
-            "kwargs": kwargs,
-        }
+        return self.router.subscribe(
+            event_name,
+            handler,
+            *args,
+            mode=mode,
+            queue_size=queue_size,
+            overflow=overflow,
+            typed=typed,
+            **kwargs,
+        )
 
-    def off(self, event_name: ServerEventName) -> None:
-        """Delete the event handler for a server event.
+    def off(
+        self,
+        event_name: ServerEventName | LifecycleEventName,
+        handler: EventHandlerCallable | Subscription | None = None,
+    ) -> None:
+        """Delete event handlers for a server event.
 
         Args:
             event_name: The server event name to stop listening for
+            handler: The handler or subscription to remove. If None, all handlers for the event are removed.
         """
-        if event_name in self.event_handlers:
-            del self.event_handlers[event_name]
+        self.router.unsubscribe(event_name, handler)
 
     async def emit(self, event_name: ServerEventName, event: dict) -> None:
         """Emit an event to registered handlers and resolve pending `wait_for()` calls.
@@ -172,19 +364,14 @@ class RealtimeClient:
             event: The event payload dictionary containing event data
         """
         self.logger.log_event(event, "server")
-        # WARNING: this will run user code in a background task, if any exceptions occur, it will be eaten
-        if event_name in self.pending_events:
-            self.pending_events[event_name].set()
-        if event_name in self.event_handlers:
-            handler_info = self.event_handlers[event_name]
-            if inspect.iscoroutinefunction(handler_info["handler"]):
-                await handler_info["handler"](
-                    event, *handler_info["args"], **handler_info["kwargs"]
-                )
-            else:
-                handler_info["handler"](
-                    event, *handler_info["args"], **handler_info["kwargs"]
-                )
+        self.latency.on_event(event_name, event)
+        if self.replay is not None:
+            self.replay.apply(event)
+        acknowledged = self.correlation.on_event(event_name, event)
+        self.waiters.resolve(event_name, event)
+        self.streams.on_event(event_name, event, acknowledged)
+        self.tools.on_event(event_name, event)
+        await self.router.dispatch(event_name, event)
 
     def is_connected(self) -> bool:
         """Check if the websocket connection is currently active and open.
@@ -229,65 +416,141 @@ class RealtimeClient:
         else:
             raise ValueError("Not connected to websocket")
 
-    async def send_event(self, event: RealtimeClientEvent) -> None:
+    async def send_event(self, event: RealtimeClientEvent) -> asyncio.Future:
         """Send an event to the realtime websocket server.
 
+        The event is given an `event_id` if it has none, and serialized exactly once, the
+        same frame is logged and sent. The returned handle does not need to be awaited.
+
         Args:
             event: The event to send
 
+        Returns:
+            asyncio.Future: A handle resolved with the server event acknowledging the event,
+                e.g. `session.updated`, or with None after `ack_timeout` for events that
+                are never acknowledged. It fails with `RealtimeAPIError` as soon as the
+                server rejects the event, or with `asyncio.TimeoutError` if the
+                acknowledgement does not arrive within `ack_timeout`.
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        if self.is_connected():
-            self.logger.log_event(json.loads(event.dump_json()), "client")
-            await self.ws.send(event.dump_json())
-        else:
+        handle = self.correlation.track(event)
+        try:
+            await self.send_frame(event.event_type, encode_event(event))
+        except BaseException:
+            self.correlation.discard(event.event_id)
+            raise
+        return handle
+
+    async def send_frame(self, event_type: str, frame: str) -> None:
+        """Send an already serialized event to the realtime websocket server.
+
+        If the client has a send queue, the frame is queued for the writer task instead.
+
+        Args:
+            event_type: The type of the serialized event, used for logging
+            frame: The JSON encoded event
+
+        Raises:
+            ConnectionError: If not connected to websocket
+            asyncio.QueueFull: If the send queue is full and its policy is `raise`
+        """
+        if not self.is_connected():
             raise ConnectionError("Not connected to websocket")
+        if self.send_queue is not None:
+            await self.send_queue.put(event_type, frame)
+        else:
+            await self.write_frame(event_type, frame)
+
+    async def write_frame(self, event_type: str, frame: str) -> None:
+        """Write a serialized event to the websocket, bypassing the send queue.
+
+        Args:
+            event_type: The type of the serialized event, used for logging
+            frame: The JSON encoded event
+        """
+        self.logger.log_frame(event_type, frame, "client")
+        if self.recorder is not None:
+            self.recorder.record_client(event_type, frame)
+        if self.send_limiter is None:
+            await self.ws.send(frame)
+        else:
+            async with self.send_limiter:
+                await self.ws.send(frame)
 
     async def wait_for(
-        self, event_name: ServerEventName, timeout: float | None = None
-    ) -> None:
+        self,
+        event_name: ServerEventName,
+        timeout: float | None = None,
+        predicate: EventPredicate | None = None,
+    ) -> dict:
         """Wait for a specific server event to occur.
 
+        Any number of calls can wait for the same event, each one is resolved by the first
+        matching event received after it started waiting.
+
         Args:
             event_name: The name of the server event to wait for
             timeout: Optional timeout in seconds. If None, wait indefinitely
+            predicate: Only return events for which this returns True, e.g.
+                `lambda event: event["response"]["id"] == response_id`
+
+        Returns:
+            dict: The event payload
 
         Raises:
             asyncio.TimeoutError: If timeout is reached before event occurs
+            ConnectionError: If the client is closed before event occurs
         """
-        if event_name not in self.pending_events:
-            self.pending_events[event_name] = asyncio.Event()
-            await asyncio.wait_for(self.pending_events[event_name].wait(), timeout)
-            del self.pending_events[event_name]
+        future = self.waiters.add(event_name, predicate)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.waiters.discard(event_name, future)
 
     # High-level event helpers ==================================================
 
-    async def conversation_item_create(self, item: Item) -> None:
+    async def conversation_item_create(self, item: Item) -> asyncio.Future:
         """Send a `conversation.item.create` event to the Realtime API server.
 
+        Items without an ID are given one, so that the acknowledging
+        `conversation.item.created` can be told apart from items created by the server.
+
         Args:
             item: The conversation item to create
 
+        Returns:
+            asyncio.Future: A handle resolved with `conversation.item.created`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(ConversationItemCreate(item=item))
+        if item.id is None:
+            item = item.model_copy(update={"id": f"item_{self.correlation.next_id()}"})
+        return await self.send_event(
+            ConversationItemCreate(event_id=self.correlation.next_id(), item=item)
+        )
 
-    async def conversation_item_delete(self, item_id: str) -> None:
+    async def conversation_item_delete(self, item_id: str) -> asyncio.Future:
         """Send a `conversation.item.delete` event to the Realtime API server.
 
         Args:
             item_id: The ID of the conversation item to delete
 
+        Returns:
+            asyncio.Future: A handle resolved with `conversation.item.deleted`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(ConversationItemDelete(item_id=item_id))
+        return await self.send_event(
+            ConversationItemDelete(event_id=self.correlation.next_id(), item_id=item_id)
+        )
 
     async def conversation_item_truncate(
         self, item_id: str, content_index: int, audio_end_ms: int
-    ) -> None:
+    ) -> asyncio.Future:
         """Send a `conversation.item.truncate` event to the Realtime API server.
 
         Args:
@@ -295,75 +558,162 @@ class RealtimeClient:
             content_index: The index of the content part to truncate. Set this to 0.
             audio_end_ms: Inclusive duration up to which audio is truncated, in milliseconds. If the audio_end_ms is greater than the actual audio duration, the server will respond with an error.
 
+        Returns:
+            asyncio.Future: A handle resolved with `conversation.item.truncated`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(
+        return await self.send_event(
             ConversationItemTruncate(
+                event_id=self.correlation.next_id(),
                 item_id=item_id,
                 content_index=content_index,
                 audio_end_ms=audio_end_ms,
             )
         )
 
-    async def input_audio_buffer_append(self, audio_bytes: str) -> None:
+    async def input_audio_buffer_append(
+        self, audio_bytes: str | bytes | bytearray | memoryview
+    ) -> None:
         """Send an `input.audio.buffer.append` event to the Realtime API server.
 
         Args:
-            audio_bytes: The Base64 encoded audio bytes to append to the input buffer
+            audio_bytes: The audio to append to the input buffer, either Base64 encoded or raw
 
         Raises:
             ConnectionError: If not connected to websocket
+            asyncio.QueueFull: If the send queue is full and its policy is `raise`
         """
-        await self.send_event(InputAudioBufferAppend(audio=audio_bytes))
+        if not self.is_connected():
+            raise ConnectionError("Not connected to websocket")
+        if not isinstance(audio_bytes, str):
+            audio_bytes = base64.b64encode(audio_bytes).decode()
+        if self.send_queue is not None:
+            # Queued as raw Base64 so the writer can merge adjacent appends
+            await self.send_queue.put_audio(audio_bytes)
+        else:
+            await self.write_frame(
+                "input_audio_buffer.append",
+                encode_audio_append(audio_bytes, self._next_append_id()),
+            )
+
+    def _next_append_id(self) -> str:
+        # Appends have no handle, they are only tracked to attribute their errors
+        event_id = self.correlation.next_id()
+        self.correlation.track_id(event_id, "input_audio_buffer.append")
+        return event_id
 
-    async def input_audio_buffer_clear(self) -> None:
+    async def input_audio_buffer_clear(self) -> asyncio.Future:
         """Send an `input.audio.buffer.clear` event to the Realtime API server.
 
+        Returns:
+            asyncio.Future: A handle resolved with `input_audio_buffer.cleared`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(InputAudioBufferClear())
+        return await self.send_event(
+            InputAudioBufferClear(event_id=self.correlation.next_id())
+        )
 
-    async def input_audio_buffer_commit(self) -> None:
+    async def input_audio_buffer_commit(self) -> asyncio.Future:
         """Send an `input.audio.buffer.commit` event to the Realtime API server.
 
+        Returns:
+            asyncio.Future: A handle resolved with `input_audio_buffer.committed`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(InputAudioBufferCommit())
+        self.latency.mark_commit_sent()
+        return await self.send_event(
+            InputAudioBufferCommit(event_id=self.correlation.next_id())
+        )
 
-    async def response_cancel(self) -> None:
+    async def response_cancel(self) -> asyncio.Future:
         """Send a `response.cancel` event to the Realtime API server.
 
+        Returns:
+            asyncio.Future: A handle resolved with None unless the server rejects the event,
+                see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(ResponseCancel())
+        return await self.send_event(
+            ResponseCancel(event_id=self.correlation.next_id())
+        )
 
     async def response_create(
         self, response_config: ResponseConfig | None = None
-    ) -> None:
+    ) -> asyncio.Future:
         """Send a `response.create` event to the Realtime API server.
 
         Args:
             response_config: Optional configuration for the response
 
+        Returns:
+            asyncio.Future: A handle resolved with `response.created`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
+        self.latency.mark_response_requested()
+        event_id = self.correlation.next_id()
         if response_config:
-            await self.send_event(ResponseCreate(response=response_config))
-        else:
-            await self.send_event(ResponseCreate())
+            return await self.send_event(
+                ResponseCreate(event_id=event_id, response=response_config)
+            )
+        return await self.send_event(ResponseCreate(event_id=event_id))
 
-    async def session_update(self, session_config: SessionConfig) -> None:
+    def stream_response(
+        self,
+        response_config: ResponseConfig | None = None,
+        max_chunks: int | None = None,
+        overflow: OverflowPolicy = "drop_oldest",
+    ) -> ResponseStream:
+        """Request a response and iterate over its text, audio, transcript and function call
+        argument chunks, without registering any handler.
+
+        The `response.create` event is sent when iteration starts. Every stream has its own
+        queue, so a slow consumer never delays the listener or other streams.
+
+        Args:
+            response_config: Optional configuration for the response
+            max_chunks: Maximum number of chunks queued for the consumer. None, the
+                default, never drops a chunk.
+            overflow: Which chunk to drop when the consumer is `max_chunks` behind. Dropped
+                chunks are replaced by a `gap` chunk counting them.
+
+        Returns:
+            ResponseStream: An async iterator of `ResponseChunk`s. It raises
+                `RealtimeAPIError` if the response is rejected, and `ConnectionError` if the
+                connection is lost.
+
+        Example:
+            ```python
+            >>> async for chunk in client.stream_response():
+            >>>     if chunk.chunk_type == "text":
+            >>>         print(chunk.data, end="")
+            >>>     elif chunk.chunk_type == "audio":
+            >>>         player.buffer.write(chunk.data)
+            ```
+        """
+        return ResponseStream(self, response_config, max_chunks, overflow)
+
+    async def session_update(self, session_config: SessionConfig) -> asyncio.Future:
         """Send a `session.update` event to the Realtime API server.
 
         Args:
             session_config: Configuration for the session update
 
+        Returns:
+            asyncio.Future: A handle resolved with `session.updated`, see `send_event()`
+
         Raises:
             ConnectionError: If not connected to websocket
         """
-        await self.send_event(SessionUpdate(session=session_config))
+        return await self.send_event(
+            SessionUpdate(event_id=self.correlation.next_id(), session=session_config)
+        )
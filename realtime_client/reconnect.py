@@ -0,0 +1,155 @@
+import random
+
+from typing_extensions import Iterator
+
+from .models import Item, SessionConfig
+
+
+class ReconnectPolicy:
+    """Jittered exponential backoff used by `RealtimeClient` to reconnect a dropped socket.
+
+    The n-th retry waits `min(max_delay, initial_delay * multiplier**n)` seconds, of which
+    a random fraction of up to `jitter` is subtracted, so that many clients dropped at the
+    same time do not reconnect in lockstep.
+
+    Args:
+        max_attempts: Attempts before giving up. If None, retry forever.
+        initial_delay: Delay before the first attempt, in seconds
+        max_delay: Upper bound of the delay, in seconds
+        multiplier: Growth factor of the delay between attempts
+        jitter: Fraction of the delay that is randomized, between 0 and 1
+    """
+
+    def __init__(
+        self,
+        max_attempts: int | None = None,
+        initial_delay: float = 0.25,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+    ):
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delays(self) -> Iterator[float]:
+        """Yield the delay before each reconnect attempt."""
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            delay = min(self.max_delay, self.initial_delay * self.multiplier**attempt)
+            yield delay * (1 - self.jitter * random.random())
+            attempt += 1
+
+
+class SessionReplay:
+    """Tracks the session configuration and conversation needed to restore a session.
+
+    The session configuration is the one returned by the last `session.updated`, so that
+    updates rejected by the server are not replayed. Conversation items are tracked from
+    server events, in conversation order. When they are replayed, audio content is replaced
+    by its transcript, since audio cannot be added back with `conversation.item.create`,
+    and content that has neither is dropped. Like the server, a truncated audio part loses
+    its transcript, which may contain text that was never heard.
+
+    Events are shared with the client's handlers, so tracked items are copied before they
+    are updated, never modified in place.
+    """
+
+    def __init__(self):
+        self.session: dict = {}
+        self.items: dict[str, dict] = {}
+        self.truncated: dict[str, set[int]] = {}
+
+    def apply(self, event: dict) -> None:
+        """Update the tracked session and conversation from a server event."""
+        event_type = event["type"]
+        if event_type in ("conversation.item.created", "response.output_item.done"):
+            item = event["item"]
+            item_id = item.get("id")
+            if item_id:
+                self.items[item_id] = item
+                for content_index in self.truncated.get(item_id, ()):
+                    self._update_part(item_id, content_index, transcript=None)
+        elif event_type == "conversation.item.input_audio_transcription.completed":
+            self._update_part(
+                event["item_id"], event["content_index"], transcript=event["transcript"]
+            )
+        elif event_type == "conversation.item.truncated":
+            self.truncated.setdefault(event["item_id"], set()).add(
+                event["content_index"]
+            )
+            self._update_part(event["item_id"], event["content_index"], transcript=None)
+        elif event_type == "conversation.item.deleted":
+            self.items.pop(event["item_id"], None)
+            self.truncated.pop(event["item_id"], None)
+        elif event_type == "session.updated":
+            session = event["session"]
+            self.session = {
+                field: session[field]
+                for field in SessionConfig.model_fields
+                if session.get(field) is not None
+            }
+
+    def _update_part(self, item_id: str, content_index: int, **fields) -> None:
+        item = self.items.get(item_id)
+        if not item or not item.get("content"):
+            return
+        content = list(item["content"])
+        if content_index < len(content):
+            content[content_index] = {**content[content_index], **fields}
+            self.items[item_id] = {**item, "content": content}
+
+    def session_config(self) -> SessionConfig | None:
+        """Get the configuration to send after reconnecting, if any was set."""
+        return SessionConfig(**self.session) if self.session else None
+
+    def replay_items(self) -> list[Item]:
+        """Get the tracked conversation as items that can be sent to a new session."""
+        items = []
+        for item in self.items.values():
+            item_type = item.get("type")
+            if item_type == "message":
+                content = []
+                for part in item.get("content") or ():
+                    part_type = part.get("type")
+                    text = part.get("text")
+                    if part_type in ("input_audio", "audio"):
+                        text = part.get("transcript")
+                    if not text:
+                        continue
+                    # Assistant messages only accept `text` content, others `input_text`
+                    text_type = (
+                        "text" if item.get("role") == "assistant" else "input_text"
+                    )
+                    content.append({"type": text_type, "text": text})
+                if content:
+                    items.append(
+                        Item(
+                            id=item["id"],
+                            type="message",
+                            role=item.get("role"),
+                            content=content,
+                        )
+                    )
+            elif item_type == "function_call":
+                items.append(
+                    Item(
+                        id=item["id"],
+                        type="function_call",
+                        call_id=item.get("call_id"),
+                        name=item.get("name"),
+                        arguments=item.get("arguments") or "",
+                    )
+                )
+            elif item_type == "function_call_output":
+                items.append(
+                    Item(
+                        id=item["id"],
+                        type="function_call_output",
+                        call_id=item.get("call_id"),
+                        output=item.get("output") or "",
+                    )
+                )
+        return items
@@ -0,0 +1,289 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from typing_extensions import Any, Awaitable, Callable, Literal, TypedDict
+
+from .utils.logger import RealtimeClientLogger
+
+EventHandlerCallable = (
+    Callable[[dict, tuple, dict], Any] | Callable[[dict, tuple, dict], Awaitable[Any]]
+)
+
+HandlerMode = Literal["inline", "task", "thread"]
+"""How a handler is executed.
+
+- `inline`: called (and awaited) directly by the websocket listener.
+- `task`: queued and run by a dedicated asyncio task.
+- `thread`: queued and run in the router's thread pool. Only for normal functions.
+"""
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest"]
+"""What to do when a queued handler falls behind and its queue is full."""
+
+
+_NOT_DECODED = object()
+_DECODE_FAILED = object()
+
+
+class HandlerStats(TypedDict):
+    event_name: str
+    handler: str
+    mode: HandlerMode
+    typed: bool
+    queued: int
+    dispatched: int
+    dropped: int
+    errors: int
+
+
+class Subscription:
+    """A handler registered on an `EventRouter` for a single event name.
+
+    Handlers running in `task` or `thread` mode own a bounded queue and a worker task, so
+    a slow handler only ever delays itself. When the queue is full, events are dropped
+    according to the subscription's overflow policy and counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        router: "EventRouter",
+        event_name: str,
+        handler: EventHandlerCallable,
+        args: tuple,
+        kwargs: dict,
+        mode: HandlerMode,
+        queue_size: int,
+        overflow: OverflowPolicy,
+        typed: bool,
+    ):
+        self.router = router
+        self.event_name = event_name
+        self.handler = handler
+        self.args = args
+        self.kwargs = kwargs
+        self.mode: HandlerMode = mode
+        self.queue_size = queue_size
+        self.overflow: OverflowPolicy = overflow
+        self.typed = typed
+        self.is_coroutine = inspect.iscoroutinefunction(handler)
+        self.queue: asyncio.Queue | None = None
+        self.worker: asyncio.Task | None = None
+        self.dispatched = 0
+        self.dropped = 0
+        self.errors = 0
+
+    async def dispatch(self, event: Any) -> None:
+        """Run the handler inline, or enqueue the event for the handler's worker."""
+        if self.mode == "inline":
+            self.dispatched += 1
+            if self.is_coroutine:
+                await self.handler(event, *self.args, **self.kwargs)
+            else:
+                self.handler(event, *self.args, **self.kwargs)
+            return
+
+        if self.worker is None:
+            self.queue = asyncio.Queue(self.queue_size)
+            self.worker = asyncio.create_task(self._work())
+        if self.queue.full():
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            self.queue.get_nowait()
+            self.queue.task_done()
+        self.queue.put_nowait(event)
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await self.queue.get()
+            try:
+                if self.mode == "thread":
+                    await loop.run_in_executor(
+                        self.router.executor,
+                        partial(self.handler, event, *self.args, **self.kwargs),
+                    )
+                elif self.is_coroutine:
+                    await self.handler(event, *self.args, **self.kwargs)
+                else:
+                    self.handler(event, *self.args, **self.kwargs)
+            except Exception as e:
+                self.errors += 1
+                self.router.logger.error(
+                    f"Event handler error for {self.event_name}: {e}"
+                )
+            finally:
+                self.dispatched += 1
+                self.queue.task_done()
+
+    def close(self) -> None:
+        """Stop the worker task, discarding any events that are still queued."""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+            self.queue = None
+
+    def stats(self) -> HandlerStats:
+        return {
+            "event_name": self.event_name,
+            "handler": getattr(self.handler, "__qualname__", repr(self.handler)),
+            "mode": self.mode,
+            "typed": self.typed,
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "dispatched": self.dispatched,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+
+class EventRouter:
+    """Routes events to any number of handlers per event name.
+
+    Args:
+        logger: Logger used to report errors raised by queued handlers.
+        max_workers: Size of the thread pool used by `thread` mode handlers.
+        decoder: Converts a raw event into the typed event passed to `typed` handlers.
+    """
+
+    def __init__(
+        self,
+        logger: RealtimeClientLogger,
+        max_workers: int | None = None,
+        decoder: Callable[[dict], Any] | None = None,
+    ):
+        self.logger = logger
+        self.max_workers = max_workers
+        self.decoder = decoder
+        self.subscriptions: dict[str, list[Subscription]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool used by `thread` mode handlers, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="realtime-handler"
+            )
+        return self._executor
+
+    def subscribe(
+        self,
+        event_name: str,
+        handler: EventHandlerCallable,
+        *args,
+        mode: HandlerMode = "inline",
+        queue_size: int = 256,
+        overflow: OverflowPolicy = "drop_oldest",
+        typed: bool = False,
+        **kwargs,
+    ) -> Subscription:
+        """Add a handler for an event name.
+
+        Args:
+            event_name: The event name to listen for
+            handler: The function or coroutine to call when the event occurs
+            *args: Additional positional arguments to pass to the handler
+            mode: How the handler is executed, see `HandlerMode`
+            queue_size: Maximum number of pending events for `task` and `thread` handlers
+            overflow: Which event to drop when the handler's queue is full
+            typed: Pass the event decoded by the router's decoder instead of the raw event
+            **kwargs: Additional keyword arguments to pass to the handler
+
+        Returns:
+            Subscription: The new subscription, which can be passed to `unsubscribe()`
+
+        Raises:
+            ValueError: If an async handler is registered in `thread` mode, `queue_size` is
+                less than 1, or `typed` is set on a router without a decoder
+        """
+        if mode == "thread" and inspect.iscoroutinefunction(handler):
+            raise ValueError("Async handlers cannot run in thread mode")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if typed and self.decoder is None:
+            raise ValueError("Typed handlers require a router with a decoder")
+        subscription = Subscription(
+            self, event_name, handler, args, kwargs, mode, queue_size, overflow, typed
+        )
+        self.subscriptions.setdefault(event_name, []).append(subscription)
+        return subscription
+
+    def unsubscribe(
+        self,
+        event_name: str,
+        handler: EventHandlerCallable | Subscription | None = None,
+    ) -> None:
+        """Remove handlers for an event name.
+
+        Args:
+            event_name: The event name to stop listening for
+            handler: The handler or subscription to remove. If None, all handlers are removed.
+        """
+        subscriptions = self.subscriptions.get(event_name)
+        if not subscriptions:
+            return
+        keep = []
+        for subscription in subscriptions:
+            if (
+                handler is None
+                or handler is subscription
+                or handler == subscription.handler
+            ):
+                subscription.close()
+            else:
+                keep.append(subscription)
+        if keep:
+            self.subscriptions[event_name] = keep
+        else:
+            del self.subscriptions[event_name]
+
+    def has_subscribers(self, event_name: str) -> bool:
+        return event_name in self.subscriptions
+
+    async def dispatch(self, event_name: str, event: Any) -> None:
+        """Deliver an event to every handler subscribed to `event_name`.
+
+        Inline handlers are awaited in registration order, exceptions they raise propagate
+        to the caller. Queued handlers only cost a `put_nowait()` here. The typed event is
+        decoded at most once, and only if a `typed` handler is subscribed. If it cannot be
+        decoded, the error is logged and counted on each `typed` subscription, which skips
+        the event, while the other subscriptions still receive it.
+        """
+        subscriptions = self.subscriptions.get(event_name)
+        if not subscriptions:
+            return
+        typed_event = _NOT_DECODED
+        for subscription in tuple(subscriptions):
+            if subscription.typed:
+                if typed_event is _NOT_DECODED:
+                    try:
+                        typed_event = self.decoder(event)
+                    except Exception as e:
+                        typed_event = _DECODE_FAILED
+                        self.logger.error(f"Failed to decode {event_name}: {e}")
+                if typed_event is _DECODE_FAILED:
+                    subscription.errors += 1
+                    continue
+                await subscription.dispatch(typed_event)
+            else:
+                await subscription.dispatch(event)
+
+    def stats(self) -> list[HandlerStats]:
+        """Get the per-handler counters of every subscription."""
+        return [
+            subscription.stats()
+            for subscriptions in self.subscriptions.values()
+            for subscription in subscriptions
+        ]
+
+    def clear(self) -> None:
+        """Remove all handlers and release the thread pool."""
+        for subscriptions in self.subscriptions.values():
+            for subscription in subscriptions:
+                subscription.close()
+        self.subscriptions.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,688 @@
+"""Shards `RealtimeClient` sessions across worker processes, one event loop per core.
+
+JSON parsing, base64 and model validation are CPU-bound, so a single event loop saturates
+one core long before it runs out of sessions. `ShardSupervisor` starts one worker process
+per core, each running a `RealtimeClientPool`, and places every new session on the least
+loaded worker. Commands flow from the front process to the workers, and only the events a
+session subscribed to flow back, over a socket pair carrying length-prefixed pickle frames
+that are batched per event loop iteration.
+
+Example:
+    ```python
+    >>> async with ShardSupervisor(workers=4) as supervisor:
+    >>>     async with await supervisor.open_session() as session:
+    >>>         session.on("response.text.delta", handle_text_delta)
+    >>>         await session.call("response_create")
+    >>>         await session.wait_for("response.done")
+    ```
+"""
+
+import asyncio
+import inspect
+import itertools
+import multiprocessing
+import os
+import pickle
+import socket
+import struct
+import time
+from functools import partial
+from multiprocessing.process import BaseProcess
+
+from typing_extensions import Any, Callable, Literal, Self, TypedDict
+
+from .events import LifecycleEventName, ServerEventName, decode_server_event
+from .pool import PoolStats, RealtimeClientPool
+from .realtime_client import RealtimeClient
+from .router import (
+    EventHandlerCallable,
+    EventRouter,
+    HandlerMode,
+    OverflowPolicy,
+    Subscription,
+)
+from .utils import get_logger
+from .utils.logger import RealtimeClientLogger
+from .waiters import EventPredicate, WaiterRegistry
+
+_HEADER = struct.Struct("!I")
+
+ShardEventName = Literal["respawned"]
+"""Events emitted by the front process for a `ShardedSession`, never forwarded by a worker."""
+
+
+class _Channel:
+    """Length-prefixed pickle frames over a stream socket.
+
+    Messages sent during the same event loop iteration are written with a single call.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.batch: list[bytes] = []
+
+    @classmethod
+    async def open(cls, sock: socket.socket) -> "_Channel":
+        reader, writer = await asyncio.open_connection(sock=sock)
+        return cls(reader, writer)
+
+    def send(self, message: tuple) -> None:
+        data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+        if not self.batch:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self.batch.append(_HEADER.pack(len(data)))
+        self.batch.append(data)
+
+    def _flush(self) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(b"".join(self.batch))
+        self.batch.clear()
+
+    async def drain(self) -> None:
+        await self.writer.drain()
+
+    async def receive(self) -> tuple:
+        """Read the next message.
+
+        Raises:
+            asyncio.IncompleteReadError: If the other process closed the socket
+        """
+        (size,) = _HEADER.unpack(await self.reader.readexactly(_HEADER.size))
+        return pickle.loads(await self.reader.readexactly(size))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _picklable(error: BaseException) -> BaseException:
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return RuntimeError(repr(error))
+    return error
+
+
+# Worker process ================================================================
+
+
+class _ShardWorker:
+    """Runs the sessions of one worker process and executes the front process' commands."""
+
+    def __init__(
+        self,
+        channel: _Channel,
+        pool: RealtimeClientPool,
+        client_setup: Callable[[RealtimeClient], None] | None,
+    ):
+        self.channel = channel
+        self.pool = pool
+        self.client_setup = client_setup
+        self.logger = get_logger()
+        self.sessions: dict[int, asyncio.Queue] = {}
+        self.tasks: set[asyncio.Task] = set()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                message = await self.channel.receive()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                # The front process went away
+                break
+            kind = message[0]
+            if kind == "open":
+                _, session_id, call_id, events = message
+                queue = self.sessions[session_id] = asyncio.Queue()
+                task = asyncio.create_task(
+                    self.run_session(session_id, queue, call_id, events)
+                )
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+            elif kind in ("call", "subscribe"):
+                queue = self.sessions.get(message[1])
+                if queue is not None:
+                    queue.put_nowait(message)
+                elif kind == "call" and message[2] is not None:
+                    self.reply(message[2], ConnectionError("Session is closed"))
+            elif kind == "close":
+                queue = self.sessions.pop(message[1], None)
+                if queue is not None:
+                    queue.put_nowait(None)
+            elif kind == "ping":
+                self.channel.send(("pong", message[1], self.pool.stats()))
+            elif kind == "shutdown":
+                break
+
+        for queue in self.sessions.values():
+            queue.put_nowait(None)
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        await self.pool.close()
+        self.channel.close()
+
+    def reply(self, call_id: int | None, error: BaseException | None, result=None):
+        if call_id is not None:
+            if error is None:
+                try:
+                    self.channel.send(("result", call_id, True, result))
+                    return
+                except Exception as e:
+                    error = e
+            self.channel.send(("result", call_id, False, _picklable(error)))
+        elif error is not None:
+            self.logger.error(f"Sharded session command failed: {error!r}")
+
+    def reply_handle(self, call_id: int | None, handle: asyncio.Future) -> None:
+        if handle.cancelled():
+            self.reply(call_id, ConnectionError("Session is closed"))
+        elif handle.exception() is not None:
+            self.reply(call_id, handle.exception())
+        else:
+            self.reply(call_id, None, handle.result())
+
+    def forward(self, client: RealtimeClient, session_id: int, event_name: str) -> None:
+        async def send_event(event: dict) -> None:
+            self.channel.send(("event", session_id, event_name, event))
+            # Stop reading the websocket while the front process is behind
+            await self.channel.drain()
+
+        client.on(event_name, send_event)
+
+    async def run_session(
+        self,
+        session_id: int,
+        queue: asyncio.Queue,
+        call_id: int | None,
+        events: tuple[str, ...],
+    ) -> None:
+        try:
+            client = await self.pool.acquire()
+        except Exception as e:
+            self.sessions.pop(session_id, None)
+            self.reply(call_id, e)
+            self.channel.send(("closed", session_id))
+            return
+        try:
+            if self.client_setup is not None:
+                self.client_setup(client)
+            for event_name in events:
+                self.forward(client, session_id, event_name)
+            self.reply(call_id, None)
+
+            while (command := await queue.get()) is not None:
+                if command[0] == "subscribe":
+                    self.forward(client, session_id, command[2])
+                    continue
+                _, _, call_id, method, args, kwargs = command
+                try:
+                    if method.startswith("_"):
+                        raise AttributeError(f"{method} is not a public client method")
+                    result = getattr(client, method)(*args, **kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as e:
+                    self.reply(call_id, e)
+                else:
+                    if isinstance(result, asyncio.Future):
+                        # An event handle, replied to without holding up the next command
+                        result.add_done_callback(partial(self.reply_handle, call_id))
+                    else:
+                        self.reply(call_id, None, result)
+        finally:
+            self.sessions.pop(session_id, None)
+            await self.pool.release(client)
+            self.channel.send(("closed", session_id))
+
+
+async def _run_worker(sock: socket.socket, options: dict) -> None:
+    channel = await _Channel.open(sock)
+    async with RealtimeClientPool(
+        max_sessions=options["max_sessions"],
+        max_concurrent_sends=options["max_concurrent_sends"],
+        **options["client_kwargs"],
+    ) as pool:
+        await _ShardWorker(channel, pool, options["client_setup"]).run()
+
+
+def _worker_main(sock: socket.socket, options: dict) -> None:
+    """Entry point of a worker process."""
+    try:
+        asyncio.run(_run_worker(sock, options))
+    except KeyboardInterrupt:
+        pass
+
+
+# Front process =================================================================
+
+
+class WorkerStats(TypedDict):
+    index: int
+    pid: int | None
+    alive: bool
+    restarts: int
+    sessions: int
+    heartbeat_age: float
+    pool: PoolStats | None
+
+
+class _WorkerHandle:
+    """The front process' view of a worker process."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process: BaseProcess | None = None
+        self.channel: _Channel | None = None
+        self.reader_task: asyncio.Task | None = None
+        self.sessions: set[int] = set()
+        self.calls: dict[int, asyncio.Future] = {}
+        self.last_pong = time.monotonic()
+        self.pool_stats: PoolStats | None = None
+        self.restarts = 0
+        self.respawning = False
+
+
+class ShardedSession:
+    """A `RealtimeClient` session running in a worker process of a `ShardSupervisor`.
+
+    Client methods are invoked by name with `call()` or `send()`, in the order they are
+    issued. Events are only forwarded from the worker for event names that have a handler
+    or a pending `wait_for()` on this session, so high-frequency events that are handled by
+    the worker's `client_setup` never cross the process boundary.
+
+    If the worker process dies, the session is reopened on its replacement as a new server
+    session, and `respawned` is emitted.
+    """
+
+    def __init__(self, supervisor: "ShardSupervisor", session_id: int, worker: int):
+        self.supervisor = supervisor
+        self.session_id = session_id
+        self.worker = worker
+        self.router = EventRouter(supervisor.logger, None, decode_server_event)
+        self.forwarded: set[str] = set()
+        self.waiters = WaiterRegistry()
+        self.closed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def _forward(self, event_name: str) -> None:
+        if (
+            event_name not in self.forwarded
+            and event_name not in ShardEventName.__args__
+        ):
+            self.forwarded.add(event_name)
+            self.supervisor._send(self, ("subscribe", self.session_id, event_name))
+
+    def on(
+        self,
+        event_name: ServerEventName | LifecycleEventName | ShardEventName,
+        handler: EventHandlerCallable,
+        *args,
+        mode: HandlerMode = "inline",
+        queue_size: int = 256,
+        overflow: OverflowPolicy = "drop_oldest",
+        typed: bool = False,
+        **kwargs,
+    ) -> Subscription:
+        """Register an event handler, like `RealtimeClient.on()`.
+
+        Handlers run in the front process. Besides the client's events, sessions emit
+        `respawned` after being reopened on a replacement worker.
+        """
+        self._forward(event_name)
+        return self.router.subscribe(
+            event_name,
+            handler,
+            *args,
+            mode=mode,
+            queue_size=queue_size,
+            overflow=overflow,
+            typed=typed,
+            **kwargs,
+        )
+
+    def off(
+        self,
+        event_name: ServerEventName | LifecycleEventName | ShardEventName,
+        handler: EventHandlerCallable | Subscription | None = None,
+    ) -> None:
+        """Delete event handlers, like `RealtimeClient.off()`.
+
+        The worker keeps forwarding the event, so that a later `on()` sees no gap.
+        """
+        self.router.unsubscribe(event_name, handler)
+
+    async def emit(self, event_name: str, event: dict) -> None:
+        self.waiters.resolve(event_name, event)
+        try:
+            await self.router.dispatch(event_name, event)
+        except Exception as e:
+            self.supervisor.logger.error(f"Event handler error for {event_name}: {e}")
+
+    async def wait_for(
+        self,
+        event_name: ServerEventName,
+        timeout: float | None = None,
+        predicate: EventPredicate | None = None,
+    ) -> dict:
+        """Wait for a specific server event to occur, like `RealtimeClient.wait_for()`.
+
+        The predicate runs in the front process, so it does not need to be picklable.
+
+        Returns:
+            dict: The event payload
+
+        Raises:
+            asyncio.TimeoutError: If timeout is reached before event occurs
+        """
+        self._forward(event_name)
+        future = self.waiters.add(event_name, predicate)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.waiters.discard(event_name, future)
+
+    async def call(self, method: str, *args, **kwargs) -> Any:
+        """Invoke a `RealtimeClient` method in the worker and wait for its result.
+
+        Args:
+            method: Name of the client method, e.g. `"response_create"`
+            *args: Positional arguments of the method, which must be picklable
+            **kwargs: Keyword arguments of the method, which must be picklable
+
+        Returns:
+            Any: The return value of the method. For methods returning an event handle, the
+                server event acknowledging the event, see `RealtimeClient.send_event()`.
+
+        Raises:
+            ConnectionError: If the session is closed or its worker died during the call
+            RealtimeAPIError: If the server rejected the event sent by the method
+        """
+        if self.closed:
+            raise ConnectionError("Session is closed")
+        return await self.supervisor._call(self, method, args, kwargs)
+
+    def send(self, method: str, *args, **kwargs) -> None:
+        """Invoke a `RealtimeClient` method in the worker without waiting for it.
+
+        Use this for high-rate commands such as `input_audio_buffer_append`. Errors are
+        logged by the worker.
+
+        Raises:
+            ConnectionError: If the session is closed
+        """
+        if self.closed:
+            raise ConnectionError("Session is closed")
+        self.supervisor._send(
+            self, ("call", self.session_id, None, method, args, kwargs)
+        )
+
+    async def close(self) -> None:
+        """Close the session and its websocket connection in the worker."""
+        if not self.closed:
+            self.closed = True
+            self.router.clear()
+            self.waiters.clear(ConnectionError("Session is closed"))
+            self.supervisor._close_session(self)
+
+
+class ShardSupervisor:
+    """Starts worker processes, shards sessions across them and respawns dead workers.
+
+    Every worker pings back every `heartbeat_interval` seconds. A worker that exited, closed
+    its socket or missed heartbeats for `heartbeat_timeout` seconds is killed and replaced,
+    and its sessions are reopened on the replacement.
+
+    Args:
+        workers: Number of worker processes. Defaults to the number of CPU cores.
+        max_sessions_per_worker: Maximum number of sessions of each worker's pool
+        max_concurrent_sends: Maximum number of websocket writes in flight per worker
+        heartbeat_interval: Seconds between health checks
+        heartbeat_timeout: Seconds without a heartbeat before a worker is replaced
+        client_setup: Called in the worker with every new client, e.g. to register handlers
+            that should run next to the websocket. Must be picklable, i.e. a module-level
+            function.
+        **client_kwargs: Arguments passed to every `RealtimeClient`, which must be picklable
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_sessions_per_worker: int = 100,
+        max_concurrent_sends: int = 32,
+        heartbeat_interval: float = 1.0,
+        heartbeat_timeout: float = 5.0,
+        client_setup: Callable[[RealtimeClient], None] | None = None,
+        **client_kwargs,
+    ):
+        self.options = {
+            "max_sessions": max_sessions_per_worker,
+            "max_concurrent_sends": max_concurrent_sends,
+            "client_setup": client_setup,
+            "client_kwargs": client_kwargs,
+        }
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.logger: RealtimeClientLogger = get_logger()
+        self.workers = [
+            _WorkerHandle(index) for index in range(workers or os.cpu_count())
+        ]
+        self.sessions: dict[int, ShardedSession] = {}
+        self.monitor_task: asyncio.Task | None = None
+        self.closing = False
+        self._context = multiprocessing.get_context("spawn")
+        self._session_ids = itertools.count(1)
+        self._call_ids = itertools.count(1)
+        self._pings = itertools.count(1)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the worker processes and the health monitor."""
+        self.closing = False
+        for worker in self.workers:
+            await self._spawn(worker)
+        self.monitor_task = asyncio.create_task(self._monitor())
+
+    async def _spawn(self, worker: _WorkerHandle) -> None:
+        parent_sock, child_sock = socket.socketpair()
+        worker.process = self._context.Process(
+            target=_worker_main,
+            args=(child_sock, self.options),
+            name=f"realtime-shard-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        child_sock.close()
+        worker.channel = await _Channel.open(parent_sock)
+        worker.last_pong = time.monotonic()
+        worker.reader_task = asyncio.create_task(self._read(worker))
+
+    async def _read(self, worker: _WorkerHandle) -> None:
+        channel = worker.channel
+        while True:
+            try:
+                message = await channel.receive()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            kind = message[0]
+            if kind == "event":
+                session = self.sessions.get(message[1])
+                if session is not None:
+                    await session.emit(message[2], message[3])
+            elif kind == "result":
+                _, call_id, ok, value = message
+                future = worker.calls.pop(call_id, None)
+                if future is not None and not future.done():
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+            elif kind == "pong":
+                worker.last_pong = time.monotonic()
+                worker.pool_stats = message[2]
+            elif kind == "closed":
+                if message[1] not in self.sessions:
+                    worker.sessions.discard(message[1])
+        if not self.closing and worker.channel is channel:
+            asyncio.create_task(self._respawn(worker, "closed its socket"))
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            for worker in self.workers:
+                if worker.respawning:
+                    continue
+                if worker.process.exitcode is not None:
+                    await self._respawn(
+                        worker, f"exited with code {worker.process.exitcode}"
+                    )
+                elif time.monotonic() - worker.last_pong > self.heartbeat_timeout:
+                    await self._respawn(worker, "stopped responding")
+                else:
+                    worker.channel.send(("ping", next(self._pings)))
+
+    async def _respawn(self, worker: _WorkerHandle, reason: str) -> None:
+        if worker.respawning or self.closing:
+            return
+        worker.respawning = True
+        try:
+            worker.restarts += 1
+            self.logger.warning(
+                f"Shard worker {worker.index} {reason}, respawning it "
+                f"(restart {worker.restarts})"
+            )
+            process = worker.process
+            worker.channel.close()
+            if process.is_alive():
+                process.kill()
+            await asyncio.get_running_loop().run_in_executor(None, process.join, 5)
+
+            calls, worker.calls = worker.calls, {}
+            for future in calls.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError(f"Shard worker {worker.index} died")
+                    )
+            # The sessions are reopened as new server sessions, their events never come
+            worker.sessions &= self.sessions.keys()
+            for session_id in worker.sessions:
+                self.sessions[session_id].waiters.clear(
+                    ConnectionError(f"Shard worker {worker.index} died")
+                )
+
+            await self._spawn(worker)
+            for session_id in worker.sessions:
+                session = self.sessions[session_id]
+                worker.channel.send(
+                    ("open", session_id, None, tuple(session.forwarded))
+                )
+                await session.emit(
+                    "respawned",
+                    {
+                        "type": "respawned",
+                        "worker": worker.index,
+                        "restarts": worker.restarts,
+                    },
+                )
+        finally:
+            worker.respawning = False
+
+    def _send(self, session: ShardedSession, message: tuple) -> None:
+        self.workers[session.worker].channel.send(message)
+
+    async def _call(
+        self, session: ShardedSession, method: str, args: tuple, kwargs: dict
+    ) -> Any:
+        worker = self.workers[session.worker]
+        call_id = next(self._call_ids)
+        future = worker.calls[call_id] = asyncio.get_running_loop().create_future()
+        worker.channel.send(("call", session.session_id, call_id, method, args, kwargs))
+        return await future
+
+    def _close_session(self, session: ShardedSession) -> None:
+        self.sessions.pop(session.session_id, None)
+        self.workers[session.worker].sessions.discard(session.session_id)
+        if not self.closing:
+            self._send(session, ("close", session.session_id))
+
+    async def open_session(self) -> ShardedSession:
+        """Open a session on the worker with the fewest sessions.
+
+        Returns:
+            ShardedSession: The connected session
+
+        Raises:
+            ConnectionError: If the worker could not connect the session
+        """
+        worker = min(self.workers, key=lambda worker: len(worker.sessions))
+        session = ShardedSession(self, next(self._session_ids), worker.index)
+        self.sessions[session.session_id] = session
+        worker.sessions.add(session.session_id)
+
+        call_id = next(self._call_ids)
+        future = worker.calls[call_id] = asyncio.get_running_loop().create_future()
+        worker.channel.send(("open", session.session_id, call_id, ()))
+        try:
+            await future
+        except BaseException:
+            session.closed = True
+            self.sessions.pop(session.session_id, None)
+            worker.sessions.discard(session.session_id)
+            raise
+        return session
+
+    async def close(self) -> None:
+        """Close every session and stop the worker processes."""
+        self.closing = True
+        if self.monitor_task is not None:
+            self.monitor_task.cancel()
+            self.monitor_task = None
+        for session in list(self.sessions.values()):
+            session.closed = True
+            session.router.clear()
+            session.waiters.clear(ConnectionError("Supervisor is closed"))
+        self.sessions.clear()
+
+        loop = asyncio.get_running_loop()
+        for worker in self.workers:
+            if worker.process is None:
+                continue
+            worker.channel.send(("shutdown",))
+        for worker in self.workers:
+            if worker.process is None:
+                continue
+            await loop.run_in_executor(None, worker.process.join, 10)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.channel.close()
+            if worker.reader_task is not None:
+                worker.reader_task.cancel()
+            worker.sessions.clear()
+            for future in worker.calls.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Supervisor is closed"))
+            worker.calls.clear()
+
+    def stats(self) -> list[WorkerStats]:
+        """Get the health and pool counters of every worker, as of its last heartbeat."""
+        now = time.monotonic()
+        return [
+            {
+                "index": worker.index,
+                "pid": worker.process.pid if worker.process else None,
+                "alive": bool(worker.process and worker.process.is_alive()),
+                "restarts": worker.restarts,
+                "sessions": len(worker.sessions),
+                "heartbeat_age": now - worker.last_pong,
+                "pool": worker.pool_stats,
+            }
+            for worker in self.workers
+        ]
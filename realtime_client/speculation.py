@@ -0,0 +1,211 @@
+import asyncio
+import json
+import time
+
+from typing_extensions import Any, TypedDict
+
+from .metrics import HistogramSummary, LatencyHistogram
+
+
+class IncrementalJSONParser:
+    """Parses the top-level fields of a JSON object as its text arrives in fragments.
+
+    Each character is scanned once, keeping track of nesting and strings. A field is
+    decoded as soon as its value is complete: at the closing quote or bracket of strings,
+    objects and arrays, and at the next `,` or `}` for numbers, booleans and null.
+    Fragments are never concatenated: only the text of the key or value in progress is
+    carried over to the next fragment, so parsing stays linear in the text's length.
+
+    Once the text turns out not to be a JSON object, `failed` is set and the rest of the
+    fragments are ignored.
+    """
+
+    def __init__(self):
+        self._fragments: list[str] = []
+        self.fields: dict[str, Any] = {}
+        """The fields decoded so far."""
+        self.complete = False
+        """Whether the closing brace of the object was seen."""
+        self.failed = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = "object"  # object, key, colon, value, scalar or comma
+        self._start: int | None = None  # Where the key or value in progress starts
+        self._carried: list[str] = []  # Its text from the previous fragments
+        self._key: str | None = None
+
+    @property
+    def text(self) -> str:
+        """The text fed so far."""
+        return "".join(self._fragments)
+
+    def feed(self, fragment: str) -> list[str]:
+        """Add a fragment of the object's text.
+
+        Returns:
+            list[str]: The names of the fields completed by this fragment
+        """
+        if self.failed or self.complete:
+            return []
+        completed = []
+        self._fragments.append(fragment)
+        try:
+            self._scan(fragment, completed)
+        except (ValueError, TypeError):
+            self.failed = True
+            return completed
+        if self._start is not None:
+            self._carried.append(fragment[self._start :])
+            self._start = 0
+        return completed
+
+    def _token(self, text: str, end: int) -> str:
+        """Take the key or value in progress, ending at `end` of the current fragment."""
+        token = text[self._start : end]
+        if self._carried:
+            self._carried.append(token)
+            token = "".join(self._carried)
+            self._carried.clear()
+        self._start = None
+        return token
+
+    def _scan(self, text: str, completed: list[str]) -> None:
+        for i, char in enumerate(text):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._expect == "key":
+                            self._key = json.loads(self._token(text, i + 1))
+                            self._expect = "colon"
+                        else:
+                            self._decode(text, i + 1, completed)
+                continue
+            if char in " \t\r\n":
+                continue
+            if self._depth == 0:
+                if char != "{" or self._expect != "object":
+                    raise ValueError(f"Unexpected {char!r}")
+                self._depth = 1
+                self._expect = "key"
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._start = i
+            elif char in "{[":
+                if self._depth == 1:
+                    self._start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._decode(text, i + 1, completed)
+                elif self._depth == 0:
+                    if self._expect == "scalar":
+                        self._decode(text, i, completed)
+                    self.complete = True
+                    return
+            elif self._depth == 1:
+                if char == ":":
+                    self._expect = "value"
+                elif char == ",":
+                    if self._expect == "scalar":
+                        self._decode(text, i, completed)
+                    self._expect = "key"
+                elif self._expect == "value":
+                    self._start = i
+                    self._expect = "scalar"
+
+    def _decode(self, text: str, end: int, completed: list[str]) -> None:
+        self.fields[self._key] = json.loads(self._token(text, end))
+        completed.append(self._key)
+        self._expect = "comma"
+
+
+class SpeculationStats(TypedDict):
+    started: int
+    hits: int
+    wasted: int
+    hit_rate: float
+    waste_rate: float
+    lead_time: HistogramSummary
+
+
+class Speculation:
+    """A function call of an idempotent tool, followed while its arguments stream."""
+
+    __slots__ = (
+        "response_id",
+        "tool_name",
+        "keys",
+        "parser",
+        "kwargs",
+        "task",
+        "started",
+    )
+
+    def __init__(self, response_id: str, tool_name: str, keys: list[str]):
+        self.response_id = response_id
+        self.tool_name = tool_name
+        self.keys = keys
+        self.parser = IncrementalJSONParser()
+        self.kwargs: dict | None = None
+        """The fields the run was started with."""
+        self.task: asyncio.Task | None = None
+        self.started = 0.0
+
+    def ready(self) -> bool:
+        """Whether the fields to speculate on are complete, and no run was started yet."""
+        if self.task is not None or self.parser.failed:
+            return False
+        if self.parser.complete:
+            return True
+        fields = self.parser.fields
+        return bool(self.keys) and all(key in fields for key in self.keys)
+
+    def matches(self, arguments: Any) -> bool:
+        """Whether the final arguments agree with the run on the fields speculated on."""
+        if not isinstance(arguments, dict):
+            return False
+        if self.parser.complete or not self.keys:
+            return arguments == self.kwargs
+        return all(
+            arguments.get(key) == self.kwargs.get(key)
+            and (key in arguments) == (key in self.kwargs)
+            for key in self.keys
+        )
+
+
+class SpeculationCounters:
+    """Hit and waste counters of the speculative runs of a `ToolRegistry`.
+
+    A speculative run is a hit when the final arguments equal the fields it was started
+    with. It is wasted, and cancelled, when they differ or the response is interrupted.
+    The lead time is how long before `response.function_call_arguments.done` a hit was
+    started, i.e. the argument streaming time taken out of the critical path.
+    """
+
+    def __init__(self):
+        self.started = 0
+        self.hits = 0
+        self.wasted = 0
+        self.lead_time = LatencyHistogram()
+
+    def hit(self, speculation: Speculation) -> None:
+        self.hits += 1
+        self.lead_time.record(time.perf_counter() - speculation.started)
+
+    def stats(self) -> SpeculationStats:
+        return {
+            "started": self.started,
+            "hits": self.hits,
+            "wasted": self.wasted,
+            "hit_rate": self.hits / self.started if self.started else 0.0,
+            "waste_rate": self.wasted / self.started if self.started else 0.0,
+            "lead_time": self.lead_time.summary(),
+        }
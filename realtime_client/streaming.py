@@ -0,0 +1,261 @@
+import asyncio
+import binascii
+from collections import deque
+
+from typing_extensions import TYPE_CHECKING, Literal, NamedTuple
+
+from .events import ResponseCreate
+from .models import ResponseConfig
+from .router import OverflowPolicy
+
+if TYPE_CHECKING:
+    from .realtime_client import RealtimeClient
+
+ChunkType = Literal["text", "audio", "transcript", "function_call_arguments", "gap"]
+
+
+class ResponseChunk(NamedTuple):
+    """A piece of a streamed response.
+
+    `data` is the `delta` of the server event as is, or the decoded PCM bytes for audio.
+
+    A `gap` chunk marks where a bounded stream dropped chunks. Its `data` is empty, its
+    other fields are those of the first dropped chunk, and `dropped` is how many chunks
+    were dropped in its place.
+    """
+
+    chunk_type: ChunkType
+    data: str | bytes
+    item_id: str
+    output_index: int
+    content_index: int | None = None
+    """None for function call arguments."""
+    call_id: str | None = None
+    """The function call ID, for function call arguments only."""
+    dropped: int = 0
+    """The number of chunks dropped, for `gap` chunks only."""
+
+
+class ResponseStream:
+    """An async iterator over the chunks of a single response.
+
+    The response is requested when iteration starts. The stream is bound to the
+    `response.created` acknowledging its own `response.create`, and from then on only
+    receives the deltas of that `response_id`. Iteration ends with `response.done`, after
+    which `response` holds the final response.
+
+    Chunks are queued by the client's listener with a single `append()`, and the consumer
+    pulls them at its own pace, so that a slow consumer only affects its own stream, never
+    the listener or other streams. By default the queue is unbounded and no chunk is ever
+    lost. With `max_chunks`, chunks are dropped according to `overflow` when the consumer
+    falls that far behind, counted in `dropped`, and replaced by a `gap` chunk.
+
+    Created by `RealtimeClient.stream_response()`.
+    """
+
+    def __init__(
+        self,
+        client: "RealtimeClient",
+        response_config: ResponseConfig | None = None,
+        max_chunks: int | None = None,
+        overflow: OverflowPolicy = "drop_oldest",
+    ):
+        if max_chunks is not None and max_chunks < 1:
+            raise ValueError("max_chunks must be at least 1")
+        self.client = client
+        self.response_config = response_config
+        self.max_chunks = max_chunks
+        self.overflow: OverflowPolicy = overflow
+        self._chunks: deque[ResponseChunk] = deque()
+        self._queued = 0
+        self._ready = asyncio.Event()
+        self._started = False
+        self._finished = False
+        self._error: BaseException | None = None
+
+        self.request_id: str | None = None
+        """The `event_id` of the `response.create` event, once iteration starts."""
+        self.response_id: str | None = None
+        """The ID of the response, once it is created."""
+        self.response: dict | None = None
+        """The `response` of `response.done`, once the response is done."""
+        self.dropped = 0
+        """Number of chunks dropped because the consumer fell behind."""
+
+    def __aiter__(self) -> "ResponseStream":
+        return self
+
+    async def __anext__(self) -> ResponseChunk:
+        if not self._started:
+            await self._start()
+        while not self._chunks:
+            if self._error is not None:
+                raise self._error
+            if self._finished:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        chunk = self._chunks.popleft()
+        if chunk.chunk_type != "gap":
+            self._queued -= 1
+        return chunk
+
+    async def _start(self) -> None:
+        self._started = True
+        client = self.client
+        # The event ID is known before sending, so the acknowledgement cannot be missed
+        event_id = client.correlation.next_id()
+        if self.response_config:
+            event = ResponseCreate(event_id=event_id, response=self.response_config)
+        else:
+            event = ResponseCreate(event_id=event_id)
+        self.request_id = event_id
+        streams = client.streams
+        streams.add(self)
+        client.latency.mark_response_requested()
+        try:
+            handle = await client.send_event(event)
+        except BaseException:
+            streams.remove(self)
+            raise
+        handle.add_done_callback(self._on_acknowledged)
+
+    def _on_acknowledged(self, handle: asyncio.Future) -> None:
+        if not handle.cancelled() and handle.exception() is not None:
+            self.client.streams.remove(self)
+            self.fail(handle.exception())
+
+    async def aclose(self) -> None:
+        """Stop receiving chunks. The response itself is not cancelled."""
+        self.client.streams.remove(self)
+        self._finished = True
+        self._chunks.clear()
+        self._queued = 0
+        self._ready.set()
+
+    def push(self, chunk: ResponseChunk) -> None:
+        chunks = self._chunks
+        if self.max_chunks is None or self._queued < self.max_chunks:
+            chunks.append(chunk)
+            self._queued += 1
+            self._ready.set()
+            return
+
+        # Full: drop a chunk, and merge it into the gap chunk taking its place
+        self.dropped += 1
+        if self.overflow == "drop_newest":
+            last = chunks[-1]
+            if last.chunk_type == "gap":
+                chunks[-1] = last._replace(dropped=last.dropped + 1)
+            else:
+                chunks.append(_gap(chunk, 1))
+            return
+        oldest = chunks.popleft()
+        if oldest.chunk_type == "gap":
+            chunks.popleft()
+            gap = oldest._replace(dropped=oldest.dropped + 1)
+        else:
+            gap = _gap(oldest, 1)
+        chunks.appendleft(gap)
+        chunks.append(chunk)
+
+    def finish(self, response: dict) -> None:
+        self.response = response
+        self._finished = True
+        self._ready.set()
+
+    def fail(self, exc: BaseException) -> None:
+        self._error = exc
+        self._ready.set()
+
+
+def _gap(chunk: ResponseChunk, dropped: int) -> ResponseChunk:
+    return chunk._replace(chunk_type="gap", data="", dropped=dropped)
+
+
+class ResponseStreams:
+    """Routes the deltas of the client's server events to the open `ResponseStream`s.
+
+    Streams waiting for their response are keyed by the `event_id` of their
+    `response.create`, and bound to the `response.created` that the client's
+    `CorrelationTable` matched with it, so responses requested without a stream, or
+    created by server VAD, are never mistaken for theirs. Every other event is routed with
+    a dictionary lookup of its `response_id`, and ignored at once when no stream is open.
+    """
+
+    def __init__(self):
+        self._unbound: dict[str, ResponseStream] = {}
+        self._bound: dict[str, ResponseStream] = {}
+
+    def __len__(self) -> int:
+        return len(self._unbound) + len(self._bound)
+
+    def add(self, stream: ResponseStream) -> None:
+        self._unbound[stream.request_id] = stream
+
+    def remove(self, stream: ResponseStream) -> None:
+        if stream.response_id is not None:
+            if self._bound.get(stream.response_id) is stream:
+                del self._bound[stream.response_id]
+        elif self._unbound.get(stream.request_id) is stream:
+            del self._unbound[stream.request_id]
+
+    def on_event(
+        self, event_name: str, event: dict, acknowledged: str | None = None
+    ) -> None:
+        """Route a server event to the stream of its response, if any.
+
+        Args:
+            event_name: The server event name
+            event: The server event
+            acknowledged: The `event_id` of the client event acknowledged by this event,
+                as returned by `CorrelationTable.on_event()`
+        """
+        if not self._bound and not self._unbound:
+            return
+        if event_name == "response.created":
+            stream = self._unbound.pop(acknowledged, None)
+            if stream is not None:
+                stream.response_id = event["response"]["id"]
+                self._bound[stream.response_id] = stream
+            return
+        if event_name == "response.done":
+            stream = self._bound.pop(event["response"]["id"], None)
+            if stream is not None:
+                stream.finish(event["response"])
+            return
+        chunk_type = _CHUNK_TYPES.get(event_name)
+        if chunk_type is None:
+            return
+        stream = self._bound.get(event["response_id"])
+        if stream is None:
+            return
+        if chunk_type == "audio":
+            data = binascii.a2b_base64(event["delta"])
+        else:
+            data = event["delta"]
+        stream.push(
+            ResponseChunk(
+                chunk_type,
+                data,
+                event["item_id"],
+                event["output_index"],
+                event.get("content_index"),
+                event.get("call_id"),
+            )
+        )
+
+    def clear(self, exc: BaseException) -> None:
+        """Fail every open stream, e.g. when the connection is lost."""
+        for stream in (*self._unbound.values(), *self._bound.values()):
+            stream.fail(exc)
+        self._unbound.clear()
+        self._bound.clear()
+
+
+_CHUNK_TYPES: dict[str, ChunkType] = {
+    "response.text.delta": "text",
+    "response.audio.delta": "audio",
+    "response.audio_transcript.delta": "transcript",
+    "response.function_call_arguments.delta": "function_call_arguments",
+}
@@ -0,0 +1,467 @@
+import asyncio
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from typing_extensions import TYPE_CHECKING, Any, Awaitable, Callable, TypedDict
+
+from .metrics import HistogramSummary, LatencyHistogram
+from .models import Item
+from .speculation import Speculation, SpeculationCounters, SpeculationStats
+
+if TYPE_CHECKING:
+    from .realtime_client import RealtimeClient
+
+ToolFunction = Callable[..., Any]
+"""A sync or async function, called with the decoded arguments as keyword arguments."""
+
+
+class ToolStats(TypedDict):
+    name: str
+    calls: int
+    errors: int
+    timeouts: int
+    running: int
+    latency: HistogramSummary
+
+
+class Tool:
+    """A function the model can call, with its execution limits and metrics.
+
+    Args:
+        function: The sync or async function to call
+        name: The name given to the model. Defaults to the function name.
+        description: The description given to the model. Defaults to the docstring.
+        parameters: The JSON schema of the function's keyword arguments
+        timeout: Seconds after which the call is abandoned. None for no timeout.
+        max_concurrency: Maximum number of concurrent calls of this tool. None for no limit.
+        idempotent: Whether the tool can be run again, or run and discarded, without side
+            effects. Idempotent tools are started speculatively, see `ToolRegistry`.
+        speculate_on: The fields the result of an idempotent tool depends on. Defaults to
+            every property of `parameters`.
+    """
+
+    def __init__(
+        self,
+        function: ToolFunction,
+        name: str | None = None,
+        description: str | None = None,
+        parameters: dict | None = None,
+        timeout: float | None = 30.0,
+        max_concurrency: int | None = None,
+        idempotent: bool = False,
+        speculate_on: list[str] | None = None,
+    ):
+        self.function = function
+        self.name = name or function.__name__
+        self.description = description or inspect.getdoc(function) or ""
+        self.parameters = parameters or {"type": "object", "properties": {}}
+        self.timeout = timeout
+        self.idempotent = idempotent
+        self.speculate_on: list[str] = (
+            list(self.parameters.get("properties", {}))
+            if speculate_on is None
+            else speculate_on
+        )
+        self.is_async = inspect.iscoroutinefunction(function)
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.latency = LatencyHistogram()
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.running = 0
+
+    def definition(self) -> dict:
+        """The tool as listed in `SessionConfig.tools` or `ResponseConfig.tools`."""
+        return {
+            "type": "function",
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+        }
+
+    def stats(self) -> ToolStats:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "running": self.running,
+            "latency": self.latency.summary(),
+        }
+
+
+class ToolCall:
+    """A function call of a response, from its arguments to its output."""
+
+    __slots__ = ("response_id", "item_id", "call_id", "name", "arguments", "task")
+
+    def __init__(
+        self, response_id: str, item_id: str, call_id: str, name: str, arguments: str
+    ):
+        self.response_id = response_id
+        self.item_id = item_id
+        self.call_id = call_id
+        self.name = name
+        self.arguments = arguments
+        self.task: asyncio.Task | None = None
+
+
+def _serialize(result: Any) -> str:
+    if isinstance(result, str):
+        return result
+    return json.dumps(result, default=str)
+
+
+def _error_output(message: str) -> str:
+    return json.dumps({"error": message})
+
+
+class _ToolTimeoutError(Exception):
+    """An `asyncio.TimeoutError` raised by a tool itself, as its `__cause__`."""
+
+
+async def _guard_timeout(call: Awaitable) -> Any:
+    """Await a tool call, so that only `wait_for()` raises `asyncio.TimeoutError`."""
+    try:
+        return await call
+    except asyncio.TimeoutError as e:
+        raise _ToolTimeoutError from e
+
+
+class ToolRegistry:
+    """Runs the client's tools when the model calls them, and sends their results back.
+
+    Each call starts as soon as its arguments are done, while the response is still
+    streaming. Sync tools run in a thread pool and async tools as tasks, so the calls of
+    a response run in parallel. Once the response is done and all its calls have
+    returned, their outputs are sent as `function_call_output` items, followed by a single
+    `response.create`. A turn with several calls therefore takes about as long as its
+    slowest call.
+
+    Calls that raise, time out or name an unknown tool still produce an output, a JSON
+    object with an `error` message, so that the model can recover. Calls of a response
+    that is cancelled or incomplete are cancelled, and nothing is sent.
+
+    Tools registered as idempotent are started even earlier, while their arguments are
+    still streaming. The argument deltas are parsed incrementally, and the tool is started
+    with the fields decoded so far as soon as its `speculate_on` fields are complete, or
+    the whole object is. If the final arguments have the same `speculate_on` fields, the
+    speculative run is used as the call. Otherwise it is cancelled, and the call is run
+    again with the final arguments. Narrowing `speculate_on` to the fields that determine
+    the result, e.g. leaving out a free-text `reason`, starts the tool earlier. See
+    `speculation_stats()` for the hit and waste rates.
+
+    Created by `RealtimeClient` as `client.tools`.
+
+    Args:
+        client: The client whose function calls are run
+        max_workers: Size of the thread pool used by sync tools
+        max_concurrency: Maximum number of concurrent calls across all tools. None for no
+            limit.
+        auto_respond: Send `response.create` after the outputs of a response's calls
+        speculate: Start idempotent tools before their arguments are done
+
+    Example:
+        ```python
+        >>> @client.tools.register(
+        >>>     parameters={
+        >>>         "type": "object",
+        >>>         "properties": {"city": {"type": "string"}},
+        >>>         "required": ["city"],
+        >>>     },
+        >>>     timeout=5,
+        >>> )
+        >>> async def get_weather(city: str) -> dict:
+        >>>     \"\"\"Get the current weather in a city.\"\"\"
+        >>>     return await weather_api.current(city)
+        >>>
+        >>> await client.session_update(SessionConfig(tools=client.tools.definitions()))
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "RealtimeClient",
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+        auto_respond: bool = True,
+        speculate: bool = True,
+    ):
+        self.client = client
+        self.max_workers = max_workers
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.auto_respond = auto_respond
+        self.speculate = speculate
+        self.tools: dict[str, Tool] = {}
+        self._names: dict[str, str] = {}  # Function names by item ID
+        self._calls: dict[str, list[ToolCall]] = {}
+        self._speculations: dict[str, Speculation] = {}  # By item ID
+        self._tasks: set[asyncio.Task] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+        self.turn_latency = LatencyHistogram()
+        """Time from the end of a response with calls to the submission of their outputs."""
+        self.speculation = SpeculationCounters()
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool used by sync tools, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="realtime-tool"
+            )
+        return self._executor
+
+    def register(
+        self,
+        function: ToolFunction | None = None,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        parameters: dict | None = None,
+        timeout: float | None = 30.0,
+        max_concurrency: int | None = None,
+        idempotent: bool = False,
+        speculate_on: list[str] | None = None,
+    ) -> Any:
+        """Register a tool. Can be used as a decorator, with or without arguments.
+
+        Args:
+            function: The sync or async function to call
+            name: The name given to the model. Defaults to the function name.
+            description: The description given to the model. Defaults to the docstring.
+            parameters: The JSON schema of the function's keyword arguments
+            timeout: Seconds after which the call is abandoned. None for no timeout. A sync
+                tool keeps running in its thread, but its result is discarded.
+            max_concurrency: Maximum number of concurrent calls of this tool
+            idempotent: Whether the tool has no side effects, and can be started before
+                its arguments are done
+            speculate_on: The fields the result of an idempotent tool depends on. Other
+                fields are only passed if they come first. Defaults to every property of
+                `parameters`.
+
+        Returns:
+            The function, or a decorator registering it
+        """
+
+        def decorator(function: ToolFunction) -> ToolFunction:
+            tool = Tool(
+                function,
+                name,
+                description,
+                parameters,
+                timeout,
+                max_concurrency,
+                idempotent,
+                speculate_on,
+            )
+            self.tools[tool.name] = tool
+            return function
+
+        if function is None:
+            return decorator
+        return decorator(function)
+
+    def unregister(self, name: str) -> None:
+        self.tools.pop(name, None)
+
+    def definitions(self) -> list[dict]:
+        """The registered tools, to pass as `tools` in a session or response config."""
+        return [tool.definition() for tool in self.tools.values()]
+
+    def on_event(self, event_name: str, event: dict) -> None:
+        """Start the calls of a response, and submit their outputs once it is done.
+
+        The function name of a call is taken from its `response.output_item.added`, since
+        `response.function_call_arguments.done` does not carry it.
+        """
+        if not self.tools:
+            return
+        if event_name == "response.function_call_arguments.delta":
+            if self._speculations:
+                self._on_arguments_delta(event)
+        elif event_name == "response.function_call_arguments.done":
+            call = ToolCall(
+                event["response_id"],
+                event["item_id"],
+                event["call_id"],
+                self._names.pop(event["item_id"], ""),
+                event["arguments"],
+            )
+            speculation = self._speculations.pop(call.item_id, None)
+            if speculation is not None and speculation.task is not None:
+                call.task = self._resolve_speculation(speculation, call.arguments)
+            if call.task is None:
+                call.task = self._spawn(self.execute(call.name, call.arguments))
+            self._calls.setdefault(call.response_id, []).append(call)
+        elif event_name == "response.output_item.added":
+            item = event["item"]
+            if item.get("type") == "function_call":
+                self._names[item["id"]] = item["name"]
+                tool = self.tools.get(item["name"])
+                if self.speculate and tool is not None and tool.idempotent:
+                    self._speculations[item["id"]] = Speculation(
+                        event["response_id"], tool.name, tool.speculate_on
+                    )
+        elif event_name == "response.done":
+            response = event["response"]
+            if self._speculations:
+                self._discard_speculations(response["id"])
+            calls = self._calls.pop(response["id"], None)
+            if calls is None:
+                return
+            if response["status"] != "completed":
+                for call in calls:
+                    call.task.cancel()
+                return
+            self._spawn(self._submit(calls))
+
+    async def execute(self, name: str, arguments: str) -> str:
+        """Run a tool with the JSON encoded arguments of a function call.
+
+        Returns:
+            str: The output of the call. A JSON object with an `error` message if the tool
+                is unknown, the arguments are invalid, or the tool raised or timed out.
+        """
+        tool = self.tools.get(name)
+        if tool is None:
+            return _error_output(f"Unknown tool: {name}")
+        try:
+            kwargs = json.loads(arguments) if arguments else {}
+        except json.JSONDecodeError as e:
+            tool.errors += 1
+            return _error_output(f"Invalid arguments: {e}")
+        return await self._execute(tool, kwargs)
+
+    async def _execute(self, tool: Tool, kwargs: dict) -> str:
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+        try:
+            if tool.semaphore is not None:
+                await tool.semaphore.acquire()
+            try:
+                return await self._run(tool, kwargs)
+            finally:
+                if tool.semaphore is not None:
+                    tool.semaphore.release()
+        finally:
+            if self.semaphore is not None:
+                self.semaphore.release()
+
+    async def _run(self, tool: Tool, kwargs: dict) -> str:
+        tool.calls += 1
+        tool.running += 1
+        start = time.perf_counter()
+        try:
+            if tool.is_async:
+                call = tool.function(**kwargs)
+            else:
+                call = asyncio.get_running_loop().run_in_executor(
+                    self.executor, partial(tool.function, **kwargs)
+                )
+            result = await asyncio.wait_for(_guard_timeout(call), tool.timeout)
+            return _serialize(result)
+        except asyncio.TimeoutError:
+            tool.timeouts += 1
+            self.client.logger.warning(
+                f"Tool {tool.name} timed out after {tool.timeout}s"
+            )
+            return _error_output(f"Timed out after {tool.timeout}s")
+        except Exception as e:
+            if isinstance(e, _ToolTimeoutError):
+                e = e.__cause__
+            tool.errors += 1
+            self.client.logger.error(f"Tool {tool.name} failed: {e!r}")
+            return _error_output(str(e) or type(e).__name__)
+        finally:
+            tool.running -= 1
+            tool.latency.record(time.perf_counter() - start)
+
+    def _on_arguments_delta(self, event: dict) -> None:
+        speculation = self._speculations.get(event["item_id"])
+        if speculation is None or speculation.task is not None:
+            return
+        speculation.parser.feed(event["delta"])
+        if speculation.ready():
+            speculation.kwargs = dict(speculation.parser.fields)
+            speculation.started = time.perf_counter()
+            speculation.task = self._spawn(
+                self._execute(self.tools[speculation.tool_name], speculation.kwargs)
+            )
+            self.speculation.started += 1
+
+    def _resolve_speculation(
+        self, speculation: Speculation, arguments: str
+    ) -> asyncio.Task | None:
+        """The speculative run, if it was started with the final arguments."""
+        try:
+            final = json.loads(arguments) if arguments else {}
+        except json.JSONDecodeError:
+            final = None
+        if speculation.matches(final):
+            self.speculation.hit(speculation)
+            return speculation.task
+        speculation.task.cancel()
+        self.speculation.wasted += 1
+        return None
+
+    def _discard_speculations(self, response_id: str) -> None:
+        for item_id, speculation in list(self._speculations.items()):
+            if speculation.response_id == response_id:
+                del self._speculations[item_id]
+                if speculation.task is not None:
+                    speculation.task.cancel()
+                    self.speculation.wasted += 1
+
+    async def _submit(self, calls: list[ToolCall]) -> None:
+        start = time.perf_counter()
+        outputs = await asyncio.gather(*(call.task for call in calls))
+        for call, output in zip(calls, outputs):
+            await self.client.conversation_item_create(
+                Item(
+                    item_type="function_call_output",
+                    call_id=call.call_id,
+                    output=output,
+                )
+            )
+        if self.auto_respond:
+            await self.client.response_create()
+        self.turn_latency.record(time.perf_counter() - start)
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def stats(self) -> list[ToolStats]:
+        """Get the counters and latency percentiles of every tool, in milliseconds."""
+        return [tool.stats() for tool in self.tools.values()]
+
+    def speculation_stats(self) -> SpeculationStats:
+        """Get the hit and waste rates of speculative runs, and their lead time in
+        milliseconds."""
+        return self.speculation.stats()
+
+    def cancel(self) -> None:
+        """Cancel every running call and pending submission."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._names.clear()
+        self._calls.clear()
+        self._speculations.clear()
+
+    def clear(self) -> None:
+        """Cancel every call, remove all tools and release the thread pool."""
+        self.cancel()
+        self.tools.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
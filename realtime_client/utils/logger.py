@@ -1,8 +1,11 @@
+import atexit
+import json
 import logging
-from datetime import datetime
+import queue
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 
-from typing_extensions import Literal
+from typing_extensions import Any, Literal
 
 
 class Color:
@@ -36,61 +39,265 @@ class Verbosity(Enum):
         raise ValueError(f"Cannot compare {self} with {other}")
 
 
+DEFAULT_SAMPLING: dict[str, int] = {
+    "response.audio.delta": 50,
+    "input_audio_buffer.append": 50,
+    "response.audio_transcript.delta": 10,
+    "response.text.delta": 10,
+    "response.function_call_arguments.delta": 10,
+}
+"""Only one in N events of these high-frequency types is logged by `log_event()`."""
+
+_DIRECTIONS = {
+    "server": f"{Color.GREEN}↓ Server:{Color.RESET}",
+    "client": f"{Color.LIGHT_BLUE}↑ Client:{Color.RESET}",
+}
+
+
+def redact(value: Any, max_chars: int) -> Any:
+    """Replace base64 audio with its size, and truncate long strings, in an event.
+
+    Args:
+        value: The event, or one of its values
+        max_chars: Strings longer than this are truncated
+    """
+    if isinstance(value, dict):
+        binary = value.get("type") == "response.audio.delta"
+        return {
+            field: (
+                _binary_summary(item)
+                if field == "audio" or (binary and field == "delta")
+                else redact(item, max_chars)
+            )
+            for field, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item, max_chars) for item in value]
+    if isinstance(value, str) and len(value) > max_chars:
+        return f"{value[:max_chars]}…(+{len(value) - max_chars} chars)"
+    return value
+
+
+def _binary_summary(value: Any) -> Any:
+    if isinstance(value, str):
+        return f"<{len(value) * 3 // 4} bytes of base64 audio>"
+    return value
+
+
+class _EventMessage:
+    """The message of a logged event, only formatted if and when a handler emits it.
+
+    A dict payload must already be redacted. A string payload is a serialized frame, only
+    parsed and redacted if it is too long.
+    """
+
+    __slots__ = ("direction", "event_type", "payload", "sampled", "max_chars")
+
+    def __init__(
+        self,
+        direction: str,
+        event_type: str,
+        payload: dict | str | None,
+        sampled: int,
+        max_chars: int,
+    ):
+        self.direction = direction
+        self.event_type = event_type
+        self.payload = payload
+        self.sampled = sampled
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        message = f"{_DIRECTIONS[self.direction]} {self.event_type}"
+        if self.sampled > 1:
+            message += f" (1 of {self.sampled})"
+        payload = self.payload
+        if payload is None:
+            return message
+        if isinstance(payload, str) and len(payload) > self.max_chars:
+            payload = redact(json.loads(payload), self.max_chars)
+        return f"{message} {payload}"
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Adds the timestamp and colors to a record, in the handler's thread."""
+
+    default_time_format = "%Y-%m-%d %H:%M:%S"
+    default_msec_format = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        prefix = f"{Color.GREY}[{self.formatTime(record)}]{Color.RESET}"
+        if record.levelno >= logging.ERROR:
+            return f"{prefix} {Color.RED}ERROR - {message}{Color.RESET}"
+        if record.levelno >= logging.WARNING:
+            return f"{prefix} {Color.YELLOW}WARNING - {message}{Color.RESET}"
+        return f"{prefix} {message}"
+
+
+class DroppingQueueHandler(QueueHandler):
+    """A `QueueHandler` that never blocks or formats on the logging thread.
+
+    Records are enqueued as is, and formatted by the handlers of the `QueueListener`, so
+    the arguments of a message must not be mutated once it is logged. When the queue is
+    full, records are dropped and counted in `dropped`.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    """A `QueueListener` whose `stop()` can be called any number of times, e.g. at exit
+    after it was stopped already."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.running = False
+
+    def start(self) -> None:
+        super().start()
+        self.running = True
+
+    def stop(self) -> None:
+        """Write the queued records and stop the thread, if running."""
+        if self.running:
+            self.running = False
+            super().stop()
+
+
+_sampling_counters: dict[str | None, dict[str, int]] = {}
+"""Events seen of each sampled type, per logger name."""
+
+
 class RealtimeClientLogger:
+    """Logs the client's messages and events without slowing down the event loop.
+
+    Records go through a `DroppingQueueHandler` to a `QueueListener`, whose background
+    thread formats them and writes them to stderr. Events are only turned into a record
+    when DEBUG is enabled, and high-frequency events are sampled, see `DEFAULT_SAMPLING`.
+    Sampling counts events per logger name, so clients sharing a name are sampled
+    together, like the records they share.
+    The payload of a logged event is redacted on the caller's thread, which replaces base64
+    audio and long strings and copies the event, so later changes to it are not logged.
+    The message is formatted lazily in the writer thread.
+
+    Args:
+        name: The name of the logger
+        verbosity: Above NORMAL, events are logged with their payload
+        level: The level of the logger
+        sampling: Log only one in N events of each type. Defaults to `DEFAULT_SAMPLING`.
+        max_field_chars: Strings of event payloads longer than this are truncated
+        queue_size: Records queued for the writer thread before new ones are dropped
+    """
+
     def __init__(
-        self, name: str | None, verbosity: Verbosity, level: int = logging.DEBUG
+        self,
+        name: str | None,
+        verbosity: Verbosity,
+        level: int = logging.DEBUG,
+        sampling: dict[str, int] | None = None,
+        max_field_chars: int = 200,
+        queue_size: int = 10000,
     ):
         self.verbosity = verbosity
-        self.logger = self._init_logger(name, level)
+        self.sampling = DEFAULT_SAMPLING if sampling is None else sampling
+        self.max_field_chars = max_field_chars
+        self._seen = _sampling_counters.setdefault(name, {})
+        self.logger = self._init_logger(name, level, queue_size)
 
-    def _init_logger(self, name: str | None, level: int):
+    def _init_logger(self, name: str | None, level: int, queue_size: int):
         logger = logging.getLogger(name)
         logger.setLevel(level)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        if not logger.handlers:
+            # Every client gets a logger, only the first one installs the handler
+            log_queue = queue.Queue(queue_size)
+            handler = logging.StreamHandler()
+            handler.setFormatter(ConsoleFormatter("%(message)s"))
+            listener = _Listener(log_queue, handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            queue_handler = DroppingQueueHandler(log_queue)
+            queue_handler.listener = listener
+            logger.addHandler(queue_handler)
         return logger
 
+    @property
+    def listener(self) -> QueueListener | None:
+        """The listener writing the records in a background thread, if any."""
+        for handler in self.logger.handlers:
+            if isinstance(handler, DroppingQueueHandler):
+                return handler.listener
+        return None
+
     def debug(self, message: str, *args, **kwargs):
-        prefix = f"{Color.GREY}[{self._get_timestamp()}]{Color.RESET}"
-        formatted_message = f"{prefix} {message}"
-        self.logger.debug(formatted_message, *args, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
 
     def info(self, message: str, *args, **kwargs):
-        prefix = f"{Color.GREY}[{self._get_timestamp()}]{Color.RESET}"
-        formatted_message = f"{prefix} {message}"
-        self.logger.info(formatted_message, *args, **kwargs)
+        self.logger.info(message, *args, **kwargs)
 
     def warning(self, message: str, *args, **kwargs):
-        prefix = f"{Color.GREY}[{self._get_timestamp()}]{Color.RESET}"
-        formatted_message = f"{prefix} {Color.YELLOW}WARNING - {message}{Color.RESET}"
-        self.logger.warning(formatted_message, *args, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
 
     def error(self, message: str, *args, **kwargs):
-        prefix = f"{Color.GREY}[{self._get_timestamp()}]{Color.RESET}"
-        formatted_message = f"{prefix} {Color.RED}ERROR - {message}{Color.RESET}"
-        self.logger.error(formatted_message, *args, **kwargs)
-
-    def log_event(self, event: dict, log_type: Literal["server", "client"]):
-        suffix = ""
-        if self.verbosity > Verbosity.NORMAL:
-            suffix = f" {event}"
+        self.logger.error(message, *args, **kwargs)
 
-        if log_type == "server":
-            prefix = f"{Color.GREEN}↓ Server:{Color.RESET}"
-        elif log_type == "client":
-            prefix = f"{Color.LIGHT_BLUE}↑ Client:{Color.RESET}"
+    def _sample(self, event_type: str) -> int | None:
+        """How many events the logged one stands for, or None to skip it."""
+        every = self.sampling.get(event_type)
+        if every is None or every <= 1:
+            return 1
+        seen = self._seen.get(event_type, 0)
+        self._seen[event_type] = seen + 1
+        return every if seen % every == 0 else None
 
-        formatted_message = f"{prefix} {event['type']}{suffix}"
-        self.debug(formatted_message)
+    def log_event(self, event: dict, log_type: Literal["server", "client"]):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        event_type = event["type"]
+        sampled = self._sample(event_type)
+        if sampled is None:
+            return
+        # Copied now, since handlers may change the event before the writer formats it
+        payload = (
+            redact(event, self.max_field_chars)
+            if self.verbosity > Verbosity.NORMAL
+            else None
+        )
+        self.logger.debug(
+            _EventMessage(log_type, event_type, payload, sampled, self.max_field_chars)
+        )
 
-    def _get_timestamp(self):
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def log_frame(
+        self, event_type: str, frame: str, log_type: Literal["server", "client"]
+    ):
+        """Log an already serialized event without parsing it back into a dict."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        sampled = self._sample(event_type)
+        if sampled is None:
+            return
+        payload = frame if self.verbosity > Verbosity.NORMAL else None
+        self.logger.debug(
+            _EventMessage(log_type, event_type, payload, sampled, self.max_field_chars)
+        )
 
 
 def get_logger(
-    name: str | None = None, verbosity: int = 1, debug_level: int = logging.DEBUG
+    name: str | None = None,
+    verbosity: int = 1,
+    debug_level: int = logging.DEBUG,
+    sampling: dict[str, int] | None = None,
 ) -> RealtimeClientLogger:
     """
     Get a configured logger instance.
@@ -99,10 +306,12 @@ def get_logger(
         name (str | None): The name of the logger. If None, returns the root logger.
         verbosity (int): The verbosity level. 1 is normal, 2 is more verbose, 3 is debug.
         debug_level (int): The debug level. Defaults to logging.DEBUG.
+        sampling (dict[str, int] | None): Log only one in N events of each type. Defaults
+            to `DEFAULT_SAMPLING`, pass an empty dict to log every event.
 
     Returns:
         RealtimeClientLogger: Configured logger instance
     """
     return RealtimeClientLogger(
-        name or "realtime_client", Verbosity(verbosity), debug_level
+        name or "realtime_client", Verbosity(verbosity), debug_level, sampling
     )
@@ -0,0 +1,95 @@
+import asyncio
+
+from typing_extensions import Callable
+
+EventPredicate = Callable[[dict], bool]
+"""Selects the events a waiter is interested in, e.g. by `response_id` or `item_id`."""
+
+
+class WaiterRegistry:
+    """Futures waiting for server events, indexed by event name.
+
+    Any number of waiters can wait for the same event name, each with its own optional
+    predicate. Waiters of an event name are kept in insertion order in a dictionary, so
+    adding and removing one is O(1), and resolving an event only visits the waiters of its
+    own name.
+    """
+
+    def __init__(self):
+        self._waiters: dict[str, dict[asyncio.Future, EventPredicate | None]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def add(
+        self, event_name: str, predicate: EventPredicate | None = None
+    ) -> asyncio.Future:
+        """Register a waiter for an event name.
+
+        Args:
+            event_name: The event name to wait for
+            predicate: Only resolve the waiter with events for which this returns True. If
+                None, the next event of that name resolves it.
+
+        Returns:
+            asyncio.Future: A future resolved with the event payload. Pass it to
+                `discard()` once it is no longer awaited.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(event_name, {})[future] = predicate
+        return future
+
+    def discard(self, event_name: str, future: asyncio.Future) -> None:
+        """Remove a waiter, e.g. after it timed out. Resolved waiters are already removed."""
+        waiters = self._waiters.get(event_name)
+        if waiters is not None and waiters.pop(future, False) is not False:
+            if not waiters:
+                del self._waiters[event_name]
+
+    def has_waiters(self, event_name: str) -> bool:
+        return event_name in self._waiters
+
+    def resolve(self, event_name: str, event: dict) -> int:
+        """Resolve the waiters of an event name whose predicate matches the event.
+
+        A predicate that raises resolves its waiter with the exception.
+
+        Returns:
+            int: The number of waiters resolved
+        """
+        waiters = self._waiters.get(event_name)
+        if not waiters:
+            return 0
+        finished = []
+        resolved = 0
+        for future, predicate in waiters.items():
+            if future.done():
+                # Cancelled, and not discarded yet
+                finished.append(future)
+                continue
+            try:
+                if predicate is not None and not predicate(event):
+                    continue
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(event)
+            finished.append(future)
+            resolved += 1
+        for future in finished:
+            del waiters[future]
+        if not waiters:
+            del self._waiters[event_name]
+        return resolved
+
+    def clear(self, exc: BaseException | None = None) -> None:
+        """Remove all waiters, failing them with `exc`, or cancelling them if it is None."""
+        for waiters in self._waiters.values():
+            for future in waiters:
+                if future.done():
+                    continue
+                if exc is None:
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+        self._waiters.clear()
@@ -0,0 +1,48 @@
+import asyncio
+import inspect
+import logging
+from contextlib import asynccontextmanager
+
+import pytest
+
+from realtime_client import RealtimeClient
+from realtime_client.mock_server import MockRealtimeServer, ResponseScript
+
+TEST_TIMEOUT = 20
+"""Seconds after which a coroutine test fails instead of hanging."""
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem: pytest.Function) -> bool | None:
+    """Run `async def` tests in a fresh event loop, without a pytest plugin."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {
+        name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames
+    }
+    asyncio.run(asyncio.wait_for(pyfuncitem.obj(**arguments), TEST_TIMEOUT))
+    return True
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logger = logging.getLogger("realtime_client")
+    logger.disabled = True
+    yield
+    logger.disabled = False
+
+
+@asynccontextmanager
+async def connected(script: ResponseScript | None = None, **client_kwargs):
+    """A `MockRealtimeServer` and a `RealtimeClient` connected to it."""
+    async with MockRealtimeServer(script=script) as server:
+        async with RealtimeClient(
+            uri=server.uri, api_key="test", **client_kwargs
+        ) as client:
+            yield server, client
+
+
+@pytest.fixture
+def session():
+    """Open a mock server and a connected client with `async with session(...)`."""
+    return connected
@@ -0,0 +1,84 @@
+import pytest
+
+from realtime_client.audio import AudioPlayer, PCMRingBuffer
+from realtime_client.barge_in import BargeInController
+
+RATE = 24000
+BYTES_PER_MS = 48
+
+
+class Player(AudioPlayer):
+    output_latency = 0.03
+
+
+class Client:
+    def __init__(self):
+        self.sent: list[tuple] = []
+
+    async def response_cancel(self) -> None:
+        self.sent.append(("response.cancel",))
+
+    async def conversation_item_truncate(
+        self, item_id: str, content_index: int, audio_end_ms: int
+    ) -> None:
+        self.sent.append(
+            ("conversation.item.truncate", item_id, content_index, audio_end_ms)
+        )
+
+
+def delta(response_id: str, item_id: str) -> dict:
+    return {"response_id": response_id, "item_id": item_id, "content_index": 0}
+
+
+def play(controller: BargeInController, ms: int, heard_ms: int) -> None:
+    """Write `ms` of audio for item i1 of resp_1, of which `heard_ms` is played."""
+    controller._on_response_created({"response": {"id": "resp_1"}})
+    assert controller.on_audio_delta(delta("resp_1", "i1"))
+    controller.player.buffer.write(bytes(ms * BYTES_PER_MS))
+    controller.player.buffer.advance(heard_ms * BYTES_PER_MS)
+
+
+@pytest.fixture
+def controller() -> BargeInController:
+    player = Player(PCMRingBuffer(4 * RATE * 2), rate=RATE)
+    return BargeInController(Client(), player)
+
+
+async def test_fully_heard_item_is_not_truncated(controller):
+    play(controller, 2000, heard_ms=2000)
+    controller._on_response_done({"response": {"id": "resp_1"}})
+    assert await controller.interrupt() is None
+    assert controller.client.sent == []
+    assert controller.interruptions == 0
+
+
+async def test_mid_playback_cancels_and_truncates_to_the_heard_audio(controller):
+    play(controller, 2000, heard_ms=1000)
+    # Output latency: the last 30 ms handed to the device are not heard yet
+    assert await controller.interrupt() == 970
+    assert controller.client.sent == [
+        ("response.cancel",),
+        ("conversation.item.truncate", "i1", 0, 970),
+    ]
+    assert len(controller.player.buffer) == 0
+    # The rest of the cancelled response is dropped
+    assert not controller.on_audio_delta(delta("resp_1", "i1"))
+
+
+async def test_done_response_still_playing_is_truncated(controller):
+    controller.compensate_latency = False
+    play(controller, 2000, heard_ms=500)
+    controller._on_response_done({"response": {"id": "resp_1"}})
+    assert await controller.interrupt() == 500
+    assert controller.client.sent == [("conversation.item.truncate", "i1", 0, 500)]
+
+
+async def test_second_item_is_truncated_from_its_own_start(controller):
+    play(controller, 1000, heard_ms=1000)
+    controller._on_response_done({"response": {"id": "resp_1"}})
+    controller._on_response_created({"response": {"id": "resp_2"}})
+    assert controller.on_audio_delta(delta("resp_2", "i2"))
+    controller.player.buffer.write(bytes(1000 * BYTES_PER_MS))
+    controller.player.buffer.advance(300 * BYTES_PER_MS)
+    assert await controller.interrupt() == 270
+    assert controller.client.sent[-1] == ("conversation.item.truncate", "i2", 0, 270)
@@ -0,0 +1,179 @@
+import asyncio
+import base64
+
+import pytest
+
+from realtime_client import RealtimeAPIError
+from realtime_client.events import ConversationItemCreate, InputAudioBufferAppend
+from realtime_client.mock_server import ResponseScript
+from realtime_client.models import Item, ResponseConfig, SessionConfig
+from realtime_client.outbound import SendQueue
+
+TEXT = ResponseConfig(modalities=["text"])
+
+
+def user_message(text: str, item_id: str | None = None) -> Item:
+    return Item(
+        id=item_id,
+        type="message",
+        role="user",
+        content=[{"type": "input_text", "text": text}],
+    )
+
+
+async def test_response_round_trip(session):
+    async with session(ResponseScript(text="Hi there")) as (_, client):
+        deltas = []
+        client.on("response.text.delta", lambda event: deltas.append(event["delta"]))
+        done = asyncio.ensure_future(client.wait_for("response.done", timeout=5))
+        await asyncio.sleep(0)
+        created = await (await client.response_create(TEXT))
+        event = await done
+    assert created["response"]["id"] == event["response"]["id"]
+    assert event["response"]["status"] == "completed"
+    assert "".join(deltas) == "Hi there"
+
+
+async def test_typed_handlers_survive_null_previous_item_id(session):
+    async with session() as (_, client):
+        typed = []
+        client.on("conversation.item.created", typed.append, typed=True)
+        client.on("input_audio_buffer.committed", typed.append, typed=True, mode="task")
+
+        # The first item of the conversation has no previous item
+        await (await client.conversation_item_create(user_message("Hello")))
+        await client.input_audio_buffer_append(base64.b64encode(bytes(4800)).decode())
+        await (await client.input_audio_buffer_commit())
+        await asyncio.sleep(0.05)
+
+        assert not client.listener_task.done()
+        assert typed[0].previous_item_id is None
+        assert sorted(type(event).__name__ for event in typed) == [
+            "ConversationItemCreated",
+            "ConversationItemCreated",
+            "InputAudioBufferCommitted",
+        ]
+        assert all(stats["errors"] == 0 for stats in client.router.stats())
+
+
+async def test_undecodable_event_only_fails_typed_handlers(session):
+    async with session() as (_, client):
+        raw, typed = [], []
+        client.on("conversation.item.created", typed.append, typed=True)
+        client.on("conversation.item.created", raw.append)
+        await client.router.dispatch(
+            "conversation.item.created", {"type": "conversation.item.created"}
+        )
+        assert typed == []
+        assert len(raw) == 1
+        assert [stats["errors"] for stats in client.router.stats()] == [1, 0]
+
+
+async def test_session_update_handle(session):
+    async with session() as (server, client):
+        updated = await (
+            await client.session_update(SessionConfig(instructions="Be brief"))
+        )
+        assert updated["type"] == "session.updated"
+        assert updated["session"]["instructions"] == "Be brief"
+        assert next(iter(server.sessions)).session["instructions"] == "Be brief"
+
+
+async def test_rejected_event_fails_its_handle(session):
+    async with session() as (_, client):
+        handle = await client.input_audio_buffer_commit()
+        with pytest.raises(RealtimeAPIError) as error:
+            await handle
+        assert error.value.code == "buffer_empty"
+        assert error.value.event_type == "input_audio_buffer.commit"
+        assert client.correlation.failed == 1
+
+
+async def test_item_create_without_id_ignores_other_items(session):
+    async with session(ResponseScript(audio_ms=0)) as (_, client):
+        event = ConversationItemCreate(item=user_message("Hello"))
+        # Tracked but not sent: only the server's own item is created
+        handle = client.correlation.track(event)
+        assert event.item.id is not None
+        done = asyncio.ensure_future(client.wait_for("response.done", timeout=5))
+        await asyncio.sleep(0)
+        await client.response_create(TEXT)
+        await done
+        assert not handle.done()
+        client.correlation.discard(event.event_id)
+
+
+async def test_wait_for_predicate_and_timeout(session):
+    async with session(ResponseScript(audio_ms=0)) as (_, client):
+        waiter = asyncio.ensure_future(
+            client.wait_for(
+                "conversation.item.created",
+                timeout=5,
+                predicate=lambda event: event["item"]["role"] == "assistant",
+            )
+        )
+        await asyncio.sleep(0)
+        await client.conversation_item_create(user_message("Hello"))
+        await client.response_create(TEXT)
+        event = await waiter
+        assert event["item"]["role"] == "assistant"
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.wait_for("session.updated", timeout=0.05)
+        assert len(client.waiters) == 0
+
+
+async def test_close_fails_pending_waiters(session):
+    async with session() as (_, client):
+        waiter = asyncio.ensure_future(client.wait_for("response.done"))
+        await asyncio.sleep(0)
+    with pytest.raises(ConnectionError):
+        await waiter
+
+
+async def test_send_queue_coalesces_audio(session):
+    chunk = base64.b64encode(bytes(4800)).decode()
+    queue = SendQueue(coalesce_ms=50)
+    async with session(send_queue=queue) as (server, client):
+        for _ in range(10):
+            await client.input_audio_buffer_append(chunk)
+        committed = await (await client.input_audio_buffer_commit())
+        assert committed["type"] == "input_audio_buffer.committed"
+        stats = queue.stats()
+    assert server.audio_bytes_received == 48000
+    assert stats["sent_frames"] == 11
+    assert stats["coalesced_frames"] > 0
+    assert server.events_received < 11
+
+
+async def test_send_queue_sends_typed_appends_as_is(session):
+    chunk = base64.b64encode(bytes(4800)).decode()
+    queue = SendQueue(coalesce_ms=50)
+    async with session(send_queue=queue) as (server, client):
+        await client.input_audio_buffer_append(chunk)
+        await client.send_event(InputAudioBufferAppend(audio=chunk))
+        await client.input_audio_buffer_append(chunk)
+        committed = await (await client.input_audio_buffer_commit())
+        assert committed["type"] == "input_audio_buffer.committed"
+        stats = queue.stats()
+    assert server.audio_bytes_received == 3 * 4800
+    # The serialized append is neither merged nor wrapped again
+    assert stats["coalesced_frames"] == 0
+    assert server.events_received == 4
+
+
+async def test_server_vad_response_does_not_acknowledge_response_create(session):
+    script = ResponseScript(audio_ms=200, deltas_per_second=100)
+    async with session(script, send_queue=SendQueue()) as (_, client):
+        turn_detection = {"type": "server_vad"}
+        await (
+            await client.session_update(SessionConfig(turn_detection=turn_detection))
+        )
+        # Both are tracked before they are written: the server detects a turn and
+        # starts its own response before it sees response.create
+        await client.input_audio_buffer_append(base64.b64encode(bytes(4800)).decode())
+        handle = await client.response_create(TEXT)
+        with pytest.raises(RealtimeAPIError, match="already in progress"):
+            await handle
+        done = await client.wait_for("response.done", timeout=5)
+        assert done["response"]["status"] == "completed"
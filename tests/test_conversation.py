@@ -0,0 +1,68 @@
+from realtime_client.conversation import ConversationStore
+from realtime_client.mock_server import ResponseScript
+from realtime_client.models import Item
+
+BYTES_PER_MS = 48
+
+
+def user_message(text: str) -> Item:
+    return Item(
+        type="message", role="user", content=[{"type": "input_text", "text": text}]
+    )
+
+
+async def test_store_follows_the_conversation(session):
+    script = ResponseScript(text="Hi, how can I help?", audio_ms=320)
+    async with session(script) as (_, client):
+        store = ConversationStore()
+        store.attach(client)
+        await (await client.conversation_item_create(user_message("Hello")))
+        await client.response_create()
+        done = await client.wait_for("response.done", timeout=5)
+
+    response_id = done["response"]["id"]
+    user_id, assistant_id = store.item_ids()
+    assert [item.role for item in store] == ["user", "assistant"]
+    assert store.text(user_id) == "Hello"
+    assert store.text(assistant_id) == "Hi, how can I help?"
+    assert len(store.audio(assistant_id)) == 320 * BYTES_PER_MS
+    assert [item.id for item in store.response(response_id).output] == [assistant_id]
+
+
+async def test_truncation_cuts_audio_and_drops_the_transcript(session):
+    script = ResponseScript(text="A long answer", audio_ms=480)
+    async with session(script) as (_, client):
+        store = ConversationStore()
+        store.attach(client)
+        await client.response_create()
+        done = await client.wait_for("response.done", timeout=5)
+        item_id = done["response"]["output"][0]["id"]
+        await (await client.conversation_item_truncate(item_id, 0, 120))
+
+    assert len(store.audio(item_id)) == 120 * BYTES_PER_MS
+    assert store.text(item_id) == ""
+
+
+def created(item_id: str, previous_item_id: str | None, text: str) -> dict:
+    return {
+        "type": "conversation.item.created",
+        "previous_item_id": previous_item_id,
+        "item": {
+            "id": item_id,
+            "type": "message",
+            "role": "user",
+            "content": [{"type": "input_text", "text": text}],
+        },
+    }
+
+
+def test_items_are_ordered_by_previous_item_id():
+    store = ConversationStore()
+    store.apply(created("item_1", None, "one"))
+    store.apply(created("item_3", "item_1", "three"))
+    store.apply(created("item_2", "item_1", "two"))
+    store.apply(created("item_0", None, "zero"))
+    assert list(store.item_ids()) == ["item_0", "item_1", "item_2", "item_3"]
+    store.apply({"type": "conversation.item.deleted", "item_id": "item_2"})
+    assert [store.text(item.id) for item in store] == ["zero", "one", "three"]
+    assert "item_2" not in store
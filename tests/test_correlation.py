@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from realtime_client.correlation import CorrelationTable, RealtimeAPIError
+from realtime_client.events import (
+    ConversationItemCreate,
+    ConversationItemDelete,
+    InputAudioBufferCommit,
+    ResponseCreate,
+)
+from realtime_client.models import Item
+
+
+def item_created(item_id: str) -> dict:
+    return {"type": "conversation.item.created", "item": {"id": item_id}}
+
+
+def message(item_id: str | None = None) -> Item:
+    return Item(id=item_id, type="message", role="user", content=[])
+
+
+async def test_event_ids_are_unique():
+    table = CorrelationTable()
+    assert len({table.next_id() for _ in range(1000)}) == 1000
+    assert CorrelationTable().next_id() != table.next_id()
+
+
+async def test_acknowledgements_resolve_in_order():
+    table = CorrelationTable()
+    first = table.track(ResponseCreate())
+    second = table.track(ResponseCreate())
+    created = {"type": "response.created", "response": {"id": "resp_1"}}
+    assert table.on_event("response.created", created) is not None
+    assert first.result() is created
+    assert not second.done()
+    table.clear()
+    assert second.cancelled()
+
+
+async def test_on_event_returns_the_acknowledged_event_id():
+    table = CorrelationTable()
+    event = ResponseCreate(event_id="evt_mine")
+    table.track(event)
+    assert table.on_event("response.created", {"response": {"id": "r"}}) == "evt_mine"
+    assert table.on_event("response.created", {"response": {"id": "r"}}) is None
+
+
+async def test_item_acknowledgements_match_by_item_id():
+    table = CorrelationTable()
+    create = table.track(ConversationItemCreate(item=message("item_a")))
+    delete = table.track(ConversationItemDelete(item_id="item_b"))
+    table.on_event("conversation.item.created", item_created("item_server"))
+    assert not create.done()
+    table.on_event("conversation.item.created", item_created("item_a"))
+    assert create.result()["item"]["id"] == "item_a"
+    table.on_event(
+        "conversation.item.deleted",
+        {"type": "conversation.item.deleted", "item_id": "item_b"},
+    )
+    assert delete.done()
+
+
+async def test_item_create_without_id_gets_one():
+    table = CorrelationTable()
+    item = message()
+    event = ConversationItemCreate(item=item)
+    handle = table.track(event)
+    assert item.id is None
+    assert event.item.id.startswith("item_")
+    assert f'"id":"{event.item.id}"' in event.dump_json()
+    table.on_event("conversation.item.created", item_created("item_server"))
+    assert not handle.done()
+    table.on_event("conversation.item.created", item_created(event.item.id))
+    assert handle.done()
+
+
+async def test_commit_is_acknowledged_whatever_its_item_id():
+    table = CorrelationTable()
+    handle = table.track(InputAudioBufferCommit())
+    table.on_event(
+        "input_audio_buffer.committed",
+        {"type": "input_audio_buffer.committed", "item_id": "item_1"},
+    )
+    assert handle.done()
+
+
+async def test_error_rejects_the_event_it_names():
+    table = CorrelationTable()
+    commit = InputAudioBufferCommit()
+    handle = table.track(commit)
+    other = table.track(ResponseCreate())
+    error = {"type": "invalid_request_error", "message": "Empty", "event_id": None}
+    error["event_id"] = commit.event_id
+    assert table.on_event("error", {"type": "error", "error": error}) == commit.event_id
+    with pytest.raises(RealtimeAPIError, match="input_audio_buffer.commit failed"):
+        handle.result()
+    assert not other.done()
+    assert table.failed == 1
+    table.clear()
+
+
+async def test_unacknowledged_events_time_out():
+    table = CorrelationTable(timeout=0.01)
+    handle = table.track(ResponseCreate())
+    table.track_id(table.next_id(), "input_audio_buffer.append")
+    with pytest.raises(asyncio.TimeoutError):
+        await handle
+    await asyncio.sleep(0.02)
+    assert len(table) == 0
+    assert table.timed_out == 1
+
+
+def server_vad(create_response: bool = True) -> dict:
+    turn_detection = {"type": "server_vad", "create_response": create_response}
+    return {"type": "session.updated", "session": {"turn_detection": turn_detection}}
+
+
+def server_turn(table: CorrelationTable, item_id: str) -> None:
+    table.on_event("input_audio_buffer.speech_stopped", {"item_id": item_id})
+    table.on_event("input_audio_buffer.committed", {"item_id": item_id})
+
+
+async def test_server_vad_turns_do_not_acknowledge_client_events():
+    table = CorrelationTable()
+    table.on_event("session.updated", server_vad())
+    commit = table.track(InputAudioBufferCommit())
+    create = table.track(ResponseCreate())
+    server_turn(table, "item_vad")
+    assert table.on_event("response.created", {"response": {"id": "resp_vad"}}) is None
+    assert not commit.done() and not create.done()
+
+    table.on_event("input_audio_buffer.committed", {"item_id": "item_mine"})
+    table.on_event("response.created", {"response": {"id": "resp_mine"}})
+    assert commit.result()["item_id"] == "item_mine"
+    assert create.result()["response"]["id"] == "resp_mine"
+
+
+async def test_server_vad_without_responses():
+    table = CorrelationTable()
+    table.on_event("session.updated", server_vad(create_response=False))
+    create = table.track(ResponseCreate())
+    server_turn(table, "item_vad")
+    table.on_event("response.created", {"response": {"id": "resp_mine"}})
+    assert create.result()["response"]["id"] == "resp_mine"
+
+
+async def test_reset_server_turns():
+    table = CorrelationTable()
+    table.on_event("session.updated", server_vad())
+    server_turn(table, "item_vad")
+    # The connection was lost before the server's response started
+    table.reset_server_turns()
+    create = table.track(ResponseCreate())
+    table.on_event("response.created", {"response": {"id": "resp_mine"}})
+    assert create.done()
@@ -0,0 +1,89 @@
+import struct
+import warnings
+
+import numpy as np
+import pytest
+
+from realtime_client.audio import g711
+
+# Reference values of the ITU-T G.711 codecs, as produced by the standard library's audioop
+ENCODED = [
+    # sample, µ-law, A-law
+    (0, 0xFF, 0xD5),
+    (1, 0xFF, 0xD5),
+    (-1, 0x7E, 0x55),
+    (8, 0xFE, 0xD5),
+    (-8, 0x7E, 0x55),
+    (100, 0xF2, 0xD3),
+    (-100, 0x72, 0x53),
+    (1000, 0xCE, 0xFA),
+    (-1000, 0x4E, 0x7A),
+    (12345, 0x97, 0xBD),
+    (32632, 0x80, 0xAA),
+    (32767, 0x80, 0xAA),
+    (-32768, 0x00, 0x2A),
+]
+DECODED = [
+    # code, µ-law sample, A-law sample
+    (0x00, -32124, -5504),
+    (0x0F, -16764, -6784),
+    (0x2A, -5372, -32256),
+    (0x55, -716, -8),
+    (0x7F, 0, -848),
+    (0x80, 32124, 5504),
+    (0xAA, 5372, 32256),
+    (0xD5, 716, 8),
+    (0xFF, 0, 848),
+]
+
+
+def pcm(*samples: int) -> bytes:
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+@pytest.mark.parametrize("sample, ulaw, alaw", ENCODED)
+def test_encoding_matches_the_reference(sample, ulaw, alaw):
+    assert g711.ulaw_encode(pcm(sample)) == bytes([ulaw])
+    assert g711.alaw_encode(pcm(sample)) == bytes([alaw])
+
+
+@pytest.mark.parametrize("code, ulaw, alaw", DECODED)
+def test_decoding_matches_the_reference(code, ulaw, alaw):
+    assert g711.ulaw_decode(bytes([code])) == pcm(ulaw)
+    assert g711.alaw_decode(bytes([code])) == pcm(alaw)
+
+
+@pytest.mark.parametrize("audio_format", ["g711_ulaw", "g711_alaw"])
+def test_decoded_samples_encode_to_the_same_code(audio_format):
+    codes = bytes(range(256))
+    decoded = g711.decode(codes, audio_format)
+    encoded = g711.encode(decoded, audio_format)
+    if audio_format == "g711_ulaw":
+        # Negative zero is encoded as positive zero
+        assert encoded == codes.replace(b"\x7f", b"\xff")
+    else:
+        assert encoded == codes
+
+
+@pytest.mark.parametrize("audio_format", ["g711_ulaw", "g711_alaw"])
+def test_every_sample_matches_audioop(audio_format):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        audioop = pytest.importorskip("audioop")
+    samples = np.arange(-32768, 32768, dtype="<i2").tobytes()
+    codes = bytes(range(256))
+    if audio_format == "g711_ulaw":
+        expected = audioop.lin2ulaw(samples, 2), audioop.ulaw2lin(codes, 2)
+    else:
+        expected = audioop.lin2alaw(samples, 2), audioop.alaw2lin(codes, 2)
+    assert g711.encode(samples, audio_format) == expected[0]
+    assert g711.decode(codes, audio_format) == expected[1]
+
+
+def test_pcm16_is_passed_through_and_unknown_formats_rejected():
+    assert g711.encode(memoryview(pcm(1, 2)), "pcm16") == pcm(1, 2)
+    assert g711.decode(bytearray(pcm(3)), "pcm16") == pcm(3)
+    with pytest.raises(ValueError):
+        g711.encode(pcm(0), "opus")
+    with pytest.raises(ValueError):
+        g711.decode(b"\0", "opus")
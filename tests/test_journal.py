@@ -0,0 +1,78 @@
+import base64
+import json
+
+import pytest
+
+from realtime_client import RealtimeClient
+from realtime_client.journal import JournalRecorder, JournalReplayer
+from realtime_client.mock_server import ResponseScript
+from realtime_client.outbound import encode_audio_append
+
+PCM = bytes(range(256)) * 4
+AUDIO = base64.b64encode(PCM).decode()
+
+
+def test_audio_is_stored_as_pcm(tmp_path):
+    path = tmp_path / "session.rtj"
+    delta = {
+        "type": "response.audio.delta",
+        "response_id": "resp_1",
+        "item_id": "item_1",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": AUDIO,
+    }
+    done = {"type": "response.done", "response": {"id": "resp_1"}}
+    with JournalRecorder(path) as recorder:
+        recorder.record_server(json.dumps(delta, separators=(",", ":")), delta)
+        recorder.record_client("input_audio_buffer.append", encode_audio_append(AUDIO))
+        recorder.record_server(json.dumps(done), done)
+    assert recorder.events == 3
+    assert recorder.pcm_bytes == 2 * len(PCM)
+    assert path.stat().st_size < 2 * len(AUDIO)
+
+    with JournalReplayer(path) as replayer:
+        events = [entry.event for entry in replayer]
+        server = [entry.event for entry in replayer.entries("server")]
+        client = [entry.event for entry in replayer.entries("client")]
+    assert events == [delta, json.loads(encode_audio_append(AUDIO)), done]
+    assert server == [delta, done]
+    assert [event["type"] for event in client] == ["input_audio_buffer.append"]
+
+
+def test_truncated_journals_end_at_the_last_full_frame(tmp_path):
+    path = tmp_path / "session.rtj"
+    with JournalRecorder(path) as recorder:
+        for i in range(2):
+            event = {"type": "response.created", "response": {"id": f"resp_{i}"}}
+            recorder.record_server(json.dumps(event), event)
+    path.write_bytes(path.read_bytes()[:-1])
+    with JournalReplayer(path) as replayer:
+        assert len(list(replayer)) == 1
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "session.json"
+    path.write_text('{"type": "session.created"}')
+    with pytest.raises(ValueError, match="not a journal"):
+        JournalReplayer(path)
+
+
+async def test_recorded_session_replays_offline(session, tmp_path):
+    path = tmp_path / "session.rtj"
+    script = ResponseScript(text="Hello there", audio_ms=200)
+    with JournalRecorder(path) as recorder:
+        async with session(script, recorder=recorder) as (_, client):
+            await client.response_create()
+            await client.wait_for("response.done", timeout=5)
+        recorded = recorder.events
+
+    offline = RealtimeClient(api_key="offline")
+    audio = []
+    offline.on("response.audio.delta", lambda event: audio.append(event["delta"]))
+    with JournalReplayer(path) as replayer:
+        stats = await replayer.replay(offline, speed=None)
+        sent = len(list(replayer.entries("client")))
+    assert stats["events"] + sent == recorded
+    assert stats["max_lag"] == 0
+    assert len(b"".join(base64.b64decode(delta) for delta in audio)) == 200 * 48
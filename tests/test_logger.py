@@ -0,0 +1,66 @@
+import logging
+
+from realtime_client.utils.logger import (
+    RealtimeClientLogger,
+    Verbosity,
+    get_logger,
+    redact,
+)
+
+
+def test_redact_replaces_audio_and_truncates_strings():
+    event = {
+        "type": "response.audio.delta",
+        "delta": "A" * 400,
+        "item": {"content": [{"text": "x" * 30}]},
+    }
+    assert redact(event, 20) == {
+        "type": "response.audio.delta",
+        "delta": "<300 bytes of base64 audio>",
+        "item": {"content": [{"text": "x" * 20 + "…(+10 chars)"}]},
+    }
+    assert event["delta"] == "A" * 400
+
+
+def test_events_are_sampled_per_logger_name(request, capsys):
+    name = request.node.name
+    first = get_logger(name, verbosity=1, sampling={"response.text.delta": 3})
+    second = get_logger(name, verbosity=1, sampling={"response.text.delta": 3})
+    for logger in (first, second, first, second):
+        logger.log_event({"type": "response.text.delta"}, "server")
+    first.log_event({"type": "session.updated"}, "server")
+    first.listener.stop()
+    lines = capsys.readouterr().err.splitlines()
+    assert len(lines) == 3
+    assert "response.text.delta (1 of 3)" in lines[0]
+    assert "response.text.delta (1 of 3)" in lines[1]
+    assert "session.updated" in lines[2]
+
+
+def test_payloads_are_copied_when_logged(request, capsys):
+    logger = RealtimeClientLogger(request.node.name, Verbosity.VERBOSE, sampling={})
+    event = {"type": "response.done", "response": {"status": "in_progress"}}
+    logger.log_event(event, "server")
+    event["response"]["status"] = "changed by a handler"
+    logger.log_frame("response.create", '{"type":"response.create"}', "client")
+    logger.listener.stop()
+    server, client = capsys.readouterr().err.splitlines()
+    assert "'status': 'in_progress'" in server
+    assert '{"type":"response.create"}' in client
+
+
+def test_nothing_is_logged_above_debug(request, capsys):
+    logger = get_logger(request.node.name, debug_level=logging.INFO)
+    logger.log_event({"type": "session.updated"}, "server")
+    logger.info("connected")
+    logger.listener.stop()
+    (line,) = capsys.readouterr().err.splitlines()
+    assert line.endswith("connected")
+
+
+def test_listener_can_be_stopped_again(request):
+    logger = get_logger(request.node.name)
+    logger.listener.stop()
+    # As done at exit
+    logger.listener.stop()
+    assert not logger.listener.running
@@ -0,0 +1,60 @@
+import pytest
+
+from realtime_client.metrics import LatencyHistogram, LatencyTracker
+
+
+@pytest.mark.parametrize("percentile", [50, 90, 99])
+def test_percentiles_are_within_the_histogram_error(percentile):
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+    assert histogram.percentile(percentile) == pytest.approx(percentile * 10, rel=0.016)
+    assert histogram.summary()["max"] == 1000
+    assert histogram.count == 1000
+
+
+def test_merge_and_reset():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.001)
+    second.record(2.0)
+    first.merge(second)
+    assert first.count == 2
+    assert first.percentile(100) == 2000
+    first.reset()
+    assert first.percentile(50) == 0
+
+
+def turn(tracker: LatencyTracker, index: int, status: str = "completed") -> None:
+    tracker.mark_commit_sent()
+    tracker.on_event("input_audio_buffer.committed", {"item_id": f"item_{index}"})
+    tracker.on_event("response.created", {"response": {"id": f"resp_{index}"}})
+    tracker.on_event("response.audio.delta", {"response_id": f"resp_{index}"})
+    tracker.on_event(
+        "response.done", {"response": {"id": f"resp_{index}", "status": status}}
+    )
+
+
+def test_turns_are_recorded():
+    tracker = LatencyTracker()
+    turn(tracker, 1)
+    turn(tracker, 2, status="cancelled")
+    summary = tracker.summary()
+    assert summary["commit_to_committed"]["count"] == 2
+    assert summary["time_to_first_audio"]["count"] == 2
+    # A cancelled response does not count towards the response duration
+    assert summary["response_duration"]["count"] == 1
+    assert tracker.timeline("resp_2")["status"] == "cancelled"
+    assert not tracker.by_item_id and not tracker.by_response_id
+
+
+def test_turns_in_progress_are_bounded_and_reset():
+    tracker = LatencyTracker(history=3)
+    for i in range(10):
+        tracker.on_event("input_audio_buffer.committed", {"item_id": f"item_{i}"})
+        tracker.on_event("response.created", {"response": {"id": f"resp_{i}"}})
+    assert list(tracker.by_response_id) == ["resp_7", "resp_8", "resp_9"]
+    assert len(tracker.by_item_id) == 3
+    tracker.mark_response_requested()
+    tracker.reset_pending()
+    assert not tracker.by_item_id and not tracker.by_response_id
+    assert tracker._pending is None
@@ -0,0 +1,100 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+from realtime_client.events import InputAudioBufferAppend
+from realtime_client.outbound import SendQueue, encode_audio_append
+
+AUDIO = base64.b64encode(bytes(4800)).decode()
+
+
+def test_encode_audio_append_matches_the_model():
+    model = InputAudioBufferAppend(audio=AUDIO)
+    assert json.loads(encode_audio_append(AUDIO)) == json.loads(model.dump_json())
+    model = InputAudioBufferAppend(audio=AUDIO, event_id="evt_1")
+    assert json.loads(encode_audio_append(AUDIO, "evt_1")) == json.loads(
+        model.dump_json()
+    )
+
+
+class Writer:
+    def __init__(self, fail_after: int | None = None):
+        self.frames: list[tuple[str, str]] = []
+        self.fail_after = fail_after
+
+    async def __call__(self, event_type: str, frame: str) -> None:
+        if self.fail_after is not None and len(self.frames) >= self.fail_after:
+            raise ConnectionError("socket closed")
+        await asyncio.sleep(0)
+        self.frames.append((event_type, frame))
+
+
+async def test_appends_are_coalesced_in_order():
+    queue = SendQueue(coalesce_bytes=len(AUDIO) * 3)
+    for _ in range(4):
+        await queue.put_audio(AUDIO)
+    await queue.put("response.create", '{"type":"response.create"}')
+    await queue.put_audio(AUDIO)
+    writer = Writer()
+    task = queue.start(writer)
+    await queue.flush(1)
+    task.cancel()
+
+    types = [event_type for event_type, _ in writer.frames]
+    assert types == [
+        "input_audio_buffer.append",
+        "input_audio_buffer.append",
+        "response.create",
+        "input_audio_buffer.append",
+    ]
+    audio = [json.loads(frame)["audio"] for _, frame in writer.frames[:2]]
+    assert audio == [AUDIO * 3, AUDIO]
+    stats = queue.stats()
+    assert stats["sent_frames"] == 6
+    assert stats["coalesced_frames"] == 2
+
+
+async def test_raise_and_drop_audio_policies():
+    queue = SendQueue(max_bytes=len(AUDIO), policy="raise")
+    await queue.put_audio(AUDIO)
+    with pytest.raises(asyncio.QueueFull):
+        await queue.put_audio(AUDIO)
+
+    queue = SendQueue(max_bytes=len(AUDIO), policy="drop_audio")
+    await queue.put_audio(AUDIO)
+    await queue.put_audio(AUDIO)
+    assert queue.dropped_frames == 1
+    assert len(queue) == 1
+
+
+async def test_writer_failure_fails_flush_and_put():
+    queue = SendQueue(max_bytes=100)
+    await queue.put("response.create", "x" * 60)
+    await queue.put("response.create", "x" * 40)
+    task = queue.start(Writer(fail_after=0))
+    # Blocked: the writer dies before making room for it
+    blocked = asyncio.ensure_future(queue.put("response.create", "x" * 70))
+    with pytest.raises(ConnectionError):
+        await queue.flush(1)
+    with pytest.raises(ConnectionError):
+        await blocked
+    with pytest.raises(ConnectionError):
+        await queue.put("response.create", "x")
+    assert isinstance(queue.error, ConnectionError)
+    assert task.done()
+
+    # A new writer sends what is left
+    writer = Writer()
+    task = queue.start(writer)
+    await queue.flush(1)
+    assert len(writer.frames) == 1
+    task.cancel()
+
+
+async def test_flush_timeout():
+    queue = SendQueue()
+    await queue.put("response.create", "x")
+    with pytest.raises(asyncio.TimeoutError):
+        await queue.flush(0.01)
@@ -0,0 +1,80 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from realtime_client.mock_server import MockRealtimeServer
+from realtime_client.pool import RealtimeClientPool
+
+
+@asynccontextmanager
+async def pool(**pool_kwargs):
+    """A `MockRealtimeServer` and a `RealtimeClientPool` of clients of it."""
+    async with MockRealtimeServer() as server:
+        async with RealtimeClientPool(
+            uri=server.uri, api_key="test", **pool_kwargs
+        ) as clients:
+            yield server, clients
+
+
+async def test_acquire_waits_for_a_free_session():
+    async with pool(max_sessions=2) as (server, clients):
+        first = await clients.acquire()
+        second = await clients.acquire()
+        third = asyncio.create_task(clients.acquire())
+        await asyncio.sleep(0.05)
+        assert not third.done()
+        assert clients.stats()["waiting"] == 1
+
+        await clients.release(first)
+        client = await third
+        assert client is not first and client.is_connected()
+        assert not first.is_connected()
+        stats = clients.stats()
+        assert (stats["sessions"], stats["leased"], stats["waiting"]) == (2, 2, 0)
+        await clients.release(second)
+        await clients.release(client)
+        assert clients.stats()["sessions"] == 0
+
+
+async def test_reused_sessions_are_cleaned_up():
+    async with pool(max_sessions=1) as (server, clients):
+        async with clients.lease(reuse=True) as client:
+            client.on("response.done", lambda event: None)
+            waiter = asyncio.create_task(client.wait_for("response.done"))
+            await asyncio.sleep(0)
+        with pytest.raises(ConnectionError):
+            await waiter
+        assert clients.stats()["idle"] == 1
+
+        async with clients.lease() as again:
+            assert again is client
+            assert not client.router.stats()
+        assert clients.stats()["sessions"] == 0
+
+
+async def test_prewarm_is_capped_by_the_free_capacity():
+    async with pool(max_sessions=3) as (server, clients):
+        leased = await clients.acquire()
+        await clients.prewarm(5)
+        assert len(server.sessions) == 3
+        stats = clients.stats()
+        assert (stats["idle"], stats["leased"]) == (2, 1)
+        # Idle sessions are leased without a new handshake
+        await clients.acquire()
+        assert len(server.sessions) == 3
+        await clients.release(leased)
+
+
+async def test_failed_connections_free_their_slot():
+    async with pool(max_sessions=1) as (server, clients):
+        await server.stop()
+        with pytest.raises(OSError):
+            await clients.acquire()
+        with pytest.raises(OSError):
+            await clients.prewarm(1)
+        assert clients.stats()["sessions"] == 0
+        await server.start()
+        # The slots were released, so the pool still has room
+        async with clients.lease() as client:
+            assert client.is_connected()
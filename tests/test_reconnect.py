@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+
+from realtime_client import RealtimeClient
+from realtime_client.mock_server import MockRealtimeServer
+from realtime_client.models import Item, SessionConfig
+from realtime_client.outbound import SendQueue
+from realtime_client.reconnect import ReconnectPolicy, SessionReplay
+
+
+def test_policy_delays():
+    policy = ReconnectPolicy(
+        max_attempts=5, initial_delay=1, max_delay=4, multiplier=2, jitter=0
+    )
+    assert list(policy.delays()) == [1, 2, 4, 4, 4]
+    jittered = ReconnectPolicy(max_attempts=5, initial_delay=1, max_delay=4, jitter=0.5)
+    for delay, bound in zip(jittered.delays(), [1, 2, 4, 4, 4]):
+        assert bound / 2 <= delay <= bound
+
+
+def test_replay_tracks_the_acknowledged_session():
+    replay = SessionReplay()
+    assert replay.session_config() is None
+    replay.apply(
+        {
+            "type": "session.updated",
+            "session": {
+                "id": "sess_1",
+                "object": "realtime.session",
+                "instructions": "Be brief",
+                "voice": "alloy",
+                "turn_detection": None,
+            },
+        }
+    )
+    assert replay.session_config() == SessionConfig(
+        instructions="Be brief", voice="alloy"
+    )
+
+
+def test_replay_items():
+    replay = SessionReplay()
+    created = {
+        "type": "conversation.item.created",
+        "item": {
+            "id": "item_1",
+            "type": "message",
+            "role": "user",
+            "content": [{"type": "input_audio", "transcript": None}],
+        },
+    }
+    replay.apply(created)
+    replay.apply(
+        {
+            "type": "conversation.item.input_audio_transcription.completed",
+            "item_id": "item_1",
+            "content_index": 0,
+            "transcript": "Hello",
+        }
+    )
+    # The event is shared with handlers, and must not be changed
+    assert created["item"]["content"][0]["transcript"] is None
+    replay.apply(
+        {
+            "type": "response.output_item.done",
+            "item": {
+                "id": "item_2",
+                "type": "function_call",
+                "call_id": "call_1",
+                "name": "lookup",
+                "arguments": "{}",
+            },
+        }
+    )
+    items = replay.replay_items()
+    assert [item.id for item in items] == ["item_1", "item_2"]
+    assert items[0].content[0].text == "Hello"
+    replay.apply({"type": "conversation.item.deleted", "item_id": "item_2"})
+    assert [item.id for item in replay.replay_items()] == ["item_1"]
+
+
+def test_truncated_audio_is_not_replayed():
+    replay = SessionReplay()
+    item = {
+        "id": "item_1",
+        "type": "message",
+        "role": "assistant",
+        "content": [{"type": "audio", "transcript": "Never heard"}],
+    }
+    replay.apply({"type": "conversation.item.created", "item": item})
+    replay.apply(
+        {
+            "type": "conversation.item.truncated",
+            "item_id": "item_1",
+            "content_index": 0,
+            "audio_end_ms": 100,
+        }
+    )
+    assert replay.replay_items() == []
+    # The final item of the response does not bring the transcript back
+    replay.apply({"type": "response.output_item.done", "item": item})
+    assert replay.replay_items() == []
+    assert item["content"][0]["transcript"] == "Never heard"
+
+
+async def test_reconnect_restores_the_session():
+    async with MockRealtimeServer() as server:
+        async with RealtimeClient(
+            uri=server.uri,
+            api_key="test",
+            send_queue=SendQueue(),
+            reconnect=ReconnectPolicy(initial_delay=0.01),
+        ) as client:
+            resumed = asyncio.get_running_loop().create_future()
+            client.on("resumed", resumed.set_result)
+            await (await client.session_update(SessionConfig(instructions="Be brief")))
+            item = Item(
+                type="message",
+                role="user",
+                content=[{"type": "input_text", "text": "Hello"}],
+            )
+            await (await client.conversation_item_create(item))
+            waiter = asyncio.ensure_future(client.wait_for("response.done"))
+            await asyncio.sleep(0)
+
+            for mock_session in list(server.sessions):
+                await mock_session.ws.close()
+            event = await resumed
+            assert event["replayed_items"] == 1
+            (new_session,) = server.sessions
+            await asyncio.sleep(0.05)
+            assert new_session.session["instructions"] == "Be brief"
+            assert len(new_session.items) == 1
+            assert client.writer_task is not None and not client.writer_task.done()
+            assert not waiter.done()
+
+            # The restored client keeps working
+            created = await client.conversation_item_create(item)
+            assert (await created)["type"] == "conversation.item.created"
+            waiter.cancel()
+
+
+async def test_events_sent_while_reconnecting_wait_for_the_writer():
+    async with MockRealtimeServer() as server:
+        queue = SendQueue()
+        async with RealtimeClient(
+            uri=server.uri,
+            api_key="test",
+            send_queue=queue,
+            reconnect=ReconnectPolicy(initial_delay=0.01),
+        ) as client:
+            resumed = asyncio.get_running_loop().create_future()
+            client.on("resumed", resumed.set_result)
+            handles = []
+            restore_session = client._restore_session
+
+            async def restore_and_send() -> int:
+                replayed = await restore_session()
+                # Connected again, but the writer is not restarted yet
+                item = Item(
+                    type="message",
+                    role="user",
+                    content=[{"type": "input_text", "text": "Hello"}],
+                )
+                handles.append(await client.conversation_item_create(item))
+                return replayed
+
+            client._restore_session = restore_and_send
+            for mock_session in list(server.sessions):
+                await mock_session.ws.close()
+            await resumed
+            (handle,) = handles
+            assert (await handle)["type"] == "conversation.item.created"
+            assert queue.error is None
+
+
+async def test_paused_queue_fails_when_reconnecting_gives_up():
+    queue = SendQueue(max_bytes=10)
+    await queue.put("response.create", "x" * 10)
+    queue.pause()
+    blocked = asyncio.ensure_future(queue.put("response.create", "x"))
+    flushed = asyncio.ensure_future(queue.flush())
+    await asyncio.sleep(0.01)
+    assert not blocked.done() and not flushed.done()
+    queue.fail(ConnectionError("Websocket connection closed"))
+    with pytest.raises(ConnectionError):
+        await blocked
+    with pytest.raises(ConnectionError):
+        await flushed
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from realtime_client.audio import Resampler
+
+RATES = [
+    (24000, 8000),
+    (8000, 24000),
+    (48000, 24000),
+    (44100, 24000),
+    (24000, 44100),
+    (16000, 24000),
+]
+
+
+def sine(hz: float, rate: int, seconds: float = 1.0) -> np.ndarray:
+    return 16384 * np.sin(2 * np.pi * hz * np.arange(int(rate * seconds)) / rate)
+
+
+def rms(samples: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+
+
+@pytest.mark.parametrize("input_rate, output_rate", RATES)
+def test_chunked_output_matches_the_whole_stream(input_rate, output_rate):
+    samples = sine(440, input_rate)
+    whole = Resampler(input_rate, output_rate).process_array(samples)
+    resampler = Resampler(input_rate, output_rate)
+    chunks = [
+        resampler.process_array(samples[i : i + 137])
+        for i in range(0, len(samples), 137)
+    ]
+    # One second of input gives one second of output
+    assert len(whole) == output_rate
+    assert np.array_equal(np.concatenate(chunks), whole)
+
+
+@pytest.mark.parametrize("input_rate, output_rate", RATES)
+def test_tones_below_the_cutoff_keep_their_level_and_pitch(input_rate, output_rate):
+    resampler = Resampler(input_rate, output_rate)
+    output = resampler.process_array(sine(440, input_rate))
+    # Skip the filter delay
+    output = output[resampler.taps_per_phase * output_rate // input_rate :]
+    assert rms(output) == pytest.approx(16384 / np.sqrt(2), rel=1e-3)
+    spectrum = np.abs(np.fft.rfft(output, output_rate))
+    assert np.argmax(spectrum) == 440
+
+
+@pytest.mark.parametrize(
+    "input_rate, output_rate",
+    [rates for rates in RATES if rates[0] > rates[1]],
+)
+def test_tones_above_the_output_nyquist_frequency_are_removed(input_rate, output_rate):
+    resampler = Resampler(input_rate, output_rate)
+    output = resampler.process_array(sine(0.75 * output_rate, input_rate))
+    output = output[resampler.taps_per_phase * output_rate // input_rate :]
+    assert 20 * np.log10(rms(output) / (16384 / np.sqrt(2))) < -80
+
+
+def test_pcm16_is_rounded_and_clipped():
+    samples = np.full(800, 32767, dtype="<i2")
+    expected = Resampler(8000, 16000).process_array(samples)
+    # The filter rings above full scale at the step, which must not wrap around
+    assert expected.max() > 32767.5
+    output = Resampler(8000, 16000).process(samples.tobytes())
+    assert output == np.clip(np.rint(expected), -32768, 32767).astype("<i2").tobytes()
+
+
+def test_reset_forgets_the_history():
+    resampler = Resampler(24000, 16000)
+    first = resampler.process_array(sine(440, 24000, 0.1))
+    resampler.process_array(sine(1000, 24000, 0.1))
+    resampler.reset()
+    assert np.array_equal(resampler.process_array(sine(440, 24000, 0.1)), first)
+
+
+def test_equal_rates_pass_through():
+    resampler = Resampler(24000, 24000)
+    assert resampler.passthrough
+    assert resampler.process(b"\x01\x02\x03\x04") == b"\x01\x02\x03\x04"
+
+
+@pytest.mark.parametrize("input_rate, output_rate", [(0, 24000), (24000, -1)])
+def test_rates_must_be_positive(input_rate, output_rate):
+    with pytest.raises(ValueError):
+        Resampler(input_rate, output_rate)
@@ -0,0 +1,67 @@
+import base64
+
+import pytest
+
+from realtime_client.audio.ring_buffer import PCMRingBuffer
+
+
+def test_reads_wrap_around():
+    buffer = PCMRingBuffer(8)
+    buffer.write(b"abcdef")
+    out = bytearray(4)
+    assert buffer.read_into(out) == 4 and out == b"abcd"
+    buffer.write(b"ghij")
+    first, second = buffer.peek()
+    assert (bytes(first), bytes(second)) == (b"efgh", b"ij")
+    assert buffer.advance(6) == 6
+    assert len(buffer) == 0
+    assert buffer.write_position == buffer.bytes_read == 10
+
+
+def test_overruns_keep_the_newest_audio():
+    buffer = PCMRingBuffer(8)
+    buffer.write(b"abcdef")
+    buffer.write(b"ghij")
+    assert (buffer.overruns, buffer.overrun_bytes) == (1, 2)
+    out = bytearray(8)
+    buffer.read_into(out)
+    assert out == b"cdefghij"
+    buffer.write(b"0123456789")
+    buffer.read_into(out)
+    assert out == b"23456789"
+
+
+def test_underruns_are_padded_with_silence():
+    buffer = PCMRingBuffer(8)
+    buffer.write_base64(base64.b64encode(b"ab"))
+    out = bytearray(b"xxxxxx")
+    assert buffer.read_into(out, fill=True) == 2
+    assert out == b"ab\0\0\0\0"
+    assert buffer.underruns == 1
+
+
+def test_partial_samples_wait_for_the_next_write():
+    buffer = PCMRingBuffer(8)
+    assert buffer.write(b"abc") == 3
+    assert len(buffer) == buffer.bytes_written == 2
+    buffer.write(b"d")
+    buffer.write(b"efg")
+    assert bytes(buffer.peek()[0]) == b"abcdef"
+    # A flush also drops the partial sample
+    assert buffer.clear() == 6
+    buffer.write(b"hi")
+    assert bytes(buffer.peek()[0]) == b"hi"
+
+
+def test_only_stored_bytes_are_counted():
+    buffer = PCMRingBuffer(8)
+    buffer.write(b"0123456789")
+    assert buffer.bytes_written == buffer.write_position == 8
+    buffer.write(b"ab")
+    assert buffer.bytes_written == 10
+    assert (buffer.overruns, buffer.overrun_bytes) == (1, 2)
+
+
+def test_capacity_must_hold_a_sample():
+    with pytest.raises(ValueError):
+        PCMRingBuffer(1)
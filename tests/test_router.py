@@ -0,0 +1,139 @@
+import asyncio
+import threading
+
+import pytest
+
+from realtime_client.events.registry import decode_server_event
+from realtime_client.router import EventRouter
+from realtime_client.utils.logger import get_logger
+
+COMMITTED = {
+    "type": "input_audio_buffer.committed",
+    "event_id": "event_1",
+    "previous_item_id": None,
+    "item_id": "item_1",
+}
+
+
+@pytest.fixture
+def router():
+    return EventRouter(get_logger(), decoder=decode_server_event)
+
+
+async def test_inline_handlers_run_in_registration_order(router):
+    calls = []
+
+    async def first(event):
+        calls.append(("first", event["item_id"]))
+
+    router.subscribe("input_audio_buffer.committed", first)
+    router.subscribe(
+        "input_audio_buffer.committed", lambda event, tag: calls.append((tag, 1)), "2nd"
+    )
+    await router.dispatch("input_audio_buffer.committed", COMMITTED)
+    assert calls == [("first", "item_1"), ("2nd", 1)]
+
+
+async def test_inline_handler_errors_propagate(router):
+    def fail(event):
+        raise RuntimeError("boom")
+
+    router.subscribe("input_audio_buffer.committed", fail)
+    with pytest.raises(RuntimeError):
+        await router.dispatch("input_audio_buffer.committed", COMMITTED)
+
+
+async def test_queued_handlers_do_not_block_dispatch(router):
+    release = asyncio.Event()
+    seen = []
+
+    async def slow(event):
+        await release.wait()
+        seen.append(event)
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    subscription = router.subscribe("input_audio_buffer.committed", slow, mode="task")
+    failing = router.subscribe("input_audio_buffer.committed", fail, mode="task")
+    for _ in range(3):
+        await router.dispatch("input_audio_buffer.committed", COMMITTED)
+    assert seen == []
+    release.set()
+    await subscription.queue.join()
+    await failing.queue.join()
+    assert len(seen) == 3
+    assert failing.stats()["errors"] == 3
+    router.clear()
+
+
+async def test_thread_handlers_run_in_the_pool(router):
+    threads = []
+    subscription = router.subscribe(
+        "input_audio_buffer.committed",
+        lambda event: threads.append(threading.current_thread().name),
+        mode="thread",
+    )
+    await router.dispatch("input_audio_buffer.committed", COMMITTED)
+    await subscription.queue.join()
+    assert threads[0].startswith("realtime-handler")
+    router.clear()
+
+
+@pytest.mark.parametrize(
+    "overflow, expected", [("drop_oldest", [2, 3]), ("drop_newest", [0, 1])]
+)
+async def test_queue_overflow(router, overflow, expected):
+    seen = []
+    subscription = router.subscribe(
+        "input_audio_buffer.committed",
+        lambda event: seen.append(event["n"]),
+        mode="task",
+        queue_size=2,
+        overflow=overflow,
+    )
+    for n in range(4):
+        await router.dispatch("input_audio_buffer.committed", {**COMMITTED, "n": n})
+    await subscription.queue.join()
+    assert seen == expected
+    assert subscription.stats()["dropped"] == 2
+    router.clear()
+
+
+async def test_typed_handlers_share_one_decoded_event(router):
+    seen = []
+    router.subscribe("input_audio_buffer.committed", seen.append, typed=True)
+    router.subscribe("input_audio_buffer.committed", seen.append, typed=True)
+    await router.dispatch("input_audio_buffer.committed", COMMITTED)
+    assert seen[0] is seen[1]
+    assert seen[0].item_id == "item_1"
+    assert seen[0].previous_item_id is None
+
+
+async def test_decode_failure_is_contained(router):
+    raw, typed = [], []
+    typed_subscription = router.subscribe(
+        "input_audio_buffer.committed", typed.append, typed=True, mode="task"
+    )
+    router.subscribe("input_audio_buffer.committed", raw.append)
+    await router.dispatch(
+        "input_audio_buffer.committed", {"type": "input_audio_buffer.committed"}
+    )
+    assert raw and not typed
+    assert typed_subscription.stats()["errors"] == 1
+
+
+def test_typed_requires_a_decoder():
+    with pytest.raises(ValueError):
+        EventRouter(get_logger()).subscribe("error", print, typed=True)
+
+
+async def test_unsubscribe(router):
+    seen = []
+    subscription = router.subscribe("input_audio_buffer.committed", seen.append)
+    router.subscribe("input_audio_buffer.committed", print)
+    router.unsubscribe("input_audio_buffer.committed", subscription)
+    router.unsubscribe("input_audio_buffer.committed", print)
+    assert not router.has_subscribers("input_audio_buffer.committed")
+    await router.dispatch("input_audio_buffer.committed", COMMITTED)
+    assert seen == []
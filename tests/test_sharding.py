@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from realtime_client.mock_server import MockRealtimeServer, ResponseScript
+from realtime_client.sharding import ShardSupervisor
+
+SCRIPT = ResponseScript(text="Hello", audio_ms=80)
+
+
+async def test_sessions_are_spread_over_workers_and_results_collected():
+    async with MockRealtimeServer(script=SCRIPT) as server:
+        async with ShardSupervisor(workers=2, uri=server.uri, api_key="test") as shards:
+            sessions = [await shards.open_session() for _ in range(2)]
+            assert sorted(session.worker for session in sessions) == [0, 1]
+
+            deltas = []
+            sessions[0].on(
+                "response.audio.delta", lambda event: deltas.append(event["delta"])
+            )
+            for session in sessions:
+                done = asyncio.create_task(session.wait_for("response.done", 5))
+                # Let the worker forward response.done before the response starts
+                await asyncio.sleep(0)
+                created = await session.call("response_create")
+                assert created["type"] == "response.created"
+                assert (await done)["response"]["status"] == "completed"
+            assert len(deltas) == 2
+
+            with pytest.raises(AttributeError):
+                await sessions[1].call("_reconnect")
+            assert [worker["sessions"] for worker in shards.stats()] == [1, 1]
+            assert len(server.sessions) == 2
+
+
+async def test_calls_fail_and_sessions_reopen_when_a_worker_dies():
+    async with MockRealtimeServer(script=SCRIPT) as server:
+        async with ShardSupervisor(
+            workers=2, heartbeat_interval=0.05, uri=server.uri, api_key="test"
+        ) as shards:
+            session = await shards.open_session()
+            respawned = asyncio.Event()
+            session.on("respawned", lambda event: respawned.set())
+            waiter = asyncio.create_task(session.wait_for("response.done"))
+            call = asyncio.create_task(session.call("wait_for", "response.done"))
+            await asyncio.sleep(0.1)
+
+            shards.workers[session.worker].process.kill()
+            for pending in (waiter, call):
+                with pytest.raises(ConnectionError, match="died"):
+                    await pending
+            await respawned.wait()
+            assert shards.stats()[session.worker]["restarts"] == 1
+
+            # The session runs on as a new server session on the replacement
+            done = asyncio.create_task(session.wait_for("response.done", 5))
+            await asyncio.sleep(0)
+            await session.call("response_create")
+            assert (await done)["response"]["status"] == "completed"
@@ -0,0 +1,134 @@
+import asyncio
+import base64
+
+import pytest
+
+from realtime_client import RealtimeAPIError, RealtimeClient
+from realtime_client.mock_server import MockRealtimeServer, ResponseScript
+from realtime_client.models import ResponseConfig, SessionConfig
+from realtime_client.outbound import SendQueue
+from realtime_client.streaming import ResponseChunk, ResponseStream
+
+TEXT = ResponseConfig(modalities=["text"])
+SCRIPT = ResponseScript(text="x" * 300, text_chunk_chars=1, audio_ms=0)
+
+
+def chunk(data: str) -> ResponseChunk:
+    return ResponseChunk("text", data, "item_1", 0, 0)
+
+
+async def test_slow_consumer_receives_every_chunk(session):
+    async with session(SCRIPT) as (_, client):
+        stream = client.stream_response(TEXT)
+        text = []
+        async for item in stream:
+            await asyncio.sleep(0.001)
+            text.append(item.data)
+        assert "".join(text) == SCRIPT.text
+        assert stream.dropped == 0
+        assert stream.response["status"] == "completed"
+        assert len(client.streams) == 0
+
+
+async def test_audio_chunks_are_decoded(session):
+    script = ResponseScript(audio_ms=200, audio_chunk_ms=40)
+    async with session(script) as (_, client):
+        audio = [
+            item.data
+            async for item in client.stream_response()
+            if item.chunk_type == "audio"
+        ]
+    assert len(audio) == 5
+    assert all(isinstance(data, bytes) and len(data) == 1920 for data in audio)
+
+
+@pytest.mark.parametrize("overflow", ["drop_oldest", "drop_newest"])
+async def test_bounded_stream_marks_gaps(session, overflow):
+    async with session(SCRIPT) as (_, client):
+        stream = client.stream_response(TEXT, max_chunks=10, overflow=overflow)
+        chunks = []
+        async for item in stream:
+            if not chunks:
+                # Fall behind until the whole response is queued
+                await client.wait_for("response.done", timeout=5)
+            chunks.append(item)
+    gaps = [item for item in chunks if item.chunk_type == "gap"]
+    assert len(gaps) == 1
+    assert gaps[0].dropped == stream.dropped > 0
+    text = [item.data for item in chunks if item.chunk_type != "gap"]
+    assert len("".join(text)) + stream.dropped == len(SCRIPT.text)
+    if overflow == "drop_newest":
+        assert chunks[-1] is gaps[0]
+    else:
+        assert chunks[1] is gaps[0]
+
+
+async def test_gap_chunks_do_not_count_towards_max_chunks():
+    stream = ResponseStream(client=None, max_chunks=2, overflow="drop_oldest")
+    for data in "abcde":
+        stream.push(chunk(data))
+    assert [(item.chunk_type, item.data, item.dropped) for item in stream._chunks] == [
+        ("gap", "", 3),
+        ("text", "d", 0),
+        ("text", "e", 0),
+    ]
+
+
+async def test_stream_binds_to_its_own_response(session):
+    async with session(SCRIPT) as (_, client):
+        # A response requested without a stream is in progress
+        done = asyncio.ensure_future(client.wait_for("response.done", timeout=5))
+        await asyncio.sleep(0)
+        other = await client.response_create(TEXT)
+        stream = client.stream_response(TEXT)
+        # The mock server rejects the second response instead of creating it
+        with pytest.raises(RealtimeAPIError):
+            async for _ in stream:
+                pass
+        assert stream.response_id is None
+        assert (await other)["response"]["id"]
+        await done
+
+        chunks = [item async for item in client.stream_response(TEXT)]
+        assert len(chunks) == len(SCRIPT.text)
+
+
+async def test_stream_ignores_server_vad_responses(session):
+    async with session(SCRIPT, send_queue=SendQueue()) as (_, client):
+        turn_detection = {"type": "server_vad"}
+        await (
+            await client.session_update(SessionConfig(turn_detection=turn_detection))
+        )
+        # The server detects a turn and starts its own response before it sees the
+        # stream's response.create, which it rejects
+        await client.input_audio_buffer_append(base64.b64encode(bytes(4800)).decode())
+        stream = client.stream_response(TEXT)
+        chunks = []
+        with pytest.raises(RealtimeAPIError, match="already in progress"):
+            async for item in stream:
+                chunks.append(item)
+        assert chunks == []
+        assert stream.response_id is None
+        await client.wait_for("response.done", timeout=5)
+
+        # Once the server's response is done, a stream gets a response of its own
+        stream = client.stream_response(TEXT)
+        text = "".join([item.data async for item in stream])
+        assert text == SCRIPT.text
+        assert stream.response["status"] == "completed"
+
+
+async def test_closed_connection_fails_stream():
+    script = ResponseScript(text="x" * 300, text_chunk_chars=1, deltas_per_second=100)
+    async with MockRealtimeServer(script=script) as server:
+        # Not closed with `async with`, since the server drops the connection
+        client = RealtimeClient(uri=server.uri, api_key="test")
+        await client.connect()
+        client.listener_task = asyncio.create_task(client.listener())
+        stream = client.stream_response(TEXT)
+        await stream.__anext__()
+        for mock_session in list(server.sessions):
+            await mock_session.ws.close()
+        with pytest.raises(ConnectionError):
+            async for _ in stream:
+                pass
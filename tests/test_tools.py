@@ -0,0 +1,184 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from realtime_client.mock_server import ResponseScript
+from realtime_client.models import ResponseConfig
+from realtime_client.speculation import IncrementalJSONParser
+
+TEXT = ResponseConfig(modalities=["text"])
+PARAMETERS = {
+    "type": "object",
+    "properties": {"city": {"type": "string"}, "reason": {"type": "string"}},
+}
+
+
+def feed_by_char(parser: IncrementalJSONParser, text: str) -> list[str]:
+    completed = []
+    for char in text:
+        completed.extend(parser.feed(char))
+    return completed
+
+
+def test_parser_decodes_fields_as_they_complete():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"city": "Par') == []
+    assert parser.feed('is", "days": 3') == ["city"]
+    assert parser.fields == {"city": "Paris"}
+    assert parser.feed(', "tags": ["a", {"b": "}"}], "ok": true}') == [
+        "days",
+        "tags",
+        "ok",
+    ]
+    assert parser.complete
+    assert parser.fields == json.loads(parser.text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": "quote \\" and brace }", "b": -1.5e3, "c": null}',
+        '{ "nested" : { "deep" : [ 1 , [ 2 ] ] } , "empty" : "" }',
+        "{}",
+    ],
+)
+def test_parser_matches_json_loads(text):
+    parser = IncrementalJSONParser()
+    completed = feed_by_char(parser, text)
+    assert parser.complete
+    assert parser.fields == json.loads(text)
+    assert completed == list(json.loads(text))
+
+
+def test_parser_gives_up_on_non_objects():
+    parser = IncrementalJSONParser()
+    parser.feed("[1, 2]")
+    assert parser.failed
+    assert parser.feed("{}") == []
+
+
+async def test_calls_run_concurrently_and_outputs_are_sent(session):
+    script = ResponseScript(
+        audio_ms=0,
+        function_calls=[("wait", {"delay": 0.2}), ("wait", {"delay": 0.2})],
+    )
+    async with session(script) as (server, client):
+
+        @client.tools.register
+        async def wait(delay: float) -> dict:
+            await asyncio.sleep(delay)
+            return {"slept": delay}
+
+        start = time.perf_counter()
+        await client.response_create(TEXT)
+        # The outputs are followed by a new response, a message this time
+        await client.wait_for(
+            "response.done",
+            timeout=5,
+            predicate=lambda event: event["response"]["output"][0]["type"] == "message",
+        )
+        elapsed = time.perf_counter() - start
+        (mock_session,) = server.sessions
+        assert elapsed < 0.39
+        assert mock_session.last_item_type == "message"
+        assert client.tools.stats()[0]["calls"] == 2
+
+
+async def test_failing_and_unknown_tools_produce_error_outputs(session):
+    script = ResponseScript(
+        audio_ms=0, function_calls=[("broken", {}), ("missing", {})]
+    )
+    async with session(script) as (_, client):
+        outputs = []
+
+        def collect(event):
+            if event["item"]["type"] == "function_call_output":
+                outputs.append(json.loads(event["item"]["output"]))
+
+        client.on("conversation.item.created", collect)
+
+        @client.tools.register
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        await client.response_create(TEXT)
+        await client.wait_for(
+            "response.done",
+            timeout=5,
+            predicate=lambda event: event["response"]["output"][0]["type"] == "message",
+        )
+        assert client.tools.stats()[0]["errors"] == 1
+    assert outputs == [{"error": "boom"}, {"error": "Unknown tool: missing"}]
+
+
+async def test_idempotent_tools_start_before_their_arguments_are_done(session):
+    script = ResponseScript(
+        audio_ms=0,
+        deltas_per_second=200,
+        function_calls=[("weather", {"city": "Paris", "reason": "x" * 200})],
+    )
+    async with session(script) as (_, client):
+        started = []
+
+        @client.tools.register(
+            parameters=PARAMETERS, idempotent=True, speculate_on=["city"]
+        )
+        async def weather(city: str, reason: str = "") -> dict:
+            started.append(reason)
+            return {"city": city}
+
+        await client.response_create(TEXT)
+        await client.wait_for(
+            "response.done",
+            timeout=5,
+            predicate=lambda event: event["response"]["output"][0]["type"] == "message",
+        )
+        stats = client.tools.speculation_stats()
+    assert started == [""]
+    assert stats["hits"] == 1
+    assert stats["wasted"] == 0
+
+
+def test_parser_is_linear_in_the_text_length():
+    text = json.dumps({"city": "Paris", "notes": "x" * 1_000_000, "days": 3})
+    parser = IncrementalJSONParser()
+    start = time.perf_counter()
+    completed = []
+    for i in range(0, len(text), 4):
+        completed.extend(parser.feed(text[i : i + 4]))
+    elapsed = time.perf_counter() - start
+    assert completed == ["city", "notes", "days"]
+    assert parser.fields == json.loads(text)
+    # Concatenating the fragments would copy about 125 GB
+    assert elapsed < 5
+
+
+@pytest.mark.parametrize("is_async", [True, False])
+async def test_timeouts_raised_by_a_tool_are_errors(session, is_async):
+    async with session() as (_, client):
+        if is_async:
+
+            async def lookup() -> None:
+                raise asyncio.TimeoutError("Upstream timed out")
+
+        else:
+
+            def lookup() -> None:
+                raise TimeoutError("Upstream timed out")
+
+        @client.tools.register(timeout=0.05)
+        async def slow() -> None:
+            await asyncio.sleep(1)
+
+        client.tools.register(lookup)
+        assert json.loads(await client.tools.execute("lookup", "{}")) == {
+            "error": "Upstream timed out"
+        }
+        assert json.loads(await client.tools.execute("slow", "{}")) == {
+            "error": "Timed out after 0.05s"
+        }
+        stats = {tool["name"]: tool for tool in client.tools.stats()}
+    assert (stats["lookup"]["errors"], stats["lookup"]["timeouts"]) == (1, 0)
+    assert (stats["slow"]["errors"], stats["slow"]["timeouts"]) == (0, 1)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from realtime_client.audio import VoiceActivityDetector
+
+RATE = 24000
+FRAME_BYTES = 20 * RATE // 1000 * 2
+
+
+def silence(ms: int) -> bytes:
+    return bytes(ms * RATE // 1000 * 2)
+
+
+def tone(ms: int, hz: float = 300, dbfs: float = -20) -> bytes:
+    t = np.arange(ms * RATE // 1000) / RATE
+    amplitude = 32767 * 10 ** (dbfs / 20) * np.sqrt(2)
+    return (amplitude * np.sin(2 * np.pi * hz * t)).astype("<i2").tobytes()
+
+
+def noise(ms: int, dbfs: float = -10) -> bytes:
+    samples = np.random.default_rng(0).normal(size=ms * RATE // 1000)
+    return (
+        (32767 * 10 ** (dbfs / 20) * samples)
+        .clip(-32768, 32767)
+        .astype("<i2")
+        .tobytes()
+    )
+
+
+def test_speech_is_passed_through_with_padding_and_hangover():
+    vad = VoiceActivityDetector(sample_rate=RATE)
+    audio = silence(1000) + tone(1000) + silence(1000)
+    output, events = vad.process(audio)
+    assert events == ["speech_started", "speech_stopped"]
+    # 300 ms of padding and 60 ms to detect the start, the rest of the tone, 500 ms of
+    # hangover
+    assert len(output) == (18 + 47 + 25) * FRAME_BYTES
+    assert output[: 15 * FRAME_BYTES] == silence(300)
+    assert output[15 * FRAME_BYTES : 65 * FRAME_BYTES] == tone(1000)
+    assert not vad.is_speech
+    assert (vad.frames, vad.speech_frames) == (150, 50)
+    assert (vad.bytes_in, vad.bytes_out) == (len(audio), len(output))
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 480, 4801])
+def test_output_does_not_depend_on_the_chunk_size(chunk):
+    audio = silence(500) + tone(300) + silence(800) + tone(200)
+    whole = VoiceActivityDetector(sample_rate=RATE).process(audio)
+    vad = VoiceActivityDetector(sample_rate=RATE)
+    output, events = bytearray(), []
+    for i in range(0, len(audio), chunk):
+        data, new_events = vad.process(audio[i : i + chunk])
+        output += data
+        events += new_events
+    assert (bytes(output), events) == whole
+
+
+@pytest.mark.parametrize(
+    "audio",
+    [silence(1000), tone(1000, dbfs=-60), noise(1000), tone(40) + silence(500)],
+    ids=["silence", "quiet", "noise", "blip"],
+)
+def test_non_speech_is_dropped(audio):
+    vad = VoiceActivityDetector(sample_rate=RATE)
+    assert vad.process(audio) == (b"", [])
+    assert vad.bytes_out == 0
+
+
+def test_flush_ends_speech_in_progress():
+    vad = VoiceActivityDetector(sample_rate=RATE, prefix_padding_ms=0)
+    output, events = vad.process(tone(105))
+    assert events == ["speech_started"]
+    assert len(output) == 5 * FRAME_BYTES
+    # The last 5 ms do not fill a frame
+    assert vad.flush() == (tone(105)[len(output) :], ["speech_stopped"])
+    assert vad.flush() == (b"", [])
+    assert vad.process(silence(100)) == (b"", [])
+
+
+def test_frames_must_hold_two_samples():
+    with pytest.raises(ValueError):
+        VoiceActivityDetector(sample_rate=8000, frame_ms=0)
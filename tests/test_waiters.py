@@ -0,0 +1,48 @@
+import pytest
+
+from realtime_client.waiters import WaiterRegistry
+
+
+async def test_resolve_only_matching_waiters():
+    waiters = WaiterRegistry()
+    any_done = waiters.add("response.done")
+    mine = waiters.add("response.done", lambda event: event["id"] == "resp_2")
+    other = waiters.add("response.created")
+    assert waiters.resolve("response.done", {"id": "resp_1"}) == 1
+    assert any_done.result() == {"id": "resp_1"}
+    assert not mine.done()
+    assert waiters.resolve("response.done", {"id": "resp_2"}) == 1
+    assert mine.result() == {"id": "resp_2"}
+    assert not other.done()
+    assert len(waiters) == 1
+
+
+async def test_predicate_errors_fail_the_waiter():
+    waiters = WaiterRegistry()
+    future = waiters.add("response.done", lambda event: event["missing"])
+    waiters.resolve("response.done", {})
+    with pytest.raises(KeyError):
+        future.result()
+    assert not waiters.has_waiters("response.done")
+
+
+async def test_discard_and_cancelled_waiters():
+    waiters = WaiterRegistry()
+    discarded = waiters.add("response.done")
+    cancelled = waiters.add("response.done")
+    waiters.discard("response.done", discarded)
+    cancelled.cancel()
+    assert waiters.resolve("response.done", {}) == 0
+    assert len(waiters) == 0
+
+
+async def test_clear_fails_or_cancels():
+    waiters = WaiterRegistry()
+    failed = waiters.add("response.done")
+    waiters.clear(ConnectionError("closed"))
+    with pytest.raises(ConnectionError):
+        failed.result()
+    cancelled = waiters.add("response.done")
+    waiters.clear()
+    assert cancelled.cancelled()
+    assert len(waiters) == 0